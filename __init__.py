@@ -1,2 +0,0 @@
-# Re-export everything from the src package
-from src import *  # noqa: F403, F401
@@ -11,29 +11,82 @@ Requirements:
 """
 
 import asyncio
+import functools
 import logging
+import logging.handlers
+import sys
 
 # Import both sync and async repositories
-import boto3
-
 from generic_repo import AsyncGenericRepository, GenericRepository
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Configure logging. Records are buffered and written in bulk instead of being
+# flushed one by one; warnings and errors flush the buffer right away, and
+# whatever is left is flushed by logging's own shutdown hook at exit.
+_log_stream_handler = logging.StreamHandler()
+_log_stream_handler.setFormatter(logging.Formatter('%(levelname)s:%(name)s:%(message)s'))
+logging.getLogger().addHandler(
+    logging.handlers.MemoryHandler(capacity=1024, flushLevel=logging.WARNING, target=_log_stream_handler)
+)
+logging.getLogger().setLevel(logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Poll table status every 2 seconds (the waiter default is 20) so setup finishes
+# as soon as the table becomes ACTIVE; 60 attempts still allows two minutes.
+TABLE_WAITER_CONFIG = {'Delay': 2, 'MaxAttempts': 60}
+
+
+@functools.lru_cache(maxsize=1)
+def _session():
+    """
+    Return the boto3 session shared by table setup and the sync repositories.
+
+    Credentials and the service model are resolved once per session, so passing this
+    session to every GenericRepository avoids repeating that work for each repository.
+    """
+    import boto3
+
+    return boto3.Session(region_name='us-east-1')
+
+
+@functools.lru_cache(maxsize=1)
+def _async_session():
+    """Return the aioboto3 session shared by the async repositories."""
+    import aioboto3
+
+    return aioboto3.Session(region_name='us-east-1')
+
+
+@functools.lru_cache(maxsize=1)
+def _resource():
+    """
+    Return a DynamoDB resource shared by all example helpers.
+
+    Creating the resource once avoids re-loading the service model and keeps one warm
+    connection pool. max_pool_connections should be at least the number of requests
+    you expect to have in flight at the same time, otherwise calls queue for a connection.
 
-def create_sample_table(table_name: str = 'sample-generic-repo-table'):
+    It uses the same DEFAULT_BOTO_CONFIG (adaptive retries, keep-alive pool) that the
+    repositories apply to their own clients. A client's config cannot be changed after
+    it is created, so pass boto_config=Config(...) to GenericRepository or
+    AsyncGenericRepository to tune it instead.
+    """
+    from generic_repo.sync_repo import DEFAULT_BOTO_CONFIG
+
+    return _session().resource('dynamodb', config=DEFAULT_BOTO_CONFIG)
+
+
+def create_sample_table(table_name: str = 'sample-generic-repo-table', wait: bool = True):
     """
     Create a sample DynamoDB table for testing.
 
     Args:
         table_name: Name of the table to create
+        wait: If True, block until the table is ACTIVE
 
     Returns:
         The created table resource
     """
-    dynamodb = boto3.resource('dynamodb', region_name='us-east-1')
+    dynamodb = _resource()
 
     try:
         # Create table
@@ -89,28 +142,30 @@ def create_sample_table(table_name: str = 'sample-generic-repo-table'):
         )
 
         # Wait for table to be created
-        logger.info(f'Creating table {table_name}...')
-        table.meta.client.get_waiter('table_exists').wait(TableName=table_name)
-        logger.info(f'Table {table_name} created successfully!')
+        logger.info('Creating table %s...', table_name)
+        if wait:
+            table.meta.client.get_waiter('table_exists').wait(TableName=table_name, WaiterConfig=TABLE_WAITER_CONFIG)
+            logger.info('Table %s created successfully!', table_name)
 
         return table
 
     except dynamodb.meta.client.exceptions.ResourceInUseException:
-        logger.info(f'Table {table_name} already exists')
+        logger.info('Table %s already exists', table_name)
         return dynamodb.Table(table_name)
 
 
-def create_composite_key_table(table_name: str = 'my-composite-table'):
+def create_composite_key_table(table_name: str = 'my-composite-table', wait: bool = True):
     """
     Create a sample DynamoDB table with composite key (partition + sort key) for testing.
 
     Args:
         table_name: Name of the table to create
+        wait: If True, block until the table is ACTIVE
 
     Returns:
         The created table resource
     """
-    dynamodb = boto3.resource('dynamodb', region_name='us-east-1')
+    dynamodb = _resource()
 
     try:
         # Create table with composite key
@@ -140,72 +195,70 @@ def create_composite_key_table(table_name: str = 'my-composite-table'):
         )
 
         # Wait for table to be created
-        logger.info(f'Creating composite key table {table_name}...')
-        table.meta.client.get_waiter('table_exists').wait(TableName=table_name)
-        logger.info(f'Composite key table {table_name} created successfully!')
+        logger.info('Creating composite key table %s...', table_name)
+        if wait:
+            table.meta.client.get_waiter('table_exists').wait(TableName=table_name, WaiterConfig=TABLE_WAITER_CONFIG)
+            logger.info('Composite key table %s created successfully!', table_name)
 
         return table
 
     except dynamodb.meta.client.exceptions.ResourceInUseException:
-        logger.info(f'Composite key table {table_name} already exists')
+        logger.info('Composite key table %s already exists', table_name)
         return dynamodb.Table(table_name)
 
 
 def setup_tables():
-    """Create all necessary tables for the examples."""
+    """
+    Create all necessary tables for the examples, once.
+
+    Returns:
+        Tuple of (simple_table, composite_table) table resources
+    """
     print('=== Setting up tables ===')
 
-    # Create main table for sync/async examples
-    create_sample_table('my-table')
+    # Start creating the main table (sync/async examples) and the composite key
+    # table, then wait for both - they are independent, so the waits overlap
+    simple_table = create_sample_table('my-table', wait=False)
+    composite_table = create_composite_key_table('my-composite-table', wait=False)
 
-    # Create composite key table
-    create_composite_key_table('my-composite-table')
+    waiter = _resource().meta.client.get_waiter('table_exists')
+    for table in (simple_table, composite_table):
+        waiter.wait(TableName=table.table_name, WaiterConfig=TABLE_WAITER_CONFIG)
 
     print('All tables are ready!')
     print()
+    return simple_table, composite_table
 
 
-def sync_example():
+def sync_example(repo: GenericRepository):
     """Example using the synchronous GenericRepository."""
     print('=== Synchronous Repository Example ===')
 
-    # Initialize the repository - no need to create boto3 resources!
-    repo = GenericRepository(
-        table_name='my-table',
-        primary_key_name='id',
-        region_name='us-east-1',  # Optional: specify region
-        logger=logger,
-        data_expiration_days=30,
-        debug_mode=False,  # Set to False for actual DynamoDB operations
-    )
-
     # Basic operations
     try:
-        # Save an item
-        item_data = {'name': 'John Doe', 'email': 'john@example.com', 'age': 30, 'metadata': {'created_by': 'system'}}
-        saved_item = repo.save('user-123', item_data)
-        print(f'Saved item: {saved_item}')
-
-        # Load an item
-        loaded_item = repo.load('user-123')
-        print(f'Loaded item: {loaded_item}')
-
-        # Save multiple items in batch
+        # Write every user with its final attributes in one BatchWriteItem request,
+        # instead of a PutItem per user followed by UpdateItem calls
         batch_items = [
-            {'id': 'user-124', 'name': 'Jane Doe', 'email': 'jane@example.com'},
+            {
+                'id': 'user-123',
+                'name': 'John Doe',
+                'email': 'john@example.com',
+                'age': 30,
+                'metadata': {'created_by': 'system'},
+                'status': 'active',
+                'last_login': '2024-01-01T10:30:00Z',
+            },
+            {'id': 'user-124', 'name': 'Jane Doe', 'email': 'jane@example.com', 'status': 'premium'},
             {'id': 'user-125', 'name': 'Bob Smith', 'email': 'bob@example.com'},
         ]
         repo.save_batch(batch_items)
-        print('Batch save completed')
+        print(f'Batch saved {len(batch_items)} items')
 
-        # Update an existing item (partial update)
-        update_data = {'status': 'active', 'last_login': '2024-01-01T10:30:00Z'}
-        updated_item = repo.update('user-123', update_data)
-        print(f'Updated item: {updated_item}')
+        # Read them back with a single BatchGetItem request instead of one GetItem per user
+        loaded_items = repo.load_batch([{'id': item['id']} for item in batch_items])
+        print(f'Loaded {len(loaded_items)} of {len(batch_items)} items')
 
-        # Update with expiration
-        repo.update('user-124', {'status': 'premium'}, set_expiration=True)
-        print('Updated user-124 with expiration')
+        # Single-item save/update are shown in reserved_keywords_update_example
 
         # Find all items with a specific partition key
         items = repo.find_all('user-123')
@@ -215,26 +268,30 @@ def sync_example():
         filtered_items = repo.find_all('user-123', filters={'age': {'gt': 25}})
         print(f'Found {len(filtered_items)} items for user-123 with age > 25')
 
-        # Count total items
+        # Scan the whole table with parallel segments (faster, but reads in a burst)
+        scanned = sum(1 for _ in repo.load_all_parallel(total_segments=4))
+        print(f'Parallel scan returned {scanned} items')
+
+        # Scan at a bounded read rate so a large scan doesn't starve live traffic
+        scanned = sum(1 for _ in repo.load_all(rate_limit_rcu=200, page_size=100, projection=['id']))
+        print(f'Rate-limited scan returned {scanned} items')
+
+        # Count total items from table metadata instead of scanning them into a list
         count = repo.count()
         print(f'Total items in table: {count}')
 
+        # Count without transferring items: COUNT query for one partition key
+        user_count = repo.count_by_primary_key('user-123')
+        print(f'Items for user-123: {user_count}')
+
     except Exception as e:
         print(f'Error in sync operations: {e}')
 
 
-def sync_filtering_example():
+def sync_filtering_example(repo: GenericRepository):
     """Example demonstrating filtering functionality in sync GenericRepository."""
     print('\n=== Sync Filtering Example ===')
 
-    repo = GenericRepository(
-        table_name='my-table',
-        primary_key_name='id',
-        region_name='us-east-1',
-        logger=logger,
-        debug_mode=False,
-    )
-
     try:
         # First, add some sample data with different attributes for filtering
         sample_data = [
@@ -275,267 +332,246 @@ def sync_filtering_example():
         print('Adding sample data for sync filtering...')
         repo.save_batch(sample_data)
 
-        # Example 1: Simple equality filter
+        # Only show our test data: the id prefix check runs in DynamoDB as part of each
+        # FilterExpression, so other items are never sent back
+        own_items = {'id': {'begins_with': 'sync-filter-'}}
+
+        # Example 1: Simple equality filter. status has a GSI (status-index), so this is a
+        # Query on the index rather than a filtered Scan of the whole table
         print('\n1. Simple equality filter (status = "active"):')
-        count = 0
-        for item in repo.load_all(filters={'status': 'active'}):
-            if 'sync-filter-' in item.get('id', ''):  # Only show our test data
-                count += 1
-                print(f'   {item["name"]} (age: {item["age"]}, score: {item["score"]})')
-        print(f'   Found {count} active users')
+        active_users = repo.find_all_with_index(
+            index_name='status-index', key_name='status', key_value='active', filters=own_items
+        )
+        # Build the output first and print it once, rather than one print call per item
+        lines = [f'   {item["name"]} (age: {item["age"]}, score: {item["score"]})' for item in active_users]
+        lines.append(f'   Found {len(active_users)} active users')
+        print('\n'.join(lines))
 
         # Example 2: Multiple conditions
         print('\n2. Active users older than 25:')
-        count = 0
-        for item in repo.load_all(filters={'status': 'active', 'age': {'gt': 25}}):
-            if 'sync-filter-' in item.get('id', ''):
-                count += 1
-                print(f'   {item["name"]} (age: {item["age"]})')
-        print(f'   Found {count} active users older than 25')
+        active_filters = {'age': {'gt': 25}, **own_items}
+        active_users = repo.find_all_with_index(
+            index_name='status-index', key_name='status', key_value='active', filters=active_filters
+        )
+        lines = [f'   {item["name"]} (age: {item["age"]})' for item in active_users]
+        lines.append(f'   Found {len(active_users)} active users older than 25')
+        print('\n'.join(lines))
 
         # Example 3: String operations
         print('\n3. Names containing "Jo":')
-        count = 0
-        for item in repo.load_all(filters={'name': {'contains': 'Jo'}}):
-            if 'sync-filter-' in item.get('id', ''):
-                count += 1
-                print(f'   {item["name"]}')
-        print(f'   Found {count} users with "Jo" in name')
+        lines = [f'   {item["name"]}' for item in repo.load_all(filters={'name': {'contains': 'Jo'}, **own_items})]
+        lines.append(f'   Found {len(lines)} users with "Jo" in name')
+        print('\n'.join(lines))
 
     except Exception as e:
         print(f'Error in sync filtering operations: {e}')
 
 
-async def async_example():
+async def async_example(repo: AsyncGenericRepository):
     """Example using the asynchronous AsyncGenericRepository."""
     print('\n=== Asynchronous Repository Example ===')
 
-    # Initialize the async repository with context manager - no need to create aioboto3 resources!
-    async with AsyncGenericRepository(
-        table_name='my-table',
-        primary_key_name='id',
-        region_name='us-east-1',  # Optional: specify region
-        logger=logger,
-        data_expiration_days=30,
-        debug_mode=False,  # Set to True for debugging
-    ) as repo:
-        try:
-            # Save an item
-            item_data = {
+    try:
+        # Write every user with its final attributes in one BatchWriteItem request,
+        # instead of a PutItem per user followed by UpdateItem calls
+        batch_items = [
+            {
+                'id': 'user-async-123',
                 'name': 'Alice Johnson',
                 'email': 'alice@example.com',
                 'age': 28,
                 'metadata': {'created_by': 'async_system'},
-            }
-            saved_item = await repo.save('user-async-123', item_data)
-            print(f'Async saved item: {saved_item}')
-
-            # Load an item
-            loaded_item = await repo.load('user-async-123')
-            print(f'Async loaded item: {loaded_item}')
-
-            # Save multiple items in batch
-            batch_items = [
-                {'id': 'user-async-124', 'name': 'Charlie Brown', 'email': 'charlie@example.com'},
-                {'id': 'user-async-125', 'name': 'Diana Prince', 'email': 'diana@example.com'},
-            ]
-            await repo.save_batch(batch_items)
-            print('Async batch save completed')
-
-            # Update an existing item (partial update)
-            update_data = {'status': 'active', 'last_login': '2024-01-01T10:30:00Z'}
-            updated_item = await repo.update('user-async-123', update_data)
-            print(f'Async updated item: {updated_item}')
-
-            # Update with expiration
-            await repo.update('user-async-124', {'status': 'premium'}, set_expiration=True)
-            print('Async updated user-async-124 with expiration')
-
-            # Find all items with a specific partition key
-            items = await repo.find_all('user-async-123')
-            print(f'Async found {len(items)} items')
-
-            # Find all items with filtering
-            filtered_items = await repo.find_all('user-async-123', filters={'age': {'gt': 25}})
-            print(f'Async found {len(filtered_items)} items for user-async-123 with age > 25')
-
-            # Load all items using async generator
-            print('Loading all items asynchronously:')
-            count = 0
-            async for item in repo.load_all():
-                count += 1
-                if count <= 3:  # Show first 3 items
-                    print(f'  Item {count}: {item.get("name", "N/A")}')
-                if count >= 10:  # Limit output
-                    break
-            print(f'Total items processed: {count}')
-
-            # Count total items
-            total_count = await repo.count()
-            print(f'Total items in table: {total_count}')
-
-        except Exception as e:
-            print(f'Error in async operations: {e}')
-
-
-async def filtering_example():
+                'status': 'active',
+                'last_login': '2024-01-01T10:30:00Z',
+            },
+            {'id': 'user-async-124', 'name': 'Charlie Brown', 'email': 'charlie@example.com', 'status': 'premium'},
+            {'id': 'user-async-125', 'name': 'Diana Prince', 'email': 'diana@example.com'},
+        ]
+        await repo.save_batch(batch_items)
+        print(f'Async batch saved {len(batch_items)} items')
+
+        # Read them back with a single BatchGetItem request instead of one GetItem per user
+        loaded_items = await repo.load_batch([{'id': item['id']} for item in batch_items])
+        print(f'Async loaded {len(loaded_items)} of {len(batch_items)} items')
+
+        # These reads don't depend on each other, so send them concurrently: the
+        # wait is about one round-trip instead of one per request
+        items, filtered_items, total_count = await asyncio.gather(
+            repo.find_all('user-async-123'),
+            repo.find_all('user-async-123', filters={'age': {'gt': 25}}),
+            repo.count(),
+        )
+        print(f'Async found {len(items)} items')
+        print(f'Async found {len(filtered_items)} items for user-async-123 with age > 25')
+        print(f'Total items in table: {total_count}')
+
+        # Load all items using async generator
+        print('Loading all items asynchronously:')
+        count = 0
+        # limit=10 stops the scan on the DynamoDB side instead of breaking out of the loop
+        # after a full page has already been read
+        async for item in repo.load_all(limit=10):
+            count += 1
+            if count <= 3:  # Show first 3 items
+                print(f'  Item {count}: {item.get("name", "N/A")}')
+        print(f'Total items processed: {count}')
+
+    except Exception as e:
+        print(f'Error in async operations: {e}')
+
+
+async def filtering_example(repo: AsyncGenericRepository):
     """Example demonstrating the new filtering functionality in load_all."""
     print('\n=== Filtering Example ===')
 
-    async with AsyncGenericRepository(
-        table_name='my-table',
-        primary_key_name='id',
-        region_name='us-east-1',
-        logger=logger,
-        debug_mode=False,
-    ) as repo:
-        try:
-            # First, add some sample data with different attributes for filtering
-            sample_data = [
-                {
-                    'id': 'user-filter-001',
-                    'name': 'John Doe',
-                    'age': 25,
-                    'status': 'active',
-                    'city': 'New York',
-                    'score': 85.5,
-                },
-                {
-                    'id': 'user-filter-002',
-                    'name': 'Jane Smith',
-                    'age': 30,
-                    'status': 'inactive',
-                    'city': 'Los Angeles',
-                    'score': 92.0,
-                },
-                {
-                    'id': 'user-filter-003',
-                    'name': 'Bob Johnson',
-                    'age': 35,
-                    'status': 'active',
-                    'city': 'Chicago',
-                    'score': 78.3,
-                },
-                {
-                    'id': 'user-filter-004',
-                    'name': 'Alice Brown',
-                    'age': 28,
-                    'status': 'active',
-                    'city': 'Houston',
-                    'score': 88.7,
-                },
-                {
-                    'id': 'user-filter-005',
-                    'name': 'Charlie Wilson',
-                    'age': 45,
-                    'status': 'inactive',
-                    'city': 'Phoenix',
-                    'score': 95.2,
-                },
-            ]
-
-            print('Adding sample data for filtering...')
-            await repo.save_batch(sample_data)
-
-            # Example 1: Simple equality filter
-            print('\n1. Simple equality filter (status = "active"):')
-            count = 0
-            async for item in repo.load_all(filters={'status': 'active'}):
-                if 'user-filter-' in item.get('id', ''):  # Only show our test data
-                    count += 1
-                    print(f'   {item["name"]} (age: {item["age"]}, score: {item["score"]})')
-            print(f'   Found {count} active users')
-
-            # Example 2: Comparison operators
-            print('\n2. Age greater than 30:')
-            count = 0
-            async for item in repo.load_all(filters={'age': {'gt': 30}}):
-                if 'user-filter-' in item.get('id', ''):
-                    count += 1
-                    print(f'   {item["name"]} (age: {item["age"]})')
-            print(f'   Found {count} users older than 30')
-
-            # Example 3: Multiple conditions (AND logic)
-            print('\n3. Active users older than 25:')
-            count = 0
-            async for item in repo.load_all(filters={'status': 'active', 'age': {'gt': 25}}):
-                if 'user-filter-' in item.get('id', ''):
-                    count += 1
-                    print(f'   {item["name"]} (age: {item["age"]})')
-            print(f'   Found {count} active users older than 25')
-
-            # Example 4: Between operator
-            print('\n4. Users with age between 28 and 35:')
-            count = 0
-            async for item in repo.load_all(filters={'age': {'between': [28, 35]}}):
-                if 'user-filter-' in item.get('id', ''):
-                    count += 1
-                    print(f'   {item["name"]} (age: {item["age"]})')
-            print(f'   Found {count} users between age 28-35')
-
-            # Example 5: String contains
-            print('\n5. Names containing "Jo":')
-            count = 0
-            async for item in repo.load_all(filters={'name': {'contains': 'Jo'}}):
-                if 'user-filter-' in item.get('id', ''):
-                    count += 1
-                    print(f'   {item["name"]}')
-            print(f'   Found {count} users with "Jo" in name')
-
-            # Example 6: String begins with
-            print('\n6. Names beginning with "A":')
-            count = 0
-            async for item in repo.load_all(filters={'name': {'begins_with': 'A'}}):
-                if 'user-filter-' in item.get('id', ''):
-                    count += 1
-                    print(f'   {item["name"]}')
-            print(f'   Found {count} users whose name starts with "A"')
-
-            # Example 7: In operator
-            print('\n7. Users from New York or Chicago:')
-            count = 0
-            async for item in repo.load_all(filters={'city': {'in': ['New York', 'Chicago']}}):
-                if 'user-filter-' in item.get('id', ''):
-                    count += 1
-                    print(f'   {item["name"]} from {item["city"]}')
-            print(f'   Found {count} users from specified cities')
-
-            # Example 8: Explicit type specification for decimal numbers
-            print('\n8. Users with score >= 90.0 (explicit number type):')
-            count = 0
-            async for item in repo.load_all(filters={'score': {'value': 90.0, 'type': 'N', 'operator': 'ge'}}):
-                if 'user-filter-' in item.get('id', ''):
-                    count += 1
-                    print(f'   {item["name"]} (score: {item["score"]})')
-            print(f'   Found {count} users with score >= 90.0')
-
-            # Example 9: Complex filter combining multiple operators
-            print('\n9. Complex filter - Active users with score > 80 and age <= 35:')
-            count = 0
-            filters = {'status': 'active', 'score': {'gt': 80}, 'age': {'le': 35}}
-            async for item in repo.load_all(filters=filters):
-                if 'user-filter-' in item.get('id', ''):
-                    count += 1
-                    print(f'   {item["name"]} (age: {item["age"]}, score: {item["score"]})')
-            print(f'   Found {count} users matching complex criteria')
-
-        except Exception as e:
-            print(f'Error in filtering operations: {e}')
-
-
-def composite_key_example():
+    try:
+        # First, add some sample data with different attributes for filtering
+        sample_data = [
+            {
+                'id': 'user-filter-001',
+                'name': 'John Doe',
+                'age': 25,
+                'status': 'active',
+                'city': 'New York',
+                'score': 85.5,
+            },
+            {
+                'id': 'user-filter-002',
+                'name': 'Jane Smith',
+                'age': 30,
+                'status': 'inactive',
+                'city': 'Los Angeles',
+                'score': 92.0,
+            },
+            {
+                'id': 'user-filter-003',
+                'name': 'Bob Johnson',
+                'age': 35,
+                'status': 'active',
+                'city': 'Chicago',
+                'score': 78.3,
+            },
+            {
+                'id': 'user-filter-004',
+                'name': 'Alice Brown',
+                'age': 28,
+                'status': 'active',
+                'city': 'Houston',
+                'score': 88.7,
+            },
+            {
+                'id': 'user-filter-005',
+                'name': 'Charlie Wilson',
+                'age': 45,
+                'status': 'inactive',
+                'city': 'Phoenix',
+                'score': 95.2,
+            },
+        ]
+
+        print('Adding sample data for filtering...')
+        await repo.save_batch(sample_data)
+
+        # Only show our test data: the id prefix check runs in DynamoDB as part of each
+        # FilterExpression, so other items are never sent back
+        own_items = {'id': {'begins_with': 'user-filter-'}}
+
+        # (title, filters, what was found, how to show each item)
+        filter_examples = [
+            # Simple equality filter
+            (
+                '1. Simple equality filter (status = "active"):',
+                {'status': 'active'},
+                'active users',
+                lambda item: f'{item["name"]} (age: {item["age"]}, score: {item["score"]})',
+            ),
+            # Comparison operators
+            (
+                '2. Age greater than 30:',
+                {'age': {'gt': 30}},
+                'users older than 30',
+                lambda item: f'{item["name"]} (age: {item["age"]})',
+            ),
+            # Multiple conditions (AND logic)
+            (
+                '3. Active users older than 25:',
+                {'status': 'active', 'age': {'gt': 25}},
+                'active users older than 25',
+                lambda item: f'{item["name"]} (age: {item["age"]})',
+            ),
+            # Between operator
+            (
+                '4. Users with age between 28 and 35:',
+                {'age': {'between': [28, 35]}},
+                'users between age 28-35',
+                lambda item: f'{item["name"]} (age: {item["age"]})',
+            ),
+            # String contains
+            (
+                '5. Names containing "Jo":',
+                {'name': {'contains': 'Jo'}},
+                'users with "Jo" in name',
+                lambda item: item['name'],
+            ),
+            # String begins with
+            (
+                '6. Names beginning with "A":',
+                {'name': {'begins_with': 'A'}},
+                'users whose name starts with "A"',
+                lambda item: item['name'],
+            ),
+            # In operator
+            (
+                '7. Users from New York or Chicago:',
+                {'city': {'in': ['New York', 'Chicago']}},
+                'users from specified cities',
+                lambda item: f'{item["name"]} from {item["city"]}',
+            ),
+            # Explicit type specification for decimal numbers
+            (
+                '8. Users with score >= 90.0 (explicit number type):',
+                {'score': {'value': 90.0, 'type': 'N', 'operator': 'ge'}},
+                'users with score >= 90.0',
+                lambda item: f'{item["name"]} (score: {item["score"]})',
+            ),
+            # Complex filter combining multiple operators
+            (
+                '9. Complex filter - Active users with score > 80 and age <= 35:',
+                {'status': 'active', 'score': {'gt': 80}, 'age': {'le': 35}},
+                'users matching complex criteria',
+                lambda item: f'{item["name"]} (age: {item["age"]}, score: {item["score"]})',
+            ),
+        ]
+
+        async def collect(filters):
+            filters = {**filters, **own_items}
+            status = filters.pop('status', None)
+            if isinstance(status, str):
+                # status has a GSI (status-index): Query just that status instead of
+                # scanning the whole table, and apply the remaining filters to the result
+                return await repo.find_all_with_index(
+                    index_name='status-index', key_name='status', key_value=status, filters=filters
+                )
+            if status is not None:
+                filters['status'] = status
+            return [item async for item in repo.load_all(filters=filters)]
+
+        # The scans don't depend on each other, so run them concurrently and print the
+        # results in order: the wait is about one scan instead of nine back to back
+        results = await asyncio.gather(*(collect(filters) for _, filters, _, _ in filter_examples))
+        for (title, _, found, describe), items in zip(filter_examples, results):
+            # One print per example rather than one per item
+            lines = [f'\n{title}', *(f'   {describe(item)}' for item in items), f'   Found {len(items)} {found}']
+            print('\n'.join(lines))
+
+    except Exception as e:
+        print(f'Error in filtering operations: {e}')
+
+
+def composite_key_example(repo: GenericRepository):
     """Example using composite key operations."""
     print('\n=== Composite Key Example ===')
 
-    # Initialize repository with partition key name
-    repo = GenericRepository(
-        table_name='my-composite-table',
-        primary_key_name='tenant_id',  # This is the partition key
-        region_name='us-east-1',
-        logger=logger,
-        debug_mode=False,
-    )
-
     try:
         # Save item with composite key (partition + sort key)
         item_data = {
@@ -573,19 +609,10 @@ def composite_key_example():
         print(f'Error in composite key operations: {e}')
 
 
-def index_query_example():
+def index_query_example(repo: GenericRepository):
     """Example using index-based queries."""
     print('\n=== Index Query Example ===')
 
-    # Use the table with indexes for this example
-    repo = GenericRepository(
-        table_name='my-table',
-        primary_key_name='id',
-        region_name='us-east-1',
-        logger=logger,
-        debug_mode=False,
-    )
-
     try:
         # First, add some sample data to query
         sample_users = [
@@ -627,72 +654,55 @@ def index_query_example():
         print(f'Error in index query operations: {e}')
 
 
-async def async_composite_key_example():
+async def async_composite_key_example(repo: AsyncGenericRepository):
     """Example using async composite key operations including updates."""
     print('\n=== Async Composite Key Example ===')
 
-    # Initialize async repository with partition key name
-    async with AsyncGenericRepository(
-        table_name='my-composite-table',
-        primary_key_name='tenant_id',  # This is the partition key
-        region_name='us-east-1',
-        logger=logger,
-        debug_mode=False,
-    ) as repo:
-        try:
-            # Save item with composite key (partition + sort key)
-            item_data = {
-                'tenant_id': 'async-tenant-123',
-                'user_id': 'async-user-456',  # This is the sort key
-                'name': 'Async Composite User',
-                'email': 'async-composite@example.com',
-                'status': 'pending',
-            }
-            saved_item = await repo.save_with_composite_key(item_data)
-            print(f'Async saved composite key item: {saved_item}')
-
-            # Load item by composite key
-            key_dict = {'tenant_id': 'async-tenant-123', 'user_id': 'async-user-456'}
-            loaded_item = await repo.load_by_composite_key(key_dict)
-            print(f'Async loaded composite key item: {loaded_item}')
-
-            # Update item by composite key (partial update)
-            update_data = {'status': 'active', 'last_login': '2024-01-01T16:30:00Z', 'login_count': 1}
-            updated_item = await repo.update_by_composite_key(key_dict, update_data)
-            print(f'Async updated composite key item: {updated_item}')
-
-            # Another update with different fields
-            await repo.update_by_composite_key(key_dict, {'login_count': 5, 'plan': 'premium'}, set_expiration=True)
-            print('Async updated composite key item with expiration')
-
-            # Load the updated item to see all changes
-            final_item = await repo.load_by_composite_key(key_dict)
-            print(f'Final composite key item state: {final_item}')
-
-            # Find all items with the same partition key
-            items = await repo.find_all('async-tenant-123')
-            print(f'Async found {len(items)} items for async-tenant-123')
-
-            # Clean up - delete by composite key
-            await repo.delete_by_composite_key(key_dict)
-            print('Async deleted composite key item')
-
-        except Exception as e:
-            print(f'Error in async composite key operations: {e}')
-
-
-def reserved_keywords_update_example():
+    try:
+        # Save item with composite key (partition + sort key)
+        item_data = {
+            'tenant_id': 'async-tenant-123',
+            'user_id': 'async-user-456',  # This is the sort key
+            'name': 'Async Composite User',
+            'email': 'async-composite@example.com',
+            'status': 'pending',
+        }
+        saved_item = await repo.save_with_composite_key(item_data)
+        print(f'Async saved composite key item: {saved_item}')
+
+        # Load item by composite key
+        key_dict = {'tenant_id': 'async-tenant-123', 'user_id': 'async-user-456'}
+        loaded_item = await repo.load_by_composite_key(key_dict)
+        print(f'Async loaded composite key item: {loaded_item}')
+
+        # Update item by composite key (partial update)
+        update_data = {'status': 'active', 'last_login': '2024-01-01T16:30:00Z', 'login_count': 1}
+        updated_item = await repo.update_by_composite_key(key_dict, update_data)
+        print(f'Async updated composite key item: {updated_item}')
+
+        # Another update with different fields; the returned item already shows all changes
+        final_item = await repo.update_by_composite_key(
+            key_dict, {'login_count': 5, 'plan': 'premium'}, set_expiration=True
+        )
+        print('Async updated composite key item with expiration')
+        print(f'Final composite key item state: {final_item}')
+
+        # Find all items with the same partition key
+        items = await repo.find_all('async-tenant-123')
+        print(f'Async found {len(items)} items for async-tenant-123')
+
+        # Clean up - delete by composite key
+        await repo.delete_by_composite_key(key_dict)
+        print('Async deleted composite key item')
+
+    except Exception as e:
+        print(f'Error in async composite key operations: {e}')
+
+
+def reserved_keywords_update_example(repo: GenericRepository):
     """Example demonstrating updates with DynamoDB reserved keywords."""
     print('\n=== Reserved Keywords Update Example ===')
 
-    repo = GenericRepository(
-        table_name='my-table',
-        primary_key_name='id',
-        region_name='us-east-1',
-        logger=logger,
-        debug_mode=False,
-    )
-
     try:
         # Create a test item with various reserved keywords as field names
         test_data = {
@@ -719,36 +729,104 @@ def reserved_keywords_update_example():
             'data': {'updated': 'successfully'},  # reserved keyword
         }
 
+        # update returns the item as stored after the update (ReturnValues=ALL_NEW),
+        # so no follow-up load is needed to verify it
         updated_item = repo.update('reserved-test-001', update_data)
         print(f'Updated item with reserved keywords: {updated_item}')
-
-        # Verify the update worked by loading the item
-        loaded_item = repo.load('reserved-test-001')
-        if loaded_item:
-            print('Verification - loaded item shows updates:')
+        if updated_item:
+            print('Verification - updated item shows updates:')
             for key in ['status', 'size', 'type', 'count', 'order']:
-                print(f'  {key}: {loaded_item.get(key)}')
+                print(f'  {key}: {updated_item.get(key)}')
         else:
-            print('Warning: Could not load item for verification')
+            print('Warning: Update did not return the item for verification')
 
     except Exception as e:
         print(f'Error in reserved keywords update operations: {e}')
 
 
+def run_sync_examples(simple_table_name: str, composite_table_name: str):
+    """
+    Run the synchronous examples in order.
+
+    Each repository creates its own DynamoDB resource, so two repositories (one per
+    table) are built here and shared by all sync examples instead of one per example.
+    """
+    simple_repo = GenericRepository(
+        table_name=simple_table_name,
+        primary_key_name='id',
+        region_name='us-east-1',  # Optional: specify region
+        session=_session(),  # Reuse one session across repositories
+        logger=logger,
+        data_expiration_days=30,
+        debug_mode=False,  # Set to True to skip actual DynamoDB operations
+    )
+    composite_repo = GenericRepository(
+        table_name=composite_table_name,
+        primary_key_name='tenant_id',  # This is the partition key
+        region_name='us-east-1',
+        session=_session(),
+        logger=logger,
+        debug_mode=False,
+    )
+
+    sync_example(simple_repo)
+    sync_filtering_example(simple_repo)
+    composite_key_example(composite_repo)
+    index_query_example(simple_repo)
+    reserved_keywords_update_example(simple_repo)
+
+
+async def run_examples(simple_table_name: str, composite_table_name: str):
+    """
+    Run all examples concurrently.
+
+    Every example works on its own item keys, so they don't interfere with each
+    other and their DynamoDB round-trips can overlap. The sync examples share one
+    boto3 session, which is not thread-safe, so they run one after another in a
+    single worker thread alongside the async examples. The async examples share one
+    repository per table, and with it one connection pool. Output from different
+    examples may interleave.
+    """
+    # Initialize the async repositories with context managers - no need to create aioboto3 resources!
+    async with AsyncGenericRepository(
+        table_name=simple_table_name,
+        primary_key_name='id',
+        region_name='us-east-1',  # Optional: specify region
+        session=_async_session(),  # Reuse one session across repositories
+        logger=logger,
+        data_expiration_days=30,
+        debug_mode=False,  # Set to True for debugging
+    ) as simple_repo, AsyncGenericRepository(
+        table_name=composite_table_name,
+        primary_key_name='tenant_id',  # This is the partition key
+        region_name='us-east-1',
+        session=_async_session(),
+        logger=logger,
+        debug_mode=False,
+    ) as composite_repo:
+        await asyncio.gather(
+            asyncio.to_thread(run_sync_examples, simple_table_name, composite_table_name),
+            async_example(simple_repo),
+            filtering_example(simple_repo),
+            async_composite_key_example(composite_repo),
+        )
+
+
 if __name__ == '__main__':
-    # Setup tables first
-    setup_tables()
-
-    # Run synchronous examples
-    sync_example()
-    sync_filtering_example()
-    composite_key_example()
-    index_query_example()
-
-    # Run asynchronous example
-    asyncio.run(async_example())
-    asyncio.run(filtering_example())
-    asyncio.run(async_composite_key_example())
-    reserved_keywords_update_example()
+    # Set up tables once and pass them to every example
+    simple_table, composite_table = setup_tables()
+
+    # uvloop is an optional, faster drop-in event loop; fall back to the default one
+    # when it is not installed (it does not support Windows)
+    if sys.platform != 'win32':
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+    # Run sync and async examples side by side
+    asyncio.run(run_examples(simple_table.table_name, composite_table.table_name))
 
     print('\n=== All Examples Completed ===')
@@ -33,15 +33,17 @@ def _create_table(resource: boto3.resources.base.ServiceResource, table_name: st
 
 
 def _seed_items(repo: GenericRepository, partition_key: str, sort_keys: Iterable[str]) -> None:
-    for index, sort_key in enumerate(sort_keys, start=1):
-        repo.save_with_composite_key(
+    # save_batch sends BatchWriteItem requests (25 items each) and retries unprocessed items
+    repo.save_batch(
+        [
             {
                 'pk': partition_key,
                 'sk': sort_key,
                 'payload': f'example-{index}',
-            },
-            return_model=False,
-        )
+            }
+            for index, sort_key in enumerate(sort_keys, start=1)
+        ]
+    )
 
 
 def _show_items(repo: GenericRepository, partition_key: str, label: str) -> None:
@@ -9,6 +9,9 @@ Classes:
     AsyncGenericRepository: Asynchronous DynamoDB repository
     FilterHelper: Utility class for building DynamoDB filter expressions
 
+Functions:
+    get_async_repository: Shared, long-lived AsyncGenericRepository per table
+
 Example:
     from generic_repo import GenericRepository, AsyncGenericRepository
 
@@ -31,13 +34,49 @@ Example:
     async with AsyncGenericRepository(table_name='my-table', primary_key_name='id') as repo:
         async for item in repo.load_all(filters={'status': 'active'}):
             print(item)
+
+    # Python 3.12+: run tasks eagerly while the repository is open
+    async with AsyncGenericRepository(table_name='my-table', primary_key_name='id', eager_tasks=True) as repo:
+        items = await repo.load_batch([{'id': 'a'}, {'id': 'b'}])
+
+    # Long-running services: connect one shared repository at startup and reuse it
+    repo = await get_async_repository('my-table', 'id').connect()
+    item = await repo.load('item-123')
+    await repo.close()  # at shutdown
 """
 
-from .async_repo import AsyncGenericRepository
-from .filter_helper import FilterHelper
-from .sync_repo import GenericRepository
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .async_repo import AsyncGenericRepository, get_async_repository
+    from .filter_helper import FilterHelper
+    from .sync_repo import GenericRepository
+
+__all__ = ['GenericRepository', 'AsyncGenericRepository', 'FilterHelper', 'get_async_repository']
+
+# Submodules are imported on first attribute access so that importing the package
+# does not pull in boto3/aioboto3 (and botocore's service models) up front.
+_LAZY_IMPORTS = {
+    'GenericRepository': '.sync_repo',
+    'AsyncGenericRepository': '.async_repo',
+    'FilterHelper': '.filter_helper',
+    'get_async_repository': '.async_repo',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
 
-__all__ = ['GenericRepository', 'AsyncGenericRepository', 'FilterHelper']
 
 __version__ = '2.0.3'
 __author__ = 'Subrat'
@@ -0,0 +1,43 @@
+"""
+Shared internals of the DynamoDB repositories.
+
+This module holds the request-building helpers and settings used identically by
+the sync and async repository implementations.
+"""
+
+import functools
+from typing import Tuple
+
+# DescribeTable is a rate-limited control-plane call and the ItemCount/TableSizeBytes it
+# reports are only refreshed about every six hours, so its response is reused this long
+_TABLE_DESCRIPTION_TTL_SECONDS = 300
+
+# BatchExecuteStatement per-statement error codes that are worth sending again
+_RETRYABLE_STATEMENT_ERRORS = frozenset(
+    {
+        'InternalServerError',
+        'ProvisionedThroughputExceeded',
+        'RequestLimitExceeded',
+        'ThrottlingError',
+        'TransactionConflict',
+    }
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _update_expression_template(
+    field_names: Tuple[str, ...],
+) -> Tuple[str, Tuple[Tuple[str, str], ...], Tuple[str, ...]]:
+    """
+    Build the SET expression, name placeholders and value placeholders for a set of fields.
+
+    Args:
+        field_names: Names of the fields to update, in order
+
+    Returns:
+        Tuple of (update_expression, ((name_placeholder, field_name), ...), (value_placeholder, ...))
+    """
+    update_expression = 'SET ' + ', '.join(f'#{key} = :{key}' for key in field_names)
+    attribute_names = tuple((f'#{key}', key) for key in field_names)
+    value_placeholders = tuple(f':{key}' for key in field_names)
+    return update_expression, attribute_names, value_placeholders
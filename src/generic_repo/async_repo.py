@@ -1,16 +1,64 @@
 import asyncio
-import json
 import logging
-from datetime import datetime, timedelta
+import random
+import time
 from decimal import Decimal
-from typing import (Any, AsyncGenerator, Callable, Dict, List, Optional, Tuple,
-                    Union)
+from typing import (Any, AsyncGenerator, AsyncIterable, Callable, Dict, List, Optional,
+                    Tuple, Union)
 
 import aioboto3
-from boto3.dynamodb.conditions import Attr, Key
+from aiobotocore.config import AioConfig
+from boto3.dynamodb.conditions import Attr, ConditionBase
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
-from .filter_helper import FilterHelper
+from ._common import _RETRYABLE_STATEMENT_ERRORS, _TABLE_DESCRIPTION_TTL_SECONDS, _update_expression_template
+from .filter_helper import FilterHelper, _freeze
+from .item_cache import ItemCache
+from .item_codec import (
+    ItemCodec,
+    _build_schema_converters,
+    _dedupe_write_requests,
+    _is_dynamodb_ready,
+    _sort_key_value,
+)
+from .rate_limiter import TokenBucket
+
+# Default client configuration: adaptive retries back off on throttling per client,
+# and a larger, kept-alive connection pool avoids reconnects under concurrent batches/scans.
+# aiohttp closes idle pooled connections after 15s by default; keep them for 30s.
+DEFAULT_BOTO_CONFIG = AioConfig(
+    connector_args={'keepalive_timeout': 30},
+    retries={'mode': 'adaptive', 'max_attempts': 10},
+    max_pool_connections=64,
+    tcp_keepalive=True,
+    connect_timeout=2,
+    read_timeout=5,
+)
+
+# Shared by every repository created without an explicit session, like boto3's default session
+_default_session: Optional[aioboto3.Session] = None
+
+
+def _get_default_session() -> aioboto3.Session:
+    """Return the module-wide aioboto3 session, creating it on first use."""
+    global _default_session
+    if _default_session is None:
+        _default_session = aioboto3.Session()
+    return _default_session
+
+
+class _NotConnected:
+    """Stand-in for the table and client of a repository that is not connected."""
+
+    def __getattr__(self, name: str) -> Any:
+        raise RuntimeError("Repository is not connected: call connect() first (or use 'async with')")
+
+    def __repr__(self) -> str:
+        return '<not connected>'
+
+
+_NOT_CONNECTED = _NotConnected()
 
 
 class AsyncGenericRepository:
@@ -41,6 +89,12 @@ class AsyncGenericRepository:
         ... ) as repo:
         ...     item = await repo.save('key1', {'name': 'value'})
         ...     loaded = await repo.load('key1')
+
+        Long-running applications should instead connect one repository at startup
+        and reuse it, so requests share a warm connection pool:
+        >>> repo = await get_async_repository('my-table', 'id').connect()
+        >>> loaded = await repo.load('key1')
+        >>> await repo.close()
     """
 
     def __init__(
@@ -52,6 +106,11 @@ class AsyncGenericRepository:
         logger: Optional[logging.Logger] = None,
         data_expiration_days: Optional[int] = None,
         debug_mode: bool = False,
+        boto_config: Optional[Config] = None,
+        cache_size: int = 0,
+        cache_ttl_seconds: Optional[float] = None,
+        eager_tasks: bool = False,
+        fast_serde: bool = False,
     ):
         """
         Initialize the AsyncGenericRepository.
@@ -60,11 +119,32 @@ class AsyncGenericRepository:
             table_name: Name of the DynamoDB table
             primary_key_name: Name of the primary key attribute (partition key)
             region_name: AWS region name (optional, uses default if not provided)
-            session: Pre-configured aioboto3 session (optional, creates new if not provided)
+            session: Pre-configured aioboto3 session (optional). If not provided, a session
+                    shared by all repositories created without one is used; pass your
+                    own session for separate credentials or configuration
             logger: Optional logger instance. If None, creates a default logger
             data_expiration_days: Optional number of days after which items expire.
                                  If set, adds '_expireAt' field to saved items
             debug_mode: If True, skips actual database operations for testing
+            boto_config: Optional botocore Config for the DynamoDB resource.
+                        Defaults to DEFAULT_BOTO_CONFIG (adaptive retries, 64 pooled
+                        keep-alive connections kept idle for 30s, 2s connect / 5s read
+                        timeouts). Pass an aiobotocore AioConfig to set connector_args
+            cache_size: Maximum number of items kept in an in-process LRU cache in front
+                       of load/load_by_composite_key (and, separately, find_one_with_index).
+                       0 (default) disables the cache. Writes through this repository
+                       invalidate the affected partition and every cached index lookup;
+                       writes from other processes are not seen until the entry expires
+            cache_ttl_seconds: Optional number of seconds a cached item stays valid
+            eager_tasks: If True (Python 3.12+), installs asyncio.eager_task_factory on the
+                        running loop while the repository is open, so tasks that finish
+                        without awaiting skip a loop round-trip. Applies to every task
+                        on the loop; ignored if the loop already has a task factory
+            fast_serde: If True, load, save, find_all, find_all_with_index, load_all and
+                       their composite key, iterator and parallel variants send requests
+                       through a plain DynamoDB client and convert items with ItemCodec,
+                       skipping the resource API's per-request model walk. Returned items
+                       are the same; the plain client has its own connection pool
         """
         self.table_name = table_name
         self.primary_key_name = primary_key_name
@@ -72,20 +152,105 @@ class AsyncGenericRepository:
         self.data_expiration_days = data_expiration_days
         self.debug_mode = debug_mode
         self.region_name = region_name
+        self.boto_config = boto_config or DEFAULT_BOTO_CONFIG
+        self._cache = ItemCache(cache_size, cache_ttl_seconds) if cache_size > 0 else None
+        self._index_cache = ItemCache(cache_size, cache_ttl_seconds) if cache_size > 0 else None
+        self.eager_tasks = eager_tasks
+        self._eager_task_loop = None
+        self.fast_serde = fast_serde
 
         # Store session and region for later use
         if session:
             self._session = session
         else:
-            self._session = aioboto3.Session()
+            self._session = _get_default_session()
 
         self._dynamodb_resource = None
-        self.table = None
+        self.table = _NOT_CONNECTED
+        self._client = _NOT_CONNECTED
+        self._key_attribute_names = None
+        self._table_description = None
+        # Paginators are stateless, so each one is created once per connection instead of per query/scan
+        self._paginators = {}
+        self._open_count = 0
+        self._close_on_exit = False
+        # Serializes connect(); created on first use so it belongs to the running loop
+        self._connect_lock = None
+        # Plain client for the fast_serde path; requests and items are in wire format
+        self._fast_client_context = None
+        self._fast_client = None
 
     async def __aenter__(self):
-        """Async context manager entry."""
-        self._dynamodb_resource = self._session.resource('dynamodb', region_name=self.region_name)
-        self._dynamodb = await self._dynamodb_resource.__aenter__()
+        """
+        Async context manager entry.
+
+        Connects the repository unless it is already connected, in which case its
+        resource, table and connection pool are reused. A repository connected with
+        connect() stays connected when the context exits; otherwise it is closed
+        when the outermost context exits.
+        """
+        if await self._connect():
+            self._close_on_exit = True
+        self._open_count += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        self._open_count -= 1
+        if self._open_count == 0 and self._close_on_exit:
+            self._close_on_exit = False
+            await self.close()
+
+    async def connect(self) -> 'AsyncGenericRepository':
+        """
+        Open the DynamoDB resource and resolve the table.
+
+        Creating a resource means a new connection pool and new TCP/TLS handshakes, so
+        long-running applications should connect one repository at startup, share it,
+        and close it at shutdown instead of opening it per request (see
+        get_async_repository). Calling connect on a connected repository does nothing.
+
+        Returns:
+            The connected repository
+
+        Example:
+            >>> repo = AsyncGenericRepository(table_name='my-table', primary_key_name='id')
+            >>> await repo.connect()
+            >>> item = await repo.load('key1')
+            >>> await repo.close()
+        """
+        await self._connect()
+        return self
+
+    async def _connect(self) -> bool:
+        """
+        Connect the repository unless it is already connected.
+
+        Concurrent calls are serialized, so repositories entered or connected from
+        several tasks at once open exactly one resource (and connection pool).
+
+        Returns:
+            True if this call opened the connection, False if it was already open
+        """
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+        async with self._connect_lock:
+            if self._dynamodb_resource is not None:
+                return False
+            await self._open()
+            return True
+
+    async def _open(self) -> None:
+        """Open the DynamoDB resource (and fast_serde client) and resolve the table."""
+        if self.eager_tasks and hasattr(asyncio, 'eager_task_factory'):
+            loop = asyncio.get_running_loop()
+            if loop.get_task_factory() is None:
+                loop.set_task_factory(asyncio.eager_task_factory)
+                self._eager_task_loop = loop
+
+        dynamodb_resource = self._session.resource('dynamodb', region_name=self.region_name, config=self.boto_config)
+        self._dynamodb = await dynamodb_resource.__aenter__()
+        self._dynamodb_resource = dynamodb_resource
 
         # `aioboto3.resource("dynamodb").Table(name)` returns an awaitable in
         # real usage but unit‑test mocks often return a plain object.  Handle
@@ -94,12 +259,44 @@ class AsyncGenericRepository:
         if asyncio.iscoroutine(table_candidate):
             table_candidate = await table_candidate
         self.table = table_candidate
-        return self
+        # Low-level client used for bulk requests; it still accepts native Python values
+        self._client = self.table.meta.client
+        self._paginators = {}
+
+        if self.fast_serde:
+            fast_client_context = self._session.client(
+                'dynamodb', region_name=self.region_name, config=self.boto_config
+            )
+            self._fast_client = await fast_client_context.__aenter__()
+            self._fast_client_context = fast_client_context
+
+    async def close(self) -> None:
+        """
+        Close the DynamoDB resource and its connection pool.
 
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit."""
-        if self._dynamodb_resource:
-            await self._dynamodb_resource.__aexit__(exc_type, exc_val, exc_tb)
+        Calling close on a repository that is not connected does nothing; the
+        repository can be connected again afterwards.
+        """
+        dynamodb_resource = self._dynamodb_resource
+        fast_client_context = self._fast_client_context
+        self._dynamodb_resource = None
+        self._fast_client_context = None
+        self._fast_client = None
+        self.table = _NOT_CONNECTED
+        self._client = _NOT_CONNECTED
+        try:
+            try:
+                if fast_client_context:
+                    await fast_client_context.__aexit__(None, None, None)
+            finally:
+                if dynamodb_resource:
+                    await dynamodb_resource.__aexit__(None, None, None)
+        finally:
+            # Only undo the task factory this repository installed
+            if self._eager_task_loop is not None:
+                if self._eager_task_loop.get_task_factory() is asyncio.eager_task_factory:
+                    self._eager_task_loop.set_task_factory(None)
+                self._eager_task_loop = None
 
     # ===========================
     # PRIVATE UTILITY METHODS
@@ -115,8 +312,217 @@ class AsyncGenericRepository:
         Returns:
             Unix timestamp (epoch seconds) when item should expire
         """
-        expiration_date = datetime.now() + timedelta(days=days)
-        return int(expiration_date.timestamp())
+        return int(time.time()) + days * 86400
+
+    async def _describe_table(self) -> Dict[str, Any]:
+        """
+        Return the table description, fetching it at most once per _TABLE_DESCRIPTION_TTL_SECONDS.
+
+        Returns:
+            The 'Table' part of the DescribeTable response
+        """
+        cached = self._table_description
+        now = time.monotonic()
+        if cached is not None and now - cached[1] < _TABLE_DESCRIPTION_TTL_SECONDS:
+            return cached[0]
+
+        description = (await self.table.meta.client.describe_table(TableName=self.table_name))['Table']
+        self._table_description = (description, now)
+        return description
+
+    async def _get_default_scan_segments(self) -> int:
+        """Pick a parallel scan segment count from the table size: one per 2 GB, between 1 and 16."""
+        table_size_gb = (await self._describe_table()).get('TableSizeBytes', 0) / (1024**3)
+        return max(1, min(16, int(table_size_gb // 2)))
+
+    async def _get_item(self, key: Dict[str, Any], projection: Optional[List[str]]) -> Optional[Dict[str, Any]]:
+        """Send a GetItem for key (through the fast_serde client if enabled) and return the item or None."""
+        projection_params = FilterHelper.build_projection_params(projection)
+        if self._fast_client is None:
+            return (await self.table.get_item(Key=key, **projection_params)).get('Item')
+
+        response = await self._fast_client.get_item(
+            TableName=self.table_name, Key=ItemCodec.serialize_item(key), **projection_params
+        )
+        item = response.get('Item')
+        return ItemCodec.deserialize_item(item) if item is not None else None
+
+    async def _put_item(self, item: Dict[str, Any]) -> None:
+        """Send a PutItem for an already serialized item (through the fast_serde client if enabled)."""
+        if self._fast_client is None:
+            await self.table.put_item(Item=item)
+        else:
+            await self._fast_client.put_item(TableName=self.table_name, Item=ItemCodec.serialize_item(item))
+
+    def _get_paginator(self, operation_name: str, fast: bool = False) -> Any:
+        """Return the table client's (or, with fast=True, the fast_serde client's) paginator for operation_name."""
+        paginator = self._paginators.get((operation_name, fast))
+        if paginator is None:
+            client = self._fast_client if fast else self.table.meta.client
+            paginator = self._paginators[(operation_name, fast)] = client.get_paginator(operation_name)
+        return paginator
+
+    def _paginate(self, operation_name: str, params: Dict[str, Any]) -> AsyncIterable[Dict[str, Any]]:
+        """
+        Paginate a query or scan, returning pages whose 'Items' are Python items.
+
+        Args:
+            operation_name: 'query' or 'scan'
+            params: Request parameters with pre-rendered expressions and native values
+
+        Returns:
+            Async iterable of response pages
+        """
+        if self._fast_client is None:
+            return self._get_paginator(operation_name).paginate(**params)
+        return self._paginate_fast(operation_name, params)
+
+    async def _paginate_fast(self, operation_name: str, params: Dict[str, Any]) -> AsyncGenerator[Dict[str, Any], None]:
+        """Paginate through the fast_serde client, converting expression values and items with ItemCodec."""
+        values = params.get('ExpressionAttributeValues')
+        if values:
+            params = {**params, 'ExpressionAttributeValues': ItemCodec.serialize_item(values)}
+
+        deserialize_item = ItemCodec.deserialize_item
+        async for page in self._get_paginator(operation_name, fast=True).paginate(**params):
+            page['Items'] = [deserialize_item(item) for item in page.get('Items', [])]
+            yield page
+
+    async def _get_query_sort_key_name(self, index_name: Optional[str] = None) -> Optional[str]:
+        """Return the sort key name of the table (or of index_name), or None if it has no sort key."""
+        description = await self._describe_table()
+        if index_name is None:
+            key_schema = description.get('KeySchema', [])
+        else:
+            indexes = description.get('GlobalSecondaryIndexes', []) + description.get('LocalSecondaryIndexes', [])
+            key_schema = next((index['KeySchema'] for index in indexes if index['IndexName'] == index_name), [])
+        return next((key['AttributeName'] for key in key_schema if key['KeyType'] == 'RANGE'), None)
+
+    async def _query_both_ways(
+        self, query_params: Dict[str, Any], sort_key_name: str, unique_sort_keys: bool
+    ) -> List[Dict[str, Any]]:
+        """
+        Run a query from both ends of the sort key range at once and merge the two halves.
+
+        One task pages forward and the other backward; each records the sort key of its
+        LastEvaluatedKey and stops once the two frontiers have crossed (or met, when sort
+        keys are unique), so together they read each page about once in half the round trips.
+
+        Args:
+            query_params: Query request parameters with pre-rendered expressions
+            sort_key_name: Sort key attribute of the table or index being queried
+            unique_sort_keys: True for table queries, where no two items share a sort key
+
+        Returns:
+            All matching items in ascending sort key order
+        """
+        frontiers = {}
+        finished = False
+
+        def crossed() -> bool:
+            forward, backward = frontiers.get(True), frontiers.get(False)
+            if forward is None or backward is None:
+                return False
+            return forward >= backward if unique_sort_keys else forward > backward
+
+        async def query(scan_forward: bool) -> Tuple[List[Dict[str, Any]], bool]:
+            nonlocal finished
+            items = []
+            try:
+                async for page in self._paginate('query', {**query_params, 'ScanIndexForward': scan_forward}):
+                    items.extend(page.get('Items', []))
+                    last_evaluated_key = page.get('LastEvaluatedKey')
+                    if not last_evaluated_key:
+                        # This direction read the whole range on its own
+                        finished = True
+                        return items, True
+                    if self._fast_client is not None:
+                        last_evaluated_key = ItemCodec.deserialize_item(last_evaluated_key)
+                    frontiers[scan_forward] = _sort_key_value(last_evaluated_key[sort_key_name])
+                    if finished or crossed():
+                        break
+            except BaseException:
+                finished = True
+                raise
+            return items, False
+
+        (forward_items, forward_complete), (backward_items, backward_complete) = await asyncio.gather(
+            query(True), query(False)
+        )
+
+        if forward_complete:
+            return forward_items
+        backward_items.reverse()
+        if backward_complete:
+            return backward_items
+
+        # The halves overlap around the meeting point; drop the items both directions read
+        key_names = await self._get_key_attribute_names()
+        seen = {tuple(item.get(name) for name in key_names) for item in forward_items}
+        return forward_items + [
+            item for item in backward_items if tuple(item.get(name) for name in key_names) not in seen
+        ]
+
+    async def _scan_segments(
+        self, scan_params: Dict[str, Any], total_segments: int, rate_limiter: Optional[TokenBucket] = None
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Scan every segment concurrently as asyncio tasks and yield items as pages arrive.
+
+        Pages are handed over through a bounded queue, so a slow consumer pauses the
+        segment tasks instead of letting the whole table pile up in memory.
+
+        Args:
+            scan_params: Scan request parameters, including TotalSegments
+            total_segments: Number of segments (and tasks)
+            rate_limiter: Optional token bucket shared by all segments
+
+        Yields:
+            Dictionary containing each scanned item
+        """
+        pages = asyncio.Queue(maxsize=2 * total_segments)
+        segment_done = object()
+        stopped = False
+
+        async def put(value: Any) -> None:
+            # Give up once the consumer is gone, or a full queue would block the task forever
+            if not stopped:
+                await pages.put(value)
+
+        async def scan_segment(segment: int) -> None:
+            try:
+                async for page in self._paginate('scan', {**scan_params, 'Segment': segment}):
+                    await put(page.get('Items', []))
+
+                    if rate_limiter:
+                        consumed = page.get('ConsumedCapacity', {}).get('CapacityUnits', 0)
+                        delay = rate_limiter.consume(consumed)
+                        if delay:
+                            await asyncio.sleep(delay)
+            except Exception as e:
+                await put(e)
+            finally:
+                await put(segment_done)
+
+        tasks = [asyncio.create_task(scan_segment(segment)) for segment in range(total_segments)]
+        try:
+            remaining = total_segments
+            while remaining:
+                page = await pages.get()
+                if page is segment_done:
+                    remaining -= 1
+                elif isinstance(page, Exception):
+                    raise page
+                else:
+                    for item in page:
+                        yield item
+        finally:
+            # Stop the remaining segments if the caller stopped iterating early, and wait for
+            # them so their paginators and connections are released
+            stopped = True
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
     def _serialize_for_dynamodb(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -125,13 +531,160 @@ class AsyncGenericRepository:
         This method handles conversion of Python data types that aren't natively
         supported by DynamoDB (like datetime objects) into compatible formats.
 
+        Floats become Decimal, tuples become lists and any other unsupported value
+        (datetime, set, ...) is stored as its string representation.
+
+        Data that is already compatible (strings, ints, bools, Decimals and None in
+        plain dicts and lists) is returned as is rather than copied, so callers must
+        not modify the result in place.
+
         Args:
             data: Dictionary containing data to be serialized
 
         Returns:
             Dictionary with DynamoDB-compatible data types
         """
-        return json.loads(json.dumps(data, default=str), parse_float=Decimal)
+        if _is_dynamodb_ready(data):
+            return data
+        return {str(key): self._to_dynamodb_value(value) for key, value in data.items()}
+
+    def _to_dynamodb_value(self, value: Any) -> Any:
+        """Convert a single value (recursively) for _serialize_for_dynamodb."""
+        value_type = type(value)
+        # Exact type checks first: these cover nearly every value and are the cheapest
+        if value is None or value_type is str or value_type is int or value_type is bool or value_type is Decimal:
+            return value
+        if value_type is float:
+            return Decimal(repr(value))
+        if isinstance(value, dict):
+            return {str(key): self._to_dynamodb_value(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [self._to_dynamodb_value(item) for item in value]
+        # Subclasses such as IntEnum/str-based enums keep their underlying value
+        if isinstance(value, bool):
+            return bool(value)
+        if isinstance(value, int):
+            return int(value)
+        if isinstance(value, float):
+            return Decimal(repr(float(value)))
+        if isinstance(value, str):
+            return str.__str__(value)
+        if isinstance(value, Decimal):
+            return value
+        return str(value)
+
+    def _get_cache_key(self, key_dict: Dict[str, Any]) -> Optional[tuple]:
+        """
+        Build the item cache key for a table key, or None if the item can't be cached.
+
+        Args:
+            key_dict: Dictionary containing the partition key (and sort key if applicable)
+
+        Returns:
+            Tuple of (partition_key_value, sorted sort key items), or None if caching is
+            disabled or the key is incomplete or unhashable
+        """
+        if self._cache is None or self.primary_key_name not in key_dict:
+            return None
+
+        sort_key_items = tuple(
+            sorted((name, value) for name, value in key_dict.items() if name != self.primary_key_name)
+        )
+        cache_key = (key_dict[self.primary_key_name], sort_key_items)
+        try:
+            hash(cache_key)
+        except TypeError:
+            return None
+        return cache_key
+
+    def _get_index_cache_key(
+        self, index_name: str, key_name: str, key_value: Any, filters: Optional[Dict[str, Any]]
+    ) -> Optional[tuple]:
+        """Build the index lookup cache key for find_one_with_index, or None if it can't be cached."""
+        if self._index_cache is None:
+            return None
+        try:
+            cache_key = ((index_name, key_name, key_value), (_freeze(filters),) if filters else ())
+            hash(cache_key)
+        except TypeError:
+            return None
+        return cache_key
+
+    def _invalidate_cache(self, primary_key_value: Any) -> None:
+        """Drop cached items of a partition after a write through this repository."""
+        if self._cache is not None:
+            self._cache.invalidate_partition(primary_key_value)
+            # Any write can change which item an index lookup finds
+            self._index_cache.clear()
+
+    def _invalidate_cache_for_writes(self, write_requests: List[Dict[str, Any]]) -> None:
+        """Drop cached items of every partition touched by PutRequest/DeleteRequest entries."""
+        if self._cache is None:
+            return
+        self._index_cache.clear()
+        for write_request in write_requests:
+            request = write_request.get('PutRequest') or write_request.get('DeleteRequest') or {}
+            key_data = request.get('Item') or request.get('Key') or {}
+            self._cache.invalidate_partition(key_data.get(self.primary_key_name))
+
+    def _split_batch_keys(
+        self, key_dicts: List[Dict[str, Any]], projection: Optional[List[str]]
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Drop duplicate keys and split the rest into items found in the item cache and keys to read.
+
+        Args:
+            key_dicts: Key dictionaries passed to load_batch
+            projection: Projection passed to load_batch; projected reads bypass the cache
+
+        Returns:
+            Tuple of (cached_items, key_dicts_to_read)
+        """
+        # BatchGetItem rejects a request that lists the same key twice
+        unique_keys = {}
+        for key_dict in key_dicts:
+            try:
+                unique_keys.setdefault(tuple(sorted(key_dict.items())), key_dict)
+            except TypeError:
+                unique_keys[id(key_dict)] = key_dict
+
+        if self._cache is None or projection:
+            return [], list(unique_keys.values())
+
+        cached_items = []
+        keys_to_read = []
+        for key_dict in unique_keys.values():
+            cache_key = self._get_cache_key(key_dict)
+            cached_item = self._cache.get(cache_key) if cache_key is not None else None
+            if cached_item is not None:
+                cached_items.append(cached_item)
+            else:
+                keys_to_read.append(key_dict)
+        return cached_items, keys_to_read
+
+    def _get_cache_generations(self, key_dicts: List[Dict[str, Any]]) -> Dict[Any, int]:
+        """Capture the cache generation of every partition about to be read, keyed by partition value."""
+        generations = {}
+        if self._cache is not None:
+            for key_dict in key_dicts:
+                cache_key = self._get_cache_key(key_dict)
+                if cache_key is not None:
+                    generations[cache_key[0]] = self._cache.generation(cache_key[0])
+        return generations
+
+    def _quote_partiql_identifier(self, identifier: str) -> str:
+        """Quote identifiers for use in PartiQL statements."""
+        escaped = identifier.replace('"', '""')
+        return f'"{escaped}"'
+
+    async def _get_key_attribute_names(self) -> List[str]:
+        """Return the table's key attribute names, partition key first (described once, then cached)."""
+        if self._key_attribute_names is None:
+            key_schema = (await self._describe_table())['KeySchema']
+            self._key_attribute_names = [
+                key['AttributeName'] for key in sorted(key_schema, key=lambda key: key['KeyType'] != 'HASH')
+            ]
+        return self._key_attribute_names
 
     def _build_update_expression(self, data: Dict[str, Any]) -> tuple:
         """
@@ -149,21 +702,13 @@ class AsyncGenericRepository:
         if not data:
             return '', {}, {}
 
-        update_expression = 'SET '
-        expression_attribute_names = {}
-        expression_attribute_values = {}
-
-        for key, value in data.items():
-            attr_name = f'#{key}'
-            attr_value = f':{key}'
-            update_expression += f'{attr_name} = {attr_value}, '
-            expression_attribute_names[attr_name] = key
-            expression_attribute_values[attr_value] = value
-
-        # Remove trailing comma and space
-        update_expression = update_expression.rstrip(', ')
+        # The expression and placeholders only depend on the field names, which repeat
+        # across updates of the same item shape, so only the values are mapped per call
+        update_expression, attribute_names, value_placeholders = _update_expression_template(tuple(data))
+        expression_attribute_values = dict(zip(value_placeholders, data.values()))
 
-        return update_expression, expression_attribute_names, expression_attribute_values
+        # boto3 adds condition placeholders to ExpressionAttributeNames, so hand out a fresh dict
+        return update_expression, dict(attribute_names), expression_attribute_values
 
     def _build_condition_expression(self, conditions: Union[Dict[str, Any], Any]) -> Optional[Any]:
         """
@@ -176,7 +721,7 @@ class AsyncGenericRepository:
             DynamoDB ConditionExpression or None
         """
         # If already a ConditionBase (from boto3), return as-is
-        if hasattr(conditions, '__class__') and 'ConditionBase' in str(conditions.__class__.__bases__):
+        if isinstance(conditions, ConditionBase):
             return conditions
         
         # If it's a dict, use FilterHelper to convert it
@@ -186,16 +731,127 @@ class AsyncGenericRepository:
         # Otherwise return as-is (might be None or already a condition)
         return conditions
 
+    async def _execute_statement_chunk(self, statements: List[Dict[str, Any]]) -> None:
+        """
+        Send one BatchExecuteStatement request, retrying statements that failed with a retryable error.
+
+        Args:
+            statements: Up to 25 PartiQL statements with their parameters
+
+        Raises:
+            ClientError: If a statement fails with a non-retryable error
+        """
+        attempt = 0
+
+        while statements:
+            if attempt:
+                # Full jitter keeps concurrent chunks from retrying in lockstep
+                await asyncio.sleep(random.uniform(0, min(0.05 * (2**attempt), 2.0)))
+            response = await self._client.batch_execute_statement(Statements=statements)
+
+            failed = []
+            # Responses are returned in the same order as the statements
+            for statement, result in zip(statements, response.get('Responses', [])):
+                error = result.get('Error')
+                if error is None:
+                    continue
+                if error.get('Code') not in _RETRYABLE_STATEMENT_ERRORS:
+                    raise ClientError({'Error': error}, 'BatchExecuteStatement')
+                failed.append(statement)
+            statements = failed
+            attempt += 1
+
+    async def _get_batch_chunk(
+        self, table_name: str, keys: List[Dict[str, Any]], projection_params: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """
+        Send one BatchGetItem request, retrying unprocessed keys until all are read.
+
+        Args:
+            table_name: Name of the table to read from
+            keys: Up to 100 key dictionaries
+            projection_params: ProjectionExpression parameters from build_projection_params
+
+        Returns:
+            List of found items
+        """
+        request_items = {table_name: {'Keys': keys, **projection_params}}
+        items = []
+        attempt = 0
+
+        while request_items:
+            if attempt:
+                # Full jitter keeps concurrent chunks from retrying in lockstep
+                await asyncio.sleep(random.uniform(0, min(0.05 * (2**attempt), 2.0)))
+            response = await self._client.batch_get_item(RequestItems=request_items)
+            items.extend(response.get('Responses', {}).get(table_name, []))
+            request_items = response.get('UnprocessedKeys')
+            attempt += 1
+
+        return items
+
+    async def _write_batch_chunk(self, table_name: str, write_requests: List[Dict[str, Any]]) -> None:
+        """
+        Send one BatchWriteItem request, retrying unprocessed items until all are written.
+
+        Args:
+            table_name: Name of the table to write to
+            write_requests: Up to 25 PutRequest/DeleteRequest entries
+        """
+        request_items = {table_name: write_requests}
+        attempt = 0
+
+        while request_items:
+            if attempt:
+                # Full jitter keeps concurrent chunks from retrying in lockstep
+                await asyncio.sleep(random.uniform(0, min(0.05 * (2**attempt), 2.0)))
+            response = await self._client.batch_write_item(RequestItems=request_items)
+            request_items = response.get('UnprocessedItems')
+            attempt += 1
+
+    async def _batch_write(self, write_requests: List[Dict[str, Any]], max_workers: int) -> None:
+        """
+        Write requests in 25-item BatchWriteItem chunks, dispatching chunks concurrently.
+
+        When there is more than one chunk, only the last request for each table key is
+        sent, so the outcome does not depend on which chunk lands first.
+
+        Args:
+            write_requests: PutRequest/DeleteRequest entries to send
+            max_workers: Maximum number of chunks in flight at the same time
+        """
+        table_name = self.table_name
+
+        # DynamoDB batch write limit is 25 items
+        batch_size = 25
+        if len(write_requests) > batch_size:
+            write_requests = _dedupe_write_requests(write_requests, await self._get_key_attribute_names())
+        chunks = [write_requests[i : i + batch_size] for i in range(0, len(write_requests), batch_size)]
+
+        semaphore = asyncio.Semaphore(max(1, max_workers))
+
+        async def write_chunk(chunk: List[Dict[str, Any]]) -> None:
+            async with semaphore:
+                await self._write_batch_chunk(table_name, chunk)
+
+        try:
+            await asyncio.gather(*(write_chunk(chunk) for chunk in chunks))
+        finally:
+            # Invalidate even on failure: some chunks may have been written already
+            self._invalidate_cache_for_writes(write_requests)
+
     # ===========================
     # BASIC READ OPERATIONS
     # ===========================
 
-    async def load(self, primary_key_value: Any) -> Optional[Dict[str, Any]]:
+    async def load(self, primary_key_value: Any, projection: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
         """
         Load an item by primary key.
 
         Args:
             primary_key_value: The value of the primary key to load
+            projection: Optional list of attribute names to return. If None, returns
+                       all attributes
 
         Returns:
             Dictionary containing the item data, or None if not found
@@ -203,20 +859,35 @@ class AsyncGenericRepository:
         Raises:
             ClientError: If there's an error communicating with DynamoDB
         """
+        # Projected reads return partial items, so only full items go through the cache
+        cache_key = self._get_cache_key({self.primary_key_name: primary_key_value}) if not projection else None
+        if cache_key is not None:
+            cached_item = self._cache.get(cache_key)
+            if cached_item is not None:
+                return cached_item
+            # A write landing while the read is in flight must not let the pre-write item into the cache
+            generation = self._cache.generation(cache_key[0])
+
         try:
-            response = await self.table.get_item(Key={self.primary_key_name: primary_key_value})
-            return response.get('Item')
+            item = await self._get_item({self.primary_key_name: primary_key_value}, projection)
+            if cache_key is not None and item is not None:
+                self._cache.put(cache_key, item, generation)
+            return item
         except ClientError as e:
             self.logger.error(f'Error loading item: {e}')
             raise
 
-    async def load_by_composite_key(self, key_dict: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    async def load_by_composite_key(
+        self, key_dict: Dict[str, Any], projection: Optional[List[str]] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         Load an item by composite key (for tables with partition + sort key).
 
         Args:
             key_dict: Dictionary containing both partition and sort key values
                      Example: {'partition_key': 'value1', 'sort_key': 'value2'}
+            projection: Optional list of attribute names to return. If None, returns
+                       all attributes
 
         Returns:
             Dictionary containing the item data, or None if not found
@@ -224,9 +895,18 @@ class AsyncGenericRepository:
         Raises:
             ClientError: If there's an error communicating with DynamoDB
         """
+        cache_key = self._get_cache_key(key_dict) if not projection else None
+        if cache_key is not None:
+            cached_item = self._cache.get(cache_key)
+            if cached_item is not None:
+                return cached_item
+            generation = self._cache.generation(cache_key[0])
+
         try:
-            response = await self.table.get_item(Key=key_dict)
-            return response.get('Item')
+            item = await self._get_item(key_dict, projection)
+            if cache_key is not None and item is not None:
+                self._cache.put(cache_key, item, generation)
+            return item
         except ClientError as e:
             self.logger.error(f'Error loading item by composite key: {e}')
             raise
@@ -255,7 +935,12 @@ class AsyncGenericRepository:
     # ===========================
 
     async def save(
-        self, primary_key_value: Any, model: Dict[str, Any], return_model: bool = True, set_expiration: bool = True
+        self,
+        primary_key_value: Any,
+        model: Dict[str, Any],
+        return_model: bool = True,
+        set_expiration: bool = True,
+        reload: bool = False,
     ) -> Optional[Dict[str, Any]]:
         """
         Save an item to the table.
@@ -265,9 +950,13 @@ class AsyncGenericRepository:
             model: Dictionary containing the data to save
             return_model: If True, returns the saved item after successful save
             set_expiration: If True and data_expiration_days is set, adds expiration
+            reload: If True, the returned item is read back from the table instead of
+                   being the item that was written, at the cost of a second request
 
         Returns:
-            Dictionary containing the saved item if return_model=True, otherwise None
+            Dictionary containing the saved item (as written, including the primary key
+            and any '_expireAt', with numbers as Decimal like load returns them) if
+            return_model=True, otherwise None
             In debug mode, always returns None
 
         Raises:
@@ -288,9 +977,15 @@ class AsyncGenericRepository:
         item = self._serialize_for_dynamodb(item)
 
         try:
-            await self.table.put_item(Item=item)
+            await self._put_item(item)
+            self._invalidate_cache(primary_key_value)
             if return_model:
-                return await self.load(primary_key_value)
+                # PutItem replaces the whole item, so what was sent is what is stored
+                if reload:
+                    return await self.load(primary_key_value)
+                # A round trip through the wire format returns a new item that shares nothing
+                # with the caller's model, with values typed as a read returns them
+                return ItemCodec.deserialize_item(ItemCodec.serialize_item(item))
         except ClientError as e:
             self.logger.error(f'Error saving item: {e}')
             raise
@@ -328,7 +1023,8 @@ class AsyncGenericRepository:
         item = self._serialize_for_dynamodb(item)
 
         try:
-            await self.table.put_item(Item=item)
+            await self._put_item(item)
+            self._invalidate_cache(item_data.get(self.primary_key_name))
             if return_model:
                 # For composite key tables, we need to extract the key components from the item
                 # Assume we can determine the keys from the table schema or item data
@@ -427,6 +1123,7 @@ class AsyncGenericRepository:
                     update_params['ConditionExpression'] = condition_expr
 
             response = await self.table.update_item(**update_params)
+            self._invalidate_cache(primary_key_value)
 
             if return_model:
                 return response.get('Attributes')
@@ -536,6 +1233,7 @@ class AsyncGenericRepository:
                     update_params['ConditionExpression'] = condition_expr
 
             response = await self.table.update_item(**update_params)
+            self._invalidate_cache(key_dict.get(self.primary_key_name))
 
             if return_model:
                 return response.get('Attributes')
@@ -572,25 +1270,178 @@ class AsyncGenericRepository:
 
         try:
             await self.table.delete_item(Key=key_dict)
+            self._invalidate_cache(key_dict.get(self.primary_key_name))
         except ClientError as e:
             self.logger.error(f'Error deleting item: {e}')
             raise
 
+    async def delete_all_by_primary_key(self, primary_key_value: Any) -> None:
+        """
+        Delete all items sharing the given primary key using PartiQL.
+
+        Intended for tables that use a composite key (partition + sort key).
+        Removes every item with the specified partition key value: the item keys are
+        queried first, then deleted with BatchExecuteStatement, 25 statements per request.
+        Statements that fail with a throttling or other retryable error are retried with
+        jittered exponential backoff.
+
+        Args:
+            primary_key_value: Value of the partition key whose items should be deleted
+
+        Raises:
+            ClientError: If there's an error communicating with DynamoDB or a statement
+                        fails with a non-retryable error
+        """
+        if self.debug_mode:
+            self.logger.info(f'Debug mode: skipping delete of all items with {self.primary_key_name}={primary_key_value} from {self.table_name}')
+            return
+
+        if primary_key_value is None:
+            return
+
+        try:
+            # PartiQL deletes need every key attribute, so the keys are queried first and
+            # deleted with one parameterized statement per item, 25 per request
+            key_names = await self._get_key_attribute_names()
+            conditions = ' AND '.join(f'{self._quote_partiql_identifier(name)} = ?' for name in key_names)
+            statement = f'DELETE FROM {self._quote_partiql_identifier(self.table_name)} WHERE {conditions}'
+
+            query_params = FilterHelper.build_query_params(self.primary_key_name, primary_key_value)
+            projection_params = FilterHelper.build_projection_params(key_names)
+            query_params['ProjectionExpression'] = projection_params['ProjectionExpression']
+            query_params['ExpressionAttributeNames'].update(projection_params['ExpressionAttributeNames'])
+
+            paginator = self._get_paginator('query')
+            page_iterator = paginator.paginate(
+                TableName=self.table_name,
+                **query_params,
+            )
+            statements = [
+                {'Statement': statement, 'Parameters': [item[name] for name in key_names]}
+                async for page in page_iterator
+                for item in page.get('Items', [])
+            ]
+
+            # DynamoDB BatchExecuteStatement limit is 25 statements
+            for i in range(0, len(statements), 25):
+                await self._execute_statement_chunk(statements[i : i + 25])
+        except ClientError as e:
+            self.logger.error(f'Error deleting items with primary key {self.primary_key_name}={primary_key_value} using PartiQL: {e}')
+            raise
+        finally:
+            # Invalidate even on failure: some items may have been deleted already
+            self._invalidate_cache(primary_key_value)
+
     # ===========================
     # BATCH OPERATIONS
     # ===========================
 
-    async def save_batch(self, models: List[Dict[str, Any]], set_expiration: bool = True) -> None:
+    async def load_batch(
+        self, key_dicts: List[Dict[str, Any]], projection: Optional[List[str]] = None, max_workers: int = 10
+    ) -> List[Dict[str, Any]]:
+        """
+        Load multiple items by their keys in batch for improved performance.
+
+        Uses BatchGetItem, automatically splitting large requests into DynamoDB's
+        100-key chunks. Chunks are sent concurrently and unprocessed keys are retried
+        with jittered exponential backoff. Duplicate keys are read once.
+
+        With cache_size set, items already in the item cache are returned without a
+        request and the items read are cached for later load/load_batch calls.
+
+        Args:
+            key_dicts: List of dictionaries containing key values for items to load.
+                      Each dict should contain primary key (and sort key if applicable)
+                      Example: [{'id': 'key1'}, {'id': 'key2'}] for simple primary key
+                      Example: [{'pk': 'p1', 'sk': 's1'}] for composite key
+            projection: Optional list of attribute names to return. If None, returns
+                       all attributes
+            max_workers: Maximum number of 100-key chunks read concurrently
+
+        Returns:
+            List of found items. Keys that don't exist are omitted and the order of
+            the items is not guaranteed to match key_dicts
+
+        Raises:
+            ClientError: If there's an error communicating with DynamoDB
+        """
+        cached_items, key_dicts = self._split_batch_keys(key_dicts, projection)
+        if not key_dicts:
+            return cached_items
+        generations = self._get_cache_generations(key_dicts) if not projection else {}
+
+        # Get the actual table name from the table resource
+        table_name = self.table_name
+
+        # DynamoDB batch get limit is 100 keys
+        batch_size = 100
+        chunks = [key_dicts[i : i + batch_size] for i in range(0, len(key_dicts), batch_size)]
+        projection_params = FilterHelper.build_projection_params(projection)
+
+        semaphore = asyncio.Semaphore(max(1, max_workers))
+
+        async def get_chunk(chunk: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self._get_batch_chunk(table_name, chunk, projection_params)
+
+        try:
+            results = await asyncio.gather(*(get_chunk(chunk) for chunk in chunks))
+        except ClientError as e:
+            self.logger.error(f'Error in batch load: {e}')
+            raise
+
+        items = [item for chunk_items in results for item in chunk_items]
+        if self._cache is not None and not projection:
+            key_names = list(key_dicts[0])
+            for item in items:
+                cache_key = self._get_cache_key({name: item.get(name) for name in key_names})
+                if cache_key is not None and cache_key[0] in generations:
+                    self._cache.put(cache_key, item, generations[cache_key[0]])
+        return cached_items + items
+
+    async def load_batch_by_primary_keys(
+        self, primary_key_values: List[Any], projection: Optional[List[str]] = None, max_workers: int = 10
+    ) -> List[Dict[str, Any]]:
+        """
+        Load multiple items by their primary key values in batch.
+
+        Shorthand for load_batch on tables without a sort key, in place of one load
+        call (and round trip) per key.
+
+        Args:
+            primary_key_values: Primary key values of the items to load
+            projection: Optional list of attribute names to return. If None, returns
+                       all attributes
+            max_workers: Maximum number of 100-key chunks read concurrently
+
+        Returns:
+            List of found items. Keys that don't exist are omitted and the order of
+            the items is not guaranteed to match primary_key_values
+
+        Raises:
+            ClientError: If there's an error communicating with DynamoDB
+        """
+        key_dicts = [{self.primary_key_name: value} for value in primary_key_values]
+        return await self.load_batch(key_dicts, projection, max_workers)
+
+    async def save_batch(
+        self,
+        models: List[Dict[str, Any]],
+        set_expiration: bool = True,
+        max_workers: int = 10,
+    ) -> None:
         """
         Save multiple items in batch for improved performance.
 
         Automatically handles DynamoDB's 25-item batch limit by splitting large
-        batches into smaller chunks.
+        batches into smaller chunks. Chunks are sent concurrently and unprocessed
+        items are retried with jittered exponential backoff.
 
         Args:
             models: List of dictionaries containing item data to save.
                    Each dict should contain all necessary data including primary key
             set_expiration: If True and data_expiration_days is set, adds expiration
+            max_workers: Maximum number of 25-item chunks written concurrently
 
         Raises:
             ClientError: If there's an error communicating with DynamoDB
@@ -602,40 +1453,107 @@ class AsyncGenericRepository:
         if not models:
             return
 
-        # DynamoDB batch write limit is 25 items
-        batch_size = 25
+        # Compute the expiration once for the whole batch
+        expire_at = None
+        if set_expiration and self.data_expiration_days:
+            expire_at = self._get_expire_at_epoch(self.data_expiration_days)
+
+        # Models are never copied up front; bound methods are looked up once for the whole batch
+        write_requests = []
+        append = write_requests.append
+        serialize = self._serialize_for_dynamodb
+        for model in models:
+            item = serialize(model)
+            if expire_at is not None:
+                # Compatible models come back as is and must not be modified; converted
+                # ones are already a new dict, so one dict per item is built either way
+                if item is model:
+                    item = {**model, '_expireAt': expire_at}
+                else:
+                    item['_expireAt'] = expire_at
+            append({'PutRequest': {'Item': item}})
 
-        for i in range(0, len(models), batch_size):
-            batch = models[i : i + batch_size]
-            items = []
+        try:
+            await self._batch_write(write_requests, max_workers)
+        except ClientError as e:
+            self.logger.error(f'Error in batch save: {e}')
+            raise
 
-            for model in batch:
-                item = model.copy()
-                # Add expiration if configured
-                if set_expiration and self.data_expiration_days:
-                    item['_expireAt'] = self._get_expire_at_epoch(self.data_expiration_days)
-                items.append(self._serialize_for_dynamodb(item))
+    async def save_batch_uniform(
+        self,
+        models: List[Dict[str, Any]],
+        schema: Dict[str, str],
+        set_expiration: bool = True,
+        max_workers: int = 10,
+    ) -> None:
+        """
+        Save multiple items that all have the same attributes in batch.
 
-            try:
-                async with self.table.batch_writer() as batch_writer:
-                    for item in items:
-                        await batch_writer.put_item(Item=item)
-            except ClientError as e:
-                self.logger.error(f'Error in batch save: {e}')
-                raise
+        Faster than save_batch for homogeneous batches: the handling of each attribute
+        is resolved once from the schema instead of inspecting every value. Values are
+        checked against the schema, never coerced, and nothing is written unless every
+        item matches it.
+
+        Args:
+            models: List of dictionaries containing item data to save. Each must have
+                   exactly the attributes listed in schema
+            schema: Mapping of attribute name to DynamoDB type ('S', 'N', 'BOOL', 'B',
+                   'M', 'L', 'SS', 'NS', 'BS'), e.g. {'id': 'S', 'amount': 'N'}
+            set_expiration: If True and data_expiration_days is set, adds expiration
+            max_workers: Maximum number of 25-item chunks written concurrently
 
-    async def delete_batch_by_keys(self, key_dicts: List[Dict[str, Any]]) -> None:
+        Raises:
+            ClientError: If there's an error communicating with DynamoDB
+            TypeError: If a value (including None) does not match its declared type
+            ValueError: If schema contains an unsupported type or an item is missing
+                       an attribute of the schema or has one that isn't in it
+        """
+        if self.debug_mode:
+            self.logger.info(f'Debug mode: skipping batch save to {self.table_name} ({len(models)} items)')
+            return
+
+        if not models:
+            return
+
+        converters = _build_schema_converters(schema, self._to_dynamodb_value)
+
+        expire_at = None
+        if set_expiration and self.data_expiration_days:
+            expire_at = self._get_expire_at_epoch(self.data_expiration_days)
+
+        attr_names = schema.keys()
+        write_requests = []
+        append = write_requests.append
+        for index, model in enumerate(models):
+            if model.keys() != attr_names:
+                missing = sorted(attr_names - model.keys())
+                extra = sorted(model.keys() - attr_names)
+                raise ValueError(f'Item {index} does not match the schema (missing: {missing}, extra: {extra})')
+            item = {attr_name: convert(model[attr_name]) for attr_name, convert in converters}
+            if expire_at is not None:
+                item['_expireAt'] = expire_at
+            append({'PutRequest': {'Item': item}})
+
+        try:
+            await self._batch_write(write_requests, max_workers)
+        except ClientError as e:
+            self.logger.error(f'Error in batch save: {e}')
+            raise
+
+    async def delete_batch_by_keys(self, key_dicts: List[Dict[str, Any]], max_workers: int = 10) -> None:
         """
         Delete multiple items by their keys in batch for improved performance.
 
         Automatically handles DynamoDB's 25-item batch limit by splitting large
-        batches into smaller chunks.
+        batches into smaller chunks. Chunks are sent concurrently and unprocessed
+        items are retried with jittered exponential backoff.
 
         Args:
             key_dicts: List of dictionaries containing key values for items to delete.
                       Each dict should contain primary key (and sort key if applicable)
                       Example: [{'id': 'key1'}, {'id': 'key2'}] for simple primary key
                       Example: [{'pk': 'p1', 'sk': 's1'}] for composite key
+            max_workers: Maximum number of 25-item chunks deleted concurrently
 
         Raises:
             ClientError: If there's an error communicating with DynamoDB
@@ -647,32 +1565,31 @@ class AsyncGenericRepository:
         if not key_dicts:
             return
 
-        # DynamoDB batch write limit is 25 items
-        batch_size = 25
-
-        for i in range(0, len(key_dicts), batch_size):
-            batch = key_dicts[i : i + batch_size]
-
-            try:
-                async with self.table.batch_writer() as batch_writer:
-                    for key_dict in batch:
-                        await batch_writer.delete_item(Key=key_dict)
-            except ClientError as e:
-                self.logger.error(f'Error in batch delete: {e}')
-                raise
+        try:
+            await self._batch_write([{'DeleteRequest': {'Key': key_dict}} for key_dict in key_dicts], max_workers)
+        except ClientError as e:
+            self.logger.error(f'Error in batch delete: {e}')
+            raise
 
     # ===========================
     # QUERY OPERATIONS
     # ===========================
 
-    async def find_all(self, primary_key_value: Any, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    async def find_all(
+        self, primary_key_value: Any, filters: Optional[Dict[str, Any]] = None, parallel: bool = False
+    ) -> List[Dict[str, Any]]:
         """
         Find all items with the given primary key value, with optional filtering.
 
         Uses DynamoDB Query operation with automatic pagination to retrieve all
         items that match the primary key. For composite key tables, this returns
         all items with the given partition key across all sort keys. Additional
-        filters can be applied to further narrow down the results.
+        filters can be applied to further narrow down the results. Use find_all_iter
+        to process items as they arrive instead of collecting them all first.
+
+        With parallel=True, large partitions are read from both ends of the sort key
+        range at once (an ascending and a descending Query running concurrently that
+        stop where they meet), which roughly halves the wall-clock time of a many-page query.
 
         Args:
             primary_key_value: Value of the primary key (partition key) to search for
@@ -691,42 +1608,98 @@ class AsyncGenericRepository:
                     - {"tags": {"contains": "python"}}
                     - {"score": {"between": [10, 20]}}
                     - {"category": {"in": ["tech", "science"]}}
+            parallel: If True, query both ends of the partition concurrently. Ignored
+                     for tables without a sort key
 
         Returns:
             List of dictionaries containing all matching items. Empty list if none found
 
+        Raises:
+            ClientError: If there's an error communicating with DynamoDB
+            ValueError: If filter format is invalid
+        """
+        if not parallel or not primary_key_value:
+            return [item async for item in self.find_all_iter(primary_key_value, filters)]
+
+        try:
+            sort_key_name = await self._get_query_sort_key_name()
+            if sort_key_name is None:
+                return [item async for item in self.find_all_iter(primary_key_value, filters)]
+
+            query_params = {'TableName': self.table_name}
+            query_params.update(FilterHelper.build_query_params(self.primary_key_name, primary_key_value, filters))
+            return await self._query_both_ways(query_params, sort_key_name, unique_sort_keys=True)
+        except ClientError as e:
+            self.logger.error(f'Error in find_all: {e}')
+            raise
+
+    async def find_all_iter(
+        self, primary_key_value: Any, filters: Optional[Dict[str, Any]] = None
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Query and yield all items with the given primary key value, with optional filtering.
+
+        Uses DynamoDB Query operation with automatic pagination to retrieve all
+        items that match the primary key. For composite key tables, this returns
+        all items with the given partition key across all sort keys. Additional
+        filters can be applied to further narrow down the results.
+
+        Items are yielded as each page arrives, so the caller can start working on
+        the first page while later pages are still being fetched, and memory use
+        stays at about one page regardless of how many items match.
+
+        Args:
+            primary_key_value: Value of the primary key (partition key) to search for
+            filters: Optional dictionary containing filter conditions in JSON format.
+                    Supports multiple formats:
+                    - Simple equality: {"status": "active"}
+                    - Operator format: {"age": {"gt": 18}}
+                    - With type hints: {"price": {"value": 19.99, "type": "N", "operator": "ge"}}
+
+                    Supported operators: eq, ne, lt, le, gt, ge, between, in, contains,
+                    begins_with, exists, not_exists
+
+                    Examples:
+                    - {"status": "active", "age": {"gt": 18}}
+                    - {"name": {"begins_with": "John"}}
+                    - {"tags": {"contains": "python"}}
+                    - {"score": {"between": [10, 20]}}
+                    - {"category": {"in": ["tech", "science"]}}
+
+        Yields:
+            Dictionary containing each matching item
+
         Raises:
             ClientError: If there's an error communicating with DynamoDB
             ValueError: If filter format is invalid
         """
         if not primary_key_value:
-            return []
+            return
 
         try:
-            query_params = {
-                'TableName': self.table_name,
-                'KeyConditionExpression': Key(self.primary_key_name).eq(primary_key_value),
-            }
+            query_params = {'TableName': self.table_name}
 
-            # Build filter expression if filters are provided
-            if filters:
-                filter_expression = FilterHelper.build_filter_expression(filters)
-                if filter_expression:
-                    query_params['FilterExpression'] = filter_expression
+            # Key condition and filters are rendered once up front; boto3 would otherwise rebuild them for every page
+            query_params.update(FilterHelper.build_query_params(self.primary_key_name, primary_key_value, filters))
 
-            paginator = self.table.meta.client.get_paginator('query')
-            page_iterator = paginator.paginate(**query_params)
+            page_iterator = self._paginate('query', query_params)
 
-            items = []
             async for page in page_iterator:
-                items.extend(page.get('Items', []))
-
-            return items
+                for item in page.get('Items', []):
+                    yield item
         except ClientError as e:
-            self.logger.error(f'Error in find_all: {e}')
+            self.logger.error(f'Error in find_all_iter: {e}')
             raise
 
-    async def load_all(self, filters: Optional[Dict[str, Any]] = None) -> AsyncGenerator[Dict[str, Any], None]:
+    async def load_all(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        rate_limit_rcu: Optional[float] = None,
+        page_size: Optional[int] = None,
+        projection: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        total_segments: int = 1,
+    ) -> AsyncGenerator[Dict[str, Any], None]:
         """
         Scan and yield all items in the table with optional filtering.
 
@@ -734,6 +1707,20 @@ class AsyncGenericRepository:
         operation that reads the entire table, so use sparingly and prefer query
         operations when possible.
 
+        Items are streamed one page at a time, so memory use stays at about one page
+        (up to 1 MB) regardless of table size. Collecting the results into a list
+        keeps the whole table in memory and can exhaust it on production tables;
+        iterate directly instead. To get a total, use count() (or count(exact=True)),
+        which never transfers item bodies.
+
+        Pass rate_limit_rcu to pace the scan so it does not starve other workloads of
+        read capacity: each page reports its consumed capacity and the scan pauses
+        as needed to stay under the limit, trading total scan time for bounded RCU usage.
+
+        With total_segments above 1, the scan is split into that many segments read
+        concurrently (see load_all_parallel); items from different segments are
+        interleaved and rate_limit_rcu applies to all segments together.
+
         Args:
             filters: Optional dictionary containing filter conditions in JSON format.
                     Supports multiple formats:
@@ -750,33 +1737,124 @@ class AsyncGenericRepository:
                     - {"tags": {"contains": "python"}}
                     - {"score": {"between": [10, 20]}}
                     - {"category": {"in": ["tech", "science"]}}
+            rate_limit_rcu: Optional maximum read capacity units to consume per second
+            page_size: Optional maximum number of items evaluated per Scan request.
+                      Defaults to 100 when rate_limit_rcu is set, so pauses stay short
+            projection: Optional list of attribute names to return. If None, returns
+                       all attributes
+            limit: Optional maximum number of items to yield. The scan stops requesting
+                  pages once it is reached and, without filters, each Scan request
+                  reads at most limit items
+            total_segments: Number of segments to scan concurrently. 1 (default) scans
+                           the table sequentially
 
         Yields:
             Dictionary containing each item in the table that matches the filters
 
         Raises:
             ClientError: If there's an error communicating with DynamoDB
-            ValueError: If filter format is invalid
+            ValueError: If filter format is invalid, or limit or total_segments is less than 1
         """
+        if limit is not None and limit < 1:
+            raise ValueError('limit must be at least 1')
+        if total_segments < 1:
+            raise ValueError('total_segments must be at least 1')
+
         try:
             scan_params = {'TableName': self.table_name}
 
-            # Build filter expression if filters are provided
-            if filters:
-                filter_expression = FilterHelper.build_filter_expression(filters)
-                if filter_expression:
-                    scan_params['FilterExpression'] = filter_expression
-
-            paginator = self.table.meta.client.get_paginator('scan')
-            page_iterator = paginator.paginate(**scan_params)
+            # Render the filter up front; boto3 would otherwise rebuild it for every page
+            scan_params.update(FilterHelper.build_filter_params(filters))
+
+            projection_params = FilterHelper.build_projection_params(projection)
+            if projection_params:
+                scan_params['ProjectionExpression'] = projection_params['ProjectionExpression']
+                scan_params.setdefault('ExpressionAttributeNames', {}).update(
+                    projection_params['ExpressionAttributeNames']
+                )
+
+            pagination_config = {}
+            if limit is not None:
+                pagination_config['MaxItems'] = limit
+                # With filters, Limit counts evaluated items, so capping pages would only add requests
+                if page_size is None and not filters:
+                    page_size = limit
+
+            rate_limiter = None
+            if rate_limit_rcu is not None:
+                rate_limiter = TokenBucket(rate_limit_rcu)
+                scan_params['ReturnConsumedCapacity'] = 'TOTAL'
+                if page_size is None:
+                    page_size = 100
+            if page_size is not None:
+                pagination_config['PageSize'] = page_size
+            if pagination_config:
+                scan_params['PaginationConfig'] = pagination_config
+
+            if total_segments > 1:
+                # Each segment stops at limit on its own; the overall limit is applied here
+                scan_params['TotalSegments'] = total_segments
+                segment_items = self._scan_segments(scan_params, total_segments, rate_limiter)
+                try:
+                    count = 0
+                    async for item in segment_items:
+                        yield item
+                        count += 1
+                        if count == limit:
+                            break
+                finally:
+                    await segment_items.aclose()
+                return
+
+            page_iterator = self._paginate('scan', scan_params)
 
             async for page in page_iterator:
                 for item in page.get('Items', []):
                     yield item
+
+                if rate_limiter:
+                    consumed = page.get('ConsumedCapacity', {}).get('CapacityUnits', 0)
+                    delay = rate_limiter.consume(consumed)
+                    if delay:
+                        await asyncio.sleep(delay)
         except ClientError as e:
             self.logger.error(f'Error in load_all: {e}')
             raise
 
+    async def load_all_parallel(
+        self, total_segments: Optional[int] = None, filters: Optional[Dict[str, Any]] = None
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Scan and yield all items in the table using a parallel (segmented) scan.
+
+        Shorthand for load_all(filters=filters, total_segments=total_segments) that picks
+        the number of segments from the table size when none is given. The segments
+        are read concurrently as asyncio tasks and items are yielded as each page
+        arrives, so items from different segments are interleaved in no particular order.
+
+        A parallel scan finishes faster but consumes read capacity in a burst: every
+        segment reads at the same time. On provisioned tables that also serve live
+        traffic, keep total_segments small.
+
+        Args:
+            total_segments: Number of segments to scan concurrently. If None, uses one
+                           segment per 2 GB of table data (between 1 and 16), based on
+                           the table size reported by DescribeTable
+            filters: Optional dictionary containing filter conditions in JSON format.
+                    Supports the same filter formats as load_all.
+
+        Yields:
+            Dictionary containing each item in the table that matches the filters
+
+        Raises:
+            ClientError: If there's an error communicating with DynamoDB
+            ValueError: If filter format is invalid or total_segments is less than 1
+        """
+        if total_segments is None:
+            total_segments = await self._get_default_scan_segments()
+        async for item in self.load_all(filters=filters, total_segments=total_segments):
+            yield item
+
     # ===========================
     # INDEX-BASED QUERY OPERATIONS
     # ===========================
@@ -787,6 +1865,9 @@ class AsyncGenericRepository:
         """
         Find the first item matching the index query, with optional filtering.
 
+        With cache_size set, found items are cached per (index, key, filters) until any
+        write through this repository or until cache_ttl_seconds pass.
+
         Args:
             index_name: Name of the GSI (Global Secondary Index) or LSI (Local Secondary Index)
             key_name: Name of the index key attribute to query on
@@ -801,18 +1882,40 @@ class AsyncGenericRepository:
             ClientError: If there's an error communicating with DynamoDB
             ValueError: If filter format is invalid
         """
-        items = await self.find_all_with_index(index_name, key_name, key_value, filters)
-        return items[0] if items else None
+        cache_key = self._get_index_cache_key(index_name, key_name, key_value, filters)
+        if cache_key is not None:
+            cached_item = self._index_cache.get(cache_key)
+            if cached_item is not None:
+                return cached_item
+            # Writes clear the index cache, so a lookup overlapping one must not cache its result
+            generation = self._index_cache.generation(cache_key[0])
+
+        # Stop after the first match instead of paging through every matching item
+        items = await self.find_all_with_index(index_name, key_name, key_value, filters, limit=1)
+        item = items[0] if items else None
+        if cache_key is not None and item is not None:
+            self._index_cache.put(cache_key, item, generation)
+        return item
 
     async def find_all_with_index(
-        self, index_name: str, key_name: str, key_value: Any, filters: Optional[Dict[str, Any]] = None
+        self,
+        index_name: str,
+        key_name: str,
+        key_value: Any,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        parallel: bool = False,
     ) -> List[Dict[str, Any]]:
         """
         Find all items matching the index query, with optional filtering.
 
         Uses DynamoDB Query operation on a specified index with automatic pagination
         to retrieve all matching items. Additional filters can be applied to further
-        narrow down the results.
+        narrow down the results. Use find_all_with_index_iter to process items as
+        they arrive instead of collecting them all first.
+
+        With parallel=True, the index is read from both ends of its sort key range at
+        once, as in find_all.
 
         Args:
             index_name: Name of the GSI (Global Secondary Index) or LSI (Local Secondary Index)
@@ -833,60 +1936,226 @@ class AsyncGenericRepository:
                     - {"tags": {"contains": "python"}}
                     - {"score": {"between": [10, 20]}}
                     - {"category": {"in": ["tech", "science"]}}
+            limit: Optional maximum number of items to return. Pagination stops once it
+                  is reached and, without filters, each Query request reads at most
+                  limit items
+            parallel: If True, query both ends of the index key's range concurrently.
+                     Ignored with a limit or for indexes without a sort key
 
         Returns:
             List of dictionaries containing all matching items. Empty list if none found
 
         Raises:
             ClientError: If there's an error communicating with DynamoDB
-            ValueError: If filter format is invalid
+            ValueError: If filter format is invalid or limit is less than 1
+        """
+        if not parallel or limit is not None:
+            return [
+                item async for item in self.find_all_with_index_iter(index_name, key_name, key_value, filters, limit)
+            ]
+
+        try:
+            sort_key_name = await self._get_query_sort_key_name(index_name)
+            if sort_key_name is None:
+                return [item async for item in self.find_all_with_index_iter(index_name, key_name, key_value, filters)]
+
+            query_params = {'TableName': self.table_name, 'IndexName': index_name}
+            query_params.update(FilterHelper.build_query_params(key_name, key_value, filters))
+            # Index sort keys need not be unique, so the halves must strictly cross
+            return await self._query_both_ways(query_params, sort_key_name, unique_sort_keys=False)
+        except ClientError as e:
+            self.logger.error(f'Error in find_all_with_index: {e}')
+            raise
+
+    async def find_all_with_index_iter(
+        self,
+        index_name: str,
+        key_name: str,
+        key_value: Any,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Query an index and yield all matching items, with optional filtering.
+
+        Uses DynamoDB Query operation on a specified index with automatic pagination
+        to retrieve all matching items. Additional filters can be applied to further
+        narrow down the results.
+
+        Items are yielded as each page arrives instead of being collected into a list
+        first, so memory use stays at about one page.
+
+        Args:
+            index_name: Name of the GSI (Global Secondary Index) or LSI (Local Secondary Index)
+            key_name: Name of the index key attribute to query on
+            key_value: Value to search for in the index
+            filters: Optional dictionary containing filter conditions in JSON format.
+                    Supports multiple formats:
+                    - Simple equality: {"status": "active"}
+                    - Operator format: {"age": {"gt": 18}}
+                    - With type hints: {"price": {"value": 19.99, "type": "N", "operator": "ge"}}
+
+                    Supported operators: eq, ne, lt, le, gt, ge, between, in, contains,
+                    begins_with, exists, not_exists
+
+                    Examples:
+                    - {"status": "active", "age": {"gt": 18}}
+                    - {"name": {"begins_with": "John"}}
+                    - {"tags": {"contains": "python"}}
+                    - {"score": {"between": [10, 20]}}
+                    - {"category": {"in": ["tech", "science"]}}
+            limit: Optional maximum number of items to yield. Pagination stops once it
+                  is reached and, without filters, each Query request reads at most
+                  limit items
+
+        Yields:
+            Dictionary containing each matching item
+
+        Raises:
+            ClientError: If there's an error communicating with DynamoDB
+            ValueError: If filter format is invalid or limit is less than 1
         """
+        if limit is not None and limit < 1:
+            raise ValueError('limit must be at least 1')
+
         try:
             query_params = {
                 'TableName': self.table_name,
                 'IndexName': index_name,
-                'KeyConditionExpression': Key(key_name).eq(key_value),
             }
 
-            # Build filter expression if filters are provided
-            if filters:
-                filter_expression = FilterHelper.build_filter_expression(filters)
-                if filter_expression:
-                    query_params['FilterExpression'] = filter_expression
+            # Key condition and filters are rendered once up front; boto3 would otherwise rebuild them for every page
+            query_params.update(FilterHelper.build_query_params(key_name, key_value, filters))
 
-            paginator = self.table.meta.client.get_paginator('query')
-            page_iterator = paginator.paginate(**query_params)
+            if limit is not None:
+                # With filters, Limit counts evaluated items, so only cap the total
+                query_params['PaginationConfig'] = {'MaxItems': limit}
+                if not filters:
+                    query_params['PaginationConfig']['PageSize'] = limit
 
-            items = []
-            async for page in page_iterator:
-                items.extend(page.get('Items', []))
+            page_iterator = self._paginate('query', query_params)
 
-            return items
+            async for page in page_iterator:
+                for item in page.get('Items', []):
+                    yield item
         except ClientError as e:
-            self.logger.error(f'Error in find_all_with_index: {e}')
+            self.logger.error(f'Error in find_all_with_index_iter: {e}')
             raise
 
     # ===========================
     # UTILITY OPERATIONS
     # ===========================
 
-    async def count(self) -> int:
+    async def count(self, exact: bool = False) -> int:
         """
         Count total items in the table.
 
-        Returns the approximate number of items in the table from table metadata.
-        Note: This count is approximate and may not reflect recent changes due to
-        DynamoDB's eventual consistency model.
+        By default returns the approximate number of items in the table from table
+        metadata. Note: This count is approximate (DynamoDB refreshes it roughly every
+        six hours) and may not reflect recent changes. The metadata is fetched at most
+        once every five minutes, so frequent calls don't hit the DescribeTable limit.
+
+        With exact=True, runs a Scan with Select='COUNT' instead. Item data is never
+        transferred, but the scan still reads (and is billed for) the whole table.
+
+        Args:
+            exact: If True, count items with a COUNT scan instead of table metadata
 
         Returns:
-            Approximate number of items in the table
+            Number of items in the table (approximate unless exact=True)
 
         Raises:
             ClientError: If there's an error communicating with DynamoDB
         """
         try:
-            response = await self.table.meta.client.describe_table(TableName=self.table_name)
-            return response['Table']['ItemCount']
+            table_name = self.table_name
+            if not exact:
+                return (await self._describe_table())['ItemCount']
+
+            paginator = self._get_paginator('scan')
+            total = 0
+            async for page in paginator.paginate(TableName=table_name, Select='COUNT'):
+                total += page.get('Count', 0)
+            return total
         except ClientError as e:
             self.logger.error(f'Error counting items: {e}')
             raise
+
+    async def count_by_primary_key(self, primary_key_value: Any, filters: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Count items with the given primary key value, with optional filtering.
+
+        Uses a Query with Select='COUNT', so only the number of matching items is
+        returned instead of the items themselves. For composite key tables, this counts
+        all items with the given partition key across all sort keys.
+
+        Args:
+            primary_key_value: Value of the primary key (partition key) to count
+            filters: Optional dictionary containing filter conditions in JSON format.
+                    Supports the same filter formats as find_all.
+
+        Returns:
+            Number of matching items
+
+        Raises:
+            ClientError: If there's an error communicating with DynamoDB
+            ValueError: If filter format is invalid
+        """
+        if not primary_key_value:
+            return 0
+
+        try:
+            table_name = self.table_name
+            query_params = {
+                'TableName': table_name,
+                'Select': 'COUNT',
+            }
+
+            # Key condition and filters are rendered once up front; boto3 would otherwise rebuild them for every page
+            query_params.update(FilterHelper.build_query_params(self.primary_key_name, primary_key_value, filters))
+
+            paginator = self._get_paginator('query')
+            total = 0
+            async for page in paginator.paginate(**query_params):
+                total += page.get('Count', 0)
+            return total
+        except ClientError as e:
+            self.logger.error(f'Error counting items by primary key: {e}')
+            raise
+
+
+# Shared repositories of get_async_repository, keyed by (table_name, primary_key_name, region_name)
+_shared_repositories: Dict[Tuple[str, str, Optional[str]], AsyncGenericRepository] = {}
+
+
+def get_async_repository(
+    table_name: str, primary_key_name: str, *, region_name: Optional[str] = None
+) -> AsyncGenericRepository:
+    """
+    Return the shared AsyncGenericRepository for a table, creating it on first use.
+
+    The repository is created unconnected: await its connect() once at application
+    startup (on the loop that will use it) and close() at shutdown, so every request
+    reuses the same warm connection pool instead of opening a new one.
+
+    Args:
+        table_name: Name of the DynamoDB table
+        primary_key_name: Name of the primary key attribute (partition key)
+        region_name: AWS region name (optional, uses default if not provided)
+
+    Returns:
+        The same repository instance for every call with the same table, key and
+        region, however the arguments are passed
+
+    Example:
+        >>> repo = await get_async_repository('my-table', 'id').connect()
+        >>> item = await get_async_repository('my-table', 'id').load('key1')
+    """
+    key = (table_name, primary_key_name, region_name)
+    repository = _shared_repositories.get(key)
+    if repository is None:
+        repository = _shared_repositories.setdefault(
+            key,
+            AsyncGenericRepository(table_name=table_name, primary_key_name=primary_key_name, region_name=region_name),
+        )
+    return repository
@@ -5,10 +5,27 @@ This module provides filtering functionality that can be shared between
 sync and async repository implementations.
 """
 
+import functools
 from decimal import Decimal
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Mapping, Optional, Union
 
-from boto3.dynamodb.conditions import Attr
+from boto3.dynamodb.conditions import Attr, ConditionExpressionBuilder
+
+# Operators that map directly onto a single-value Attr method
+_COMPARISON_OPERATORS = {
+    'eq': Attr.eq,
+    'ne': Attr.ne,
+    'lt': Attr.lt,
+    'le': Attr.lte,
+    'gt': Attr.gt,
+    'ge': Attr.gte,
+    'contains': Attr.contains,
+    'begins_with': Attr.begins_with,
+}
+
+
+# Decimals are immutable, so the small ints that dominate filters are converted once
+_SMALL_INT_DECIMALS = tuple(Decimal(i) for i in range(-128, 128))
 
 
 class FilterHelper:
@@ -34,7 +51,7 @@ class FilterHelper:
         """
         if explicit_type:
             if explicit_type == 'N' and isinstance(value, (int, float)):
-                return Decimal(str(value))
+                return _number_to_decimal(value)
             elif explicit_type == 'S':
                 return str(value)
             elif explicit_type == 'BOOL':
@@ -42,18 +59,7 @@ class FilterHelper:
             # Add other explicit type conversions as needed
 
         # Auto-detect type
-        if isinstance(value, bool):
-            return value
-        elif isinstance(value, (int, float)):
-            return Decimal(str(value))
-        elif isinstance(value, str):
-            return value
-        elif isinstance(value, list):
-            return [FilterHelper.convert_value_to_dynamodb_type(v) for v in value]
-        elif isinstance(value, dict):
-            return {k: FilterHelper.convert_value_to_dynamodb_type(v) for k, v in value.items()}
-        else:
-            return str(value)
+        return _convert_value(value)
 
     @staticmethod
     def build_filter_expression(filters: Dict[str, Any]) -> Optional[Any]:
@@ -100,6 +106,17 @@ class FilterHelper:
         if not filters:
             return None
 
+        # Filters are usually literals repeated across calls, so the built condition is
+        # cached by content; condition objects are never mutated, so sharing them is safe
+        try:
+            frozen_filters = _freeze(filters)
+        except TypeError:
+            return FilterHelper._build_filter_expression(filters)
+        return _build_filter_expression_cached(frozen_filters)
+
+    @staticmethod
+    def _build_filter_expression(filters: Mapping[str, Any]) -> Optional[Any]:
+        """Build the FilterExpression for build_filter_expression without caching."""
         filter_expressions = []
 
         for attr_name, condition in filters.items():
@@ -124,18 +141,9 @@ class FilterHelper:
                     value = FilterHelper.convert_value_to_dynamodb_type(value, explicit_type)
 
                 # Build the filter expression based on operator
-                if operator == 'eq':
-                    filter_expressions.append(Attr(attr_name).eq(value))
-                elif operator == 'ne':
-                    filter_expressions.append(Attr(attr_name).ne(value))
-                elif operator == 'lt':
-                    filter_expressions.append(Attr(attr_name).lt(value))
-                elif operator == 'le':
-                    filter_expressions.append(Attr(attr_name).lte(value))
-                elif operator == 'gt':
-                    filter_expressions.append(Attr(attr_name).gt(value))
-                elif operator == 'ge':
-                    filter_expressions.append(Attr(attr_name).gte(value))
+                comparison = _COMPARISON_OPERATORS.get(operator)
+                if comparison is not None:
+                    filter_expressions.append(comparison(Attr(attr_name), value))
                 elif operator == 'between':
                     if isinstance(value, list) and len(value) == 2:
                         filter_expressions.append(Attr(attr_name).between(value[0], value[1]))
@@ -146,10 +154,6 @@ class FilterHelper:
                         filter_expressions.append(Attr(attr_name).is_in(value))
                     else:
                         raise ValueError("'in' operator requires a list of values")
-                elif operator == 'contains':
-                    filter_expressions.append(Attr(attr_name).contains(value))
-                elif operator == 'begins_with':
-                    filter_expressions.append(Attr(attr_name).begins_with(value))
                 elif operator == 'exists':
                     filter_expressions.append(Attr(attr_name).exists())
                 elif operator == 'not_exists':
@@ -161,13 +165,187 @@ class FilterHelper:
                 value = FilterHelper.convert_value_to_dynamodb_type(condition)
                 filter_expressions.append(Attr(attr_name).eq(value))
 
-        # Combine all filter expressions with AND logic
-        if len(filter_expressions) == 1:
-            return filter_expressions[0]
-        elif len(filter_expressions) > 1:
-            result = filter_expressions[0]
-            for expr in filter_expressions[1:]:
-                result = result & expr
-            return result
+        # Combine all filter expressions with AND logic, pairing neighbours so the tree
+        # stays balanced (log n deep) instead of one nested And per attribute
+        if not filter_expressions:
+            return None
+        while len(filter_expressions) > 1:
+            paired = [left & right for left, right in zip(filter_expressions[::2], filter_expressions[1::2])]
+            if len(filter_expressions) % 2:
+                paired.append(filter_expressions[-1])
+            filter_expressions = paired
+        return filter_expressions[0]
+
+    @staticmethod
+    def build_filter_params(filters: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Convert JSON filters to ready-to-send FilterExpression request parameters.
+
+        Unlike build_filter_expression, the condition is rendered here into the final
+        expression string plus its placeholder maps, so boto3 does not have to build it
+        again for every request (or every page of a paginated scan). This also makes the parameters safe to share between
+        threads: boto3 keeps a single, stateful expression builder per client.
+
+        Args:
+            filters: Dictionary containing filter conditions (same formats as
+                    build_filter_expression)
+
+        Returns:
+            Dictionary with FilterExpression, ExpressionAttributeNames and (when the
+            filter has values) ExpressionAttributeValues, or an empty dict if no filters
+        """
+        if not filters:
+            return {}
+
+        # Rendering walks the whole condition tree, so the result is cached like the tree itself
+        try:
+            rendered = _build_filter_params_cached(_freeze(filters))
+        except TypeError:
+            rendered = _render_filter_expression(FilterHelper._build_filter_expression(filters))
+        if rendered is None:
+            return {}
+
+        # Fresh dicts per call: callers merge their own placeholders into them
+        condition_expression, attribute_names, attribute_values = rendered
+        params = {
+            'FilterExpression': condition_expression,
+            'ExpressionAttributeNames': dict(attribute_names),
+        }
+        if attribute_values:
+            params['ExpressionAttributeValues'] = dict(attribute_values)
+        return params
+
+    @staticmethod
+    def build_query_params(key_name: str, key_value: Any, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Build ready-to-send parameters for a Query on key_name = key_value, plus optional filters.
+
+        The key condition uses its own placeholders (#k0, :k0), so it shares one set of
+        placeholder maps with the rendered filter (#n*, :v*) and boto3 has nothing left
+        to build for any page of the query.
+
+        Args:
+            key_name: Name of the partition key attribute to match
+            key_value: Partition key value to match
+            filters: Optional dictionary containing filter conditions (same formats as
+                    build_filter_expression)
+
+        Returns:
+            Dictionary with KeyConditionExpression, ExpressionAttributeNames,
+            ExpressionAttributeValues and, if filters are given, FilterExpression
+        """
+        params = FilterHelper.build_filter_params(filters)
+        params['KeyConditionExpression'] = '#k0 = :k0'
+        params.setdefault('ExpressionAttributeNames', {})['#k0'] = key_name
+        params.setdefault('ExpressionAttributeValues', {})[':k0'] = key_value
+        return params
+
+    @staticmethod
+    def build_projection_params(projection: Optional[List[str]]) -> Dict[str, Any]:
+        """
+        Convert a list of attribute names to ProjectionExpression request parameters.
 
+        Every name is replaced by a placeholder (#p0, #p1, ...) so reserved words
+        such as 'name' or 'status' can be projected without escaping.
+
+        Args:
+            projection: List of top-level attribute names to return
+
+        Returns:
+            Dictionary with ProjectionExpression and ExpressionAttributeNames,
+            or an empty dict if no projection is given
+
+        Examples:
+            ['id', 'name'] -> {'ProjectionExpression': '#p0, #p1',
+                               'ExpressionAttributeNames': {'#p0': 'id', '#p1': 'name'}}
+        """
+        if not projection:
+            return {}
+
+        names = {f'#p{i}': attr_name for i, attr_name in enumerate(projection)}
+        return {'ProjectionExpression': ', '.join(names), 'ExpressionAttributeNames': names}
+
+
+def _number_to_decimal(value: Union[int, float]) -> Decimal:
+    """Convert an int or float to Decimal without formatting ints as strings first."""
+    if isinstance(value, int):
+        value = int(value)
+        if -128 <= value < 128:
+            return _SMALL_INT_DECIMALS[value + 128]
+        return Decimal(value)
+    return Decimal(repr(float(value)))
+
+
+def _convert_value(value: Any) -> Any:
+    """
+    Auto-detect conversion for convert_value_to_dynamodb_type.
+
+    Nested values recurse into this function directly rather than through the public
+    method, so each level skips the class attribute lookup and explicit type checks.
+    """
+    if isinstance(value, bool):
+        return value
+    elif isinstance(value, (int, float)):
+        return _number_to_decimal(value)
+    elif isinstance(value, str):
+        return value
+    elif isinstance(value, list):
+        return [_convert_value(v) for v in value]
+    elif isinstance(value, dict):
+        return {k: _convert_value(v) for k, v in value.items()}
+    else:
+        return str(value)
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Convert filters into a hashable cache key.
+
+    Scalars are tagged with their type so that values which compare equal across
+    types (True, 1 and 1.0) don't share a cache entry.
+
+    Raises:
+        TypeError: If a value is not hashable
+    """
+    if isinstance(value, Mapping):
+        return ('dict', tuple((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, list):
+        return ('list', tuple(_freeze(item) for item in value))
+    if isinstance(value, tuple):
+        return ('tuple', tuple(_freeze(item) for item in value))
+    hash(value)
+    return (type(value), value)
+
+
+def _thaw(frozen: Any) -> Any:
+    """Rebuild the filters dictionary from a _freeze key."""
+    tag, value = frozen
+    if tag == 'dict':
+        return {key: _thaw(item) for key, item in value}
+    if tag == 'list':
+        return [_thaw(item) for item in value]
+    if tag == 'tuple':
+        return tuple(_thaw(item) for item in value)
+    return value
+
+
+@functools.lru_cache(maxsize=256)
+def _build_filter_expression_cached(frozen_filters: Any) -> Optional[Any]:
+    return FilterHelper._build_filter_expression(_thaw(frozen_filters))
+
+
+def _render_filter_expression(filter_expression: Optional[Any]) -> Optional[tuple]:
+    """Render a condition into (expression, name placeholder items, value placeholder items)."""
+    if filter_expression is None:
         return None
+    built = ConditionExpressionBuilder().build_expression(filter_expression)
+    return (
+        built.condition_expression,
+        tuple(built.attribute_name_placeholders.items()),
+        tuple(built.attribute_value_placeholders.items()),
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _build_filter_params_cached(frozen_filters: Any) -> Optional[tuple]:
+    return _render_filter_expression(_build_filter_expression_cached(frozen_filters))
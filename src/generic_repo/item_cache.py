@@ -0,0 +1,163 @@
+"""
+Item cache for DynamoDB repositories.
+
+This module provides an in-process LRU cache of loaded items that can be shared
+between sync and async repository implementations.
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Set, Tuple
+
+
+class ItemCache:
+    """
+    Bounded LRU cache of items keyed by their table key.
+
+    Keys are (partition_key_value, sort_key_items) tuples so every cached item of a
+    partition can be dropped at once when a write touches that partition. Items are
+    copied on the way in and out, so callers can modify the returned dictionaries
+    without corrupting the cache.
+
+    Each partition also has an invalidation generation. A reader captures it before
+    going to DynamoDB and passes it to put, which then skips items whose partition was
+    invalidated while the read was in flight instead of caching the pre-write item.
+    """
+
+    def __init__(self, maxsize: int, ttl_seconds: Optional[float] = None):
+        """
+        Initialize the item cache.
+
+        Args:
+            maxsize: Maximum number of items kept; the least recently used is evicted first
+            ttl_seconds: Optional number of seconds an item stays valid after it is cached.
+                        If None, items stay until evicted or invalidated
+
+        Raises:
+            ValueError: If maxsize or ttl_seconds is not positive
+        """
+        if maxsize <= 0:
+            raise ValueError('maxsize must be positive')
+        if ttl_seconds is not None and ttl_seconds <= 0:
+            raise ValueError('ttl_seconds must be positive')
+
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: 'OrderedDict[Tuple[Hashable, tuple], Tuple[Dict[str, Any], Optional[float]]]' = OrderedDict()
+        self._partitions: Dict[Hashable, Set[Tuple[Hashable, tuple]]] = {}
+        # Generation of the most recently invalidated partitions; any other partition is at
+        # _base_generation, which covers clear() and partitions dropped from this bounded map
+        self._generations: 'OrderedDict[Hashable, int]' = OrderedDict()
+        self._base_generation = 0
+        self._last_generation = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[Hashable, tuple]) -> Optional[Dict[str, Any]]:
+        """
+        Return a copy of the cached item, or None if it is missing or expired.
+
+        Args:
+            key: Cache key as (partition_key_value, sort_key_items)
+
+        Returns:
+            Copy of the cached item, or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            item, expires_at = entry
+            if expires_at is not None and time.monotonic() >= expires_at:
+                self._remove(key)
+                return None
+
+            self._entries.move_to_end(key)
+            return copy.deepcopy(item)
+
+    def generation(self, partition_value: Any) -> int:
+        """
+        Return the invalidation generation of a partition, to be passed to put.
+
+        Args:
+            partition_value: Partition (primary) key value about to be read
+
+        Returns:
+            Number that changes whenever the partition is invalidated or the cache is cleared
+        """
+        with self._lock:
+            return self._get_generation(partition_value)
+
+    def put(self, key: Tuple[Hashable, tuple], item: Dict[str, Any], generation: Optional[int] = None) -> None:
+        """
+        Cache a copy of an item, evicting the least recently used item if full.
+
+        Args:
+            key: Cache key as (partition_key_value, sort_key_items)
+            item: Item data as returned by DynamoDB
+            generation: Optional generation captured with generation() before the item was
+                       read. If the partition was invalidated since, the item is not cached
+        """
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds is not None else None
+        with self._lock:
+            if generation is not None and generation != self._get_generation(key[0]):
+                return
+            self._entries[key] = (copy.deepcopy(item), expires_at)
+            self._entries.move_to_end(key)
+            self._partitions.setdefault(key[0], set()).add(key)
+
+            while len(self._entries) > self.maxsize:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate_partition(self, partition_value: Any) -> None:
+        """
+        Drop every cached item with the given partition key value.
+
+        Args:
+            partition_value: Partition (primary) key value whose items changed
+        """
+        with self._lock:
+            try:
+                keys = self._partitions.pop(partition_value, ())
+            except TypeError:
+                # Unhashable values can never have been cached
+                return
+            for key in keys:
+                self._entries.pop(key, None)
+
+            self._last_generation += 1
+            self._generations[partition_value] = self._last_generation
+            self._generations.move_to_end(partition_value)
+            while len(self._generations) > self.maxsize:
+                # Forgotten partitions fall back to the base generation, which is at least as new
+                _, self._base_generation = self._generations.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached item."""
+        with self._lock:
+            self._entries.clear()
+            self._partitions.clear()
+            self._generations.clear()
+            self._last_generation += 1
+            self._base_generation = self._last_generation
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _get_generation(self, partition_value: Any) -> int:
+        """Return the invalidation generation of a partition (lock must be held)."""
+        try:
+            return self._generations.get(partition_value, self._base_generation)
+        except TypeError:
+            return self._base_generation
+
+    def _remove(self, key: Tuple[Hashable, tuple]) -> None:
+        """Remove one entry and its partition index reference (lock must be held)."""
+        self._entries.pop(key, None)
+        keys = self._partitions.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._partitions[key[0]]
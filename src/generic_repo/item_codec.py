@@ -0,0 +1,236 @@
+"""
+Item codec for DynamoDB repositories.
+
+This module converts items between Python values and DynamoDB's wire format
+(attribute values such as {'S': 'text'}) for requests sent through a low-level
+client. It can be shared between sync and async repository implementations.
+"""
+
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Tuple
+
+from boto3.dynamodb.types import DYNAMODB_CONTEXT, Binary, TypeDeserializer, TypeSerializer
+
+# Less common types (sets, binary, ...) are handed to boto3 so results match the resource exactly
+_TYPE_SERIALIZER = TypeSerializer()
+_TYPE_DESERIALIZER = TypeDeserializer()
+_create_decimal = DYNAMODB_CONTEXT.create_decimal
+
+# Values that the repositories' _serialize_for_dynamodb passes through unchanged
+_DYNAMODB_READY_TYPES = frozenset({str, int, bool, Decimal, type(None)})
+
+
+def _is_dynamodb_ready(data: Dict[str, Any]) -> bool:
+    """
+    Check whether data already holds only DynamoDB-compatible values.
+
+    Walks nested dicts and lists iteratively and stops at the first value that would
+    need converting (float, tuple, datetime, a non-string key, a subclass, ...).
+
+    Args:
+        data: Dictionary about to be serialized
+
+    Returns:
+        True if serializing data would not change anything
+    """
+    stack = [data]
+    pop = stack.pop
+    extend = stack.extend
+    while stack:
+        value = pop()
+        value_type = type(value)
+        if value_type in _DYNAMODB_READY_TYPES:
+            continue
+        if value_type is dict:
+            for key in value:
+                if type(key) is not str:
+                    return False
+            extend(value.values())
+        elif value_type is list:
+            extend(value)
+        else:
+            return False
+    return True
+
+
+def _sort_key_value(value: Any) -> Any:
+    """Return a sort key value in a comparable form (boto3's Binary does not support ordering)."""
+    return value.value if isinstance(value, Binary) else value
+
+
+def _dedupe_write_requests(write_requests: List[Dict[str, Any]], key_names: List[str]) -> List[Dict[str, Any]]:
+    """
+    Keep only the last PutRequest/DeleteRequest for each table key.
+
+    Batch chunks are written concurrently, so a key repeated across chunks would
+    otherwise end up with whichever chunk happened to land last.
+
+    Args:
+        write_requests: PutRequest/DeleteRequest entries in the order they were given
+        key_names: Table key attribute names
+
+    Returns:
+        The entries with earlier duplicates of a key removed
+    """
+    unique_requests = {}
+    for index, write_request in enumerate(write_requests):
+        request = write_request.get('PutRequest') or write_request.get('DeleteRequest') or {}
+        key_data = request.get('Item') or request.get('Key') or {}
+        key = tuple(key_data.get(name) for name in key_names)
+        try:
+            # Re-inserting moves the key to its last position, keeping the given order
+            unique_requests.pop(key, None)
+            unique_requests[key] = write_request
+        except TypeError:
+            # Unhashable key values are rejected by DynamoDB; leave them to report it
+            unique_requests[(index,)] = write_request
+    return list(unique_requests.values())
+
+
+# Python types accepted for each DynamoDB type declared in a save_batch_uniform schema
+_SCHEMA_TYPES = {
+    'S': (str,),
+    'N': (int, float, Decimal),
+    'BOOL': (bool,),
+    'B': (bytes, bytearray, Binary),
+    'M': (dict,),
+    'L': (list,),
+    'SS': (set, frozenset),
+    'NS': (set, frozenset),
+    'BS': (set, frozenset),
+}
+_SCHEMA_SET_MEMBER_TYPES = {
+    'SS': (str,),
+    'NS': (int, float, Decimal),
+    'BS': (bytes, bytearray, Binary),
+}
+
+
+def _build_schema_converters(
+    schema: Dict[str, str], convert_nested: Callable[[Any], Any]
+) -> List[Tuple[str, Callable[[Any], Any]]]:
+    """
+    Resolve a column schema to one checking converter per attribute.
+
+    Values are checked against their declared type, never coerced: a string under 'N'
+    or 'BOOL', a None anywhere or a set with members of the wrong type raises instead
+    of being written as something else. Floats are only turned into Decimal.
+
+    Args:
+        schema: Mapping of attribute name to DynamoDB type ('S', 'N', 'BOOL', 'B',
+               'M', 'L', 'SS', 'NS', 'BS')
+        convert_nested: Converter applied to map and list values (the repository's
+                       _to_dynamodb_value)
+
+    Returns:
+        List of (attribute_name, converter) pairs
+
+    Raises:
+        ValueError: If a type in the schema is not supported
+    """
+    unsupported = [type_name for type_name in schema.values() if type_name not in _SCHEMA_TYPES]
+    if unsupported:
+        raise ValueError(f'Unsupported schema types: {unsupported}')
+    return [
+        (attr_name, _schema_converter(attr_name, type_name, convert_nested)) for attr_name, type_name in schema.items()
+    ]
+
+
+def _schema_converter(attr_name: str, type_name: str, convert_nested: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """Build the checking converter of one schema attribute."""
+    allowed_types = _SCHEMA_TYPES[type_name]
+    member_types = _SCHEMA_SET_MEMBER_TYPES.get(type_name)
+
+    def convert(value: Any) -> Any:
+        if type(value) not in allowed_types:
+            raise TypeError(f"Attribute '{attr_name}' must be of type {type_name}, got {type(value).__name__}")
+        if member_types is not None:
+            if not value or any(type(member) not in member_types for member in value):
+                raise TypeError(f"Attribute '{attr_name}' must be a non-empty set of {type_name[0]} values")
+            if type_name == 'NS':
+                return {Decimal(repr(member)) if type(member) is float else member for member in value}
+        elif type_name == 'N':
+            return Decimal(repr(value)) if type(value) is float else value
+        elif type_name == 'M' or type_name == 'L':
+            return convert_nested(value)
+        return value
+
+    return convert
+
+
+class ItemCodec:
+    """
+    Converter between Python items and DynamoDB attribute values.
+
+    Produces the same values as boto3's TypeSerializer/TypeDeserializer, which the
+    resource API runs on every request, but checks the common types (strings, numbers,
+    booleans, None, maps and lists) with a short chain of exact type comparisons
+    instead of boto3's per-attribute method lookups. Numbers are deserialized as
+    Decimal, as with the resource API.
+    """
+
+    @staticmethod
+    def serialize_item(item: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Convert a Python item to a map of DynamoDB attribute values.
+
+        Args:
+            item: Dictionary of attribute names to Python values
+
+        Returns:
+            Dictionary of attribute names to attribute values
+
+        Raises:
+            TypeError: If a value can't be stored in DynamoDB (e.g. a float)
+        """
+        return {key: _serialize(value) for key, value in item.items()}
+
+    @staticmethod
+    def deserialize_item(item: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Convert a map of DynamoDB attribute values to a Python item.
+
+        Args:
+            item: Dictionary of attribute names to attribute values, as returned by the client
+
+        Returns:
+            Dictionary of attribute names to Python values
+        """
+        return {key: _deserialize(value) for key, value in item.items()}
+
+
+def _serialize(value: Any) -> Dict[str, Any]:
+    """Convert a single value (recursively) to an attribute value."""
+    value_type = type(value)
+    if value_type is str:
+        return {'S': value}
+    if value_type is bool:
+        return {'BOOL': value}
+    if value_type is int or value_type is Decimal:
+        number = str(_create_decimal(value))
+        if number in ('Infinity', 'NaN'):
+            raise TypeError('Infinity and NaN not supported')
+        return {'N': number}
+    if value is None:
+        return {'NULL': True}
+    if value_type is dict:
+        return {'M': {key: _serialize(item) for key, item in value.items()}}
+    if value_type is list:
+        return {'L': [_serialize(item) for item in value]}
+    return _TYPE_SERIALIZER.serialize(value)
+
+
+def _deserialize(value: Dict[str, Any]) -> Any:
+    """Convert a single attribute value (recursively) to a Python value."""
+    type_name, data = next(iter(value.items()))
+    if type_name == 'S' or type_name == 'BOOL':
+        return data
+    if type_name == 'N':
+        return _create_decimal(data)
+    if type_name == 'M':
+        return {key: _deserialize(item) for key, item in data.items()}
+    if type_name == 'L':
+        return [_deserialize(item) for item in data]
+    if type_name == 'NULL':
+        return None
+    return _TYPE_DESERIALIZER.deserialize(value)
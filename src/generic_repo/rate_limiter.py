@@ -0,0 +1,61 @@
+"""
+Rate limiting helpers for DynamoDB repositories.
+
+This module provides a token bucket that can be shared between sync and async
+repository implementations to keep read/write capacity consumption bounded.
+"""
+
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """
+    Token bucket for pacing capacity consumption.
+
+    DynamoDB only reports consumed capacity after a request completes, so the
+    bucket is allowed to go into debt: consume() always succeeds and returns how
+    long the caller should wait before sending the next request. The bucket does
+    not sleep itself, so the same instance works with time.sleep and asyncio.sleep.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Initialize the token bucket.
+
+        Args:
+            rate: Tokens (capacity units) refilled per second
+            capacity: Maximum number of tokens that can accumulate while idle.
+                     Defaults to one second worth of tokens (rate)
+
+        Raises:
+            ValueError: If rate or capacity is not positive
+        """
+        if rate <= 0:
+            raise ValueError('rate must be positive')
+        if capacity is not None and capacity <= 0:
+            raise ValueError('capacity must be positive')
+
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+
+    def consume(self, tokens: float) -> float:
+        """
+        Take tokens from the bucket.
+
+        Args:
+            tokens: Number of tokens (capacity units) that were consumed
+
+        Returns:
+            Number of seconds to wait before the next request (0 if none)
+        """
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+        self._tokens -= tokens
+
+        if self._tokens >= 0:
+            return 0.0
+        return -self._tokens / self.rate
@@ -5,6 +5,7 @@ This module contains comprehensive tests for the GenericRepository class,
 including unit tests with mocked DynamoDB operations.
 """
 
+import asyncio
 import logging
 from decimal import Decimal
 from unittest.mock import AsyncMock, Mock, patch
@@ -12,7 +13,7 @@ from unittest.mock import AsyncMock, Mock, patch
 import pytest
 import pytest_asyncio
 from botocore.exceptions import ClientError
-from generic_repo import AsyncGenericRepository, GenericRepository
+from generic_repo import AsyncGenericRepository, GenericRepository, get_async_repository
 
 # ===========================
 # SHARED TEST UTILITIES
@@ -53,7 +54,10 @@ def mock_table():
     table = Mock()
     table.table_name = 'test-table'
     table.meta.client.get_paginator.return_value.paginate.return_value = []
-    table.meta.client.describe_table.return_value = {'Table': {'ItemCount': 5}}
+    table.meta.client.describe_table.return_value = {
+        'Table': {'ItemCount': 5, 'KeySchema': [{'AttributeName': 'id', 'KeyType': 'HASH'}]}
+    }
+    table.meta.client.batch_write_item.return_value = {'UnprocessedItems': {}}
     return table
 
 
@@ -98,11 +102,21 @@ def async_mock_table():
     # Set up the meta.client as a regular Mock
     table.meta.client = Mock()
     table.meta.client.get_paginator.return_value = mock_paginator
-    table.meta.client.describe_table = AsyncMock(return_value={'Table': {'ItemCount': 5}})
+    table.meta.client.describe_table = AsyncMock(
+        return_value={'Table': {'ItemCount': 5, 'KeySchema': [{'AttributeName': 'id', 'KeyType': 'HASH'}]}}
+    )
+    table.meta.client.batch_write_item = AsyncMock(return_value={'UnprocessedItems': {}})
 
     return table
 
 
+@pytest.fixture(autouse=True)
+def reset_default_aioboto3_session():
+    """Keep the shared default aioboto3 session from carrying mocks across tests."""
+    with patch('src.async_repo._default_session', None):
+        yield
+
+
 @pytest.fixture
 def mock_aioboto3_session(async_mock_table):
     """Create a mock aioboto3 session for testing."""
@@ -159,6 +173,53 @@ class TestGenericRepository:
         assert result['string'] == 'test'
         assert result['number'] == 123
 
+    def test_serialize_for_dynamodb_nested_values(self, sync_repo):
+        """Test serialization converts nested values and keeps Decimals as numbers."""
+        import datetime
+
+        data = {
+            'price': Decimal('19.99'),
+            'nested': {'ratio': 0.5, 'values': (1, 2.25)},
+            'created': datetime.datetime(2024, 1, 1),
+        }
+
+        result = sync_repo._serialize_for_dynamodb(data)
+
+        assert result['price'] == Decimal('19.99')
+        assert result['nested'] == {'ratio': Decimal('0.5'), 'values': [1, Decimal('2.25')]}
+        assert result['created'] == '2024-01-01 00:00:00'
+
+    def test_serialize_for_dynamodb_returns_compatible_data_as_is(self, sync_repo):
+        """Test already-compatible data skips conversion, while one float still converts everything."""
+        data = {'name': 'Test', 'count': 3, 'active': True, 'tags': ['a', {'price': Decimal('1.5')}], 'note': None}
+
+        assert sync_repo._serialize_for_dynamodb(data) is data
+
+        data['tags'][1]['ratio'] = 0.5
+        result = sync_repo._serialize_for_dynamodb(data)
+
+        assert result is not data
+        assert result['tags'][1] == {'price': Decimal('1.5'), 'ratio': Decimal('0.5')}
+
+    def test_save_batch_expiration_does_not_modify_models(self, mock_dynamodb_resource, mock_table):
+        """Test save_batch adds the expiration to a new item even when the model needs no conversion."""
+        repo = GenericRepository(table_name='test-table', primary_key_name='id', region_name='us-east-1', data_expiration_days=30)
+        model = {'id': 'item1', 'name': 'Item 1'}
+
+        repo.save_batch([model], set_expiration=True)
+
+        assert model == {'id': 'item1', 'name': 'Item 1'}
+        request = mock_table.meta.client.batch_write_item.call_args.kwargs['RequestItems']['test-table'][0]
+        assert '_expireAt' in request['PutRequest']['Item']
+
+        float_model = {'id': 'item2', 'price': 1.5}
+        repo.save_batch([float_model], set_expiration=True)
+
+        assert float_model == {'id': 'item2', 'price': 1.5}
+        request = mock_table.meta.client.batch_write_item.call_args.kwargs['RequestItems']['test-table'][0]
+        assert request['PutRequest']['Item']['price'] == Decimal('1.5')
+        assert '_expireAt' in request['PutRequest']['Item']
+
     def test_get_expire_at_epoch(self, sync_repo):
         """Test expiration timestamp generation."""
         import time
@@ -170,6 +231,22 @@ class TestGenericRepository:
         expected_expire = now + (24 * 60 * 60)
         assert abs(expire_at - expected_expire) < 60  # Within 1 minute
 
+    def test_save_batch_computes_expiration_once(self, mock_dynamodb_resource, mock_table):
+        """Test save_batch stamps every item with one expiration computed per batch."""
+        repo = GenericRepository(table_name='test-table', primary_key_name='id', region_name='us-east-1', data_expiration_days=30)
+        models = [{'id': f'item{i}'} for i in range(30)]
+
+        with patch.object(repo, '_get_expire_at_epoch', wraps=repo._get_expire_at_epoch) as mock_expire:
+            repo.save_batch(models, set_expiration=True)
+
+        mock_expire.assert_called_once_with(30)
+        expire_values = {
+            request['PutRequest']['Item']['_expireAt']
+            for call in mock_table.meta.client.batch_write_item.call_args_list
+            for request in call.kwargs['RequestItems']['test-table']
+        }
+        assert len(expire_values) == 1
+
     def test_load(self, sync_repo, mock_table):
         """Test loading an item."""
         mock_table.get_item.return_value = {'Item': {'id': 'test', 'name': 'Test Item'}}
@@ -201,6 +278,21 @@ class TestGenericRepository:
         assert call_args['name'] == 'Test Item'
         assert call_args['value'] == 42
 
+    def test_save_returns_written_item(self, sync_repo, mock_table):
+        """Test save returns the item it wrote without reading it back."""
+        model = {'name': 'Test Item', 'price': 1.5, 'count': 3, 'tags': ['a']}
+
+        result = sync_repo.save('test', model)
+
+        assert result == {'id': 'test', 'name': 'Test Item', 'price': Decimal('1.5'), 'count': 3, 'tags': ['a']}
+        assert result == mock_table.put_item.call_args[1]['Item']
+        mock_table.get_item.assert_not_called()
+
+        # Numbers come back as Decimal, as load returns them, and nothing is shared with the model
+        assert type(result['count']) is Decimal
+        result['tags'].append('b')
+        assert model['tags'] == ['a']
+
     def test_save_debug_mode(self, mock_dynamodb_resource, mock_table):
         """Test saving in debug mode."""
         debug_repo = GenericRepository(table_name='test-table', primary_key_name='id', region_name='us-east-1', debug_mode=True)
@@ -211,6 +303,31 @@ class TestGenericRepository:
         mock_table.put_item.assert_not_called()
         assert result is None
 
+    def test_debug_mode_writes_skip_all_processing(self, mock_dynamodb_resource, mock_table):
+        """Test debug mode returns from every write before serialization or expiration work."""
+        debug_repo = GenericRepository(
+            table_name='test-table', primary_key_name='id', region_name='us-east-1', data_expiration_days=30, debug_mode=True
+        )
+
+        with patch.object(debug_repo, '_serialize_for_dynamodb') as mock_serialize, patch.object(
+            debug_repo, '_get_expire_at_epoch'
+        ) as mock_expire, patch.object(debug_repo, '_build_update_expression') as mock_build_update:
+            assert debug_repo.save('test', {'name': 'Test'}, set_expiration=True) is None
+            assert debug_repo.save_with_composite_key({'id': 'test', 'sk': 'a'}, set_expiration=True) is None
+            assert debug_repo.update('test', {'name': 'Test'}, set_expiration=True) is None
+            assert debug_repo.update_by_composite_key({'id': 'test', 'sk': 'a'}, {'name': 'Test'}) is None
+            debug_repo.save_batch([{'id': 'test'}], set_expiration=True)
+            # Not even the schema is resolved, so an unsupported type goes unnoticed
+            debug_repo.save_batch_uniform([{'id': 'test'}], {'id': 'X'}, set_expiration=True)
+            debug_repo.delete_by_composite_key({'id': 'test', 'sk': 'a'})
+            debug_repo.delete_batch_by_keys([{'id': 'test'}])
+            debug_repo.delete_all_by_primary_key('test')
+
+        mock_serialize.assert_not_called()
+        mock_expire.assert_not_called()
+        mock_build_update.assert_not_called()
+        assert mock_table.mock_calls == []
+
     def test_save_with_expiration(self, mock_dynamodb_resource, mock_table):
         """Test saving with expiration."""
         repo_with_expiration = GenericRepository(table_name='test-table', primary_key_name='id', region_name='us-east-1', data_expiration_days=30)
@@ -226,18 +343,67 @@ class TestGenericRepository:
         """Test batch saving."""
         models = [{'id': 'item1', 'name': 'Item 1'}, {'id': 'item2', 'name': 'Item 2'}]
 
-        mock_batch_writer = Mock()
-        # Properly mock the context manager
-        mock_context_manager = Mock()
-        mock_context_manager.__enter__ = Mock(return_value=mock_batch_writer)
-        mock_context_manager.__exit__ = Mock(return_value=None)
-        mock_table.batch_writer.return_value = mock_context_manager
-
         sync_repo.save_batch(models)
 
-        # Verify batch_writer was used
-        mock_table.batch_writer.assert_called_once()
-        assert mock_batch_writer.put_item.call_count == 2
+        # Verify a single BatchWriteItem request carried both items
+        mock_table.meta.client.batch_write_item.assert_called_once_with(
+            RequestItems={'test-table': [{'PutRequest': {'Item': model}} for model in models]}
+        )
+
+    def test_save_batch_uniform(self, sync_repo, mock_table):
+        """Test uniform batch saving writes each column as declared, turning only floats into Decimal."""
+        models = [
+            {'id': 'item1', 'amount': 1.5, 'active': True, 'tags': {'a'}},
+            {'id': 'item2', 'amount': 2, 'active': False, 'tags': {'b', 'c'}},
+        ]
+
+        sync_repo.save_batch_uniform(models, {'id': 'S', 'amount': 'N', 'active': 'BOOL', 'tags': 'SS'})
+
+        write_requests = mock_table.meta.client.batch_write_item.call_args.kwargs['RequestItems']['test-table']
+        assert [request['PutRequest']['Item'] for request in write_requests] == [
+            {'id': 'item1', 'amount': Decimal('1.5'), 'active': True, 'tags': {'a'}},
+            {'id': 'item2', 'amount': 2, 'active': False, 'tags': {'b', 'c'}},
+        ]
+
+    @pytest.mark.parametrize(
+        'model, error, match',
+        [
+            ({'id': 'item1', 'amount': '12', 'active': True}, TypeError, "'amount' must be of type N, got str"),
+            ({'id': 'item1', 'amount': 1, 'active': 'false'}, TypeError, "'active' must be of type BOOL, got str"),
+            ({'id': None, 'amount': 1, 'active': True}, TypeError, "'id' must be of type S, got NoneType"),
+            ({'id': 'item1', 'amount': True, 'active': True}, TypeError, "'amount' must be of type N, got bool"),
+            ({'id': 'item1', 'amount': 1}, ValueError, r"missing: \['active'\], extra: \[\]"),
+            ({'id': 'item1', 'amount': 1, 'active': True, 'name': 'x'}, ValueError, r"extra: \['name'\]"),
+        ],
+    )
+    def test_save_batch_uniform_rejects_mismatches(self, sync_repo, mock_table, model, error, match):
+        """Test uniform batch saving raises instead of coercing, dropping or inventing values."""
+        models = [{'id': 'item0', 'amount': 1, 'active': True}, model]
+
+        with pytest.raises(error, match=match):
+            sync_repo.save_batch_uniform(models, {'id': 'S', 'amount': 'N', 'active': 'BOOL'})
+
+        mock_table.meta.client.batch_write_item.assert_not_called()
+
+    def test_save_batch_uniform_with_unsupported_schema_type(self, sync_repo, mock_table):
+        """Test uniform batch saving rejects unknown schema types before sending anything."""
+        with pytest.raises(ValueError, match='Unsupported schema types'):
+            sync_repo.save_batch_uniform([{'id': 'item1'}], {'id': 'X'})
+
+        mock_table.meta.client.batch_write_item.assert_not_called()
+
+    def test_save_batch_retries_unprocessed_items(self, sync_repo, mock_table):
+        """Test batch saving resends unprocessed items until none are left."""
+        models = [{'id': 'item1'}, {'id': 'item2'}]
+        unprocessed = {'test-table': [{'PutRequest': {'Item': {'id': 'item2'}}}]}
+        mock_table.meta.client.batch_write_item.side_effect = [{'UnprocessedItems': unprocessed}, {'UnprocessedItems': {}}]
+
+        with patch('src.sync_repo.time.sleep') as mock_sleep:
+            sync_repo.save_batch(models)
+
+        assert mock_table.meta.client.batch_write_item.call_count == 2
+        assert mock_table.meta.client.batch_write_item.call_args.kwargs['RequestItems'] == unprocessed
+        mock_sleep.assert_called_once()
 
     def test_load_or_throw_success(self, sync_repo, mock_table):
         """Test load_or_throw with existing item."""
@@ -254,6 +420,120 @@ class TestGenericRepository:
         with pytest.raises(ValueError, match='Key not found'):
             sync_repo.load_or_throw('nonexistent')
 
+        # A miss costs a single GetItem, with no separate existence check
+        mock_table.get_item.assert_called_once_with(Key={'id': 'nonexistent'})
+
+    def test_load_or_throw_single_get_item_request(self):
+        """Test load_or_throw sends exactly one GetItem request on the wire."""
+        from botocore.stub import Stubber
+
+        repo = GenericRepository(table_name='test-table', primary_key_name='id', region_name='us-east-1')
+
+        with Stubber(repo.table.meta.client) as stubber:
+            stubber.add_response('get_item', {}, {'TableName': 'test-table', 'Key': {'id': 'missing'}})
+
+            with pytest.raises(ValueError, match='Key not found'):
+                repo.load_or_throw('missing')
+
+            stubber.assert_no_pending_responses()
+
+    def test_load_with_cache(self, mock_dynamodb_resource, mock_table):
+        """Test repeated loads are served from the item cache and writes invalidate it."""
+        repo = GenericRepository(table_name='test-table', primary_key_name='id', cache_size=10)
+        mock_table.get_item.return_value = {'Item': {'id': 'test', 'name': 'Test Item'}}
+
+        first = repo.load('test')
+        first['name'] = 'changed by caller'
+        assert repo.load('test') == {'id': 'test', 'name': 'Test Item'}
+        mock_table.get_item.assert_called_once()
+
+        # Projected reads bypass the cache
+        repo.load('test', projection=['id'])
+        assert mock_table.get_item.call_count == 2
+
+        repo.update('test', {'name': 'Updated'}, return_model=False)
+        repo.load('test')
+        assert mock_table.get_item.call_count == 3
+
+    def test_load_does_not_cache_item_read_before_write(self, mock_dynamodb_resource, mock_table):
+        """Test an item read while a write invalidates its partition is not put back into the cache."""
+        repo = GenericRepository(table_name='test-table', primary_key_name='id', cache_size=10)
+
+        def get_item_overlapping_save(**kwargs):
+            # The write lands after GetItem read the old item but before load caches it
+            if mock_table.get_item.call_count == 1:
+                repo.save('test', {'name': 'New'}, return_model=False)
+            return {'Item': {'id': 'test', 'name': 'Old'}}
+
+        mock_table.get_item.side_effect = get_item_overlapping_save
+
+        repo.load('test')
+        repo.load('test')
+        assert mock_table.get_item.call_count == 2
+
+        # Reads that didn't overlap a write are cached as before
+        repo.load('test')
+        assert mock_table.get_item.call_count == 2
+
+    def test_load_by_composite_key_cache_expires(self, mock_dynamodb_resource, mock_table):
+        """Test cached composite key items expire after cache_ttl_seconds."""
+        repo = GenericRepository(table_name='test-table', primary_key_name='pk', cache_size=10, cache_ttl_seconds=60)
+        mock_table.get_item.return_value = {'Item': {'pk': 'p1', 'sk': 's1'}}
+
+        with patch('generic_repo.item_cache.time.monotonic', side_effect=[0, 30, 61, 61]):
+            repo.load_by_composite_key({'pk': 'p1', 'sk': 's1'})
+            repo.load_by_composite_key({'sk': 's1', 'pk': 'p1'})
+            repo.load_by_composite_key({'pk': 'p1', 'sk': 's1'})
+
+        assert mock_table.get_item.call_count == 2
+
+    def test_find_one_with_index_cache(self, mock_dynamodb_resource, mock_table):
+        """Test index lookups are cached per index, key and filters and dropped on any write."""
+        repo = GenericRepository(table_name='test-table', primary_key_name='id', cache_size=10)
+        paginate = mock_table.meta.client.get_paginator.return_value.paginate
+        paginate.side_effect = lambda **params: [{'Items': [{'id': 'user1', 'email': 'a@example.com'}]}]
+
+        repo.find_one_with_index('email-index', 'email', 'a@example.com')
+        repo.find_one_with_index('email-index', 'email', 'a@example.com')
+        assert paginate.call_count == 1
+
+        repo.find_one_with_index('email-index', 'email', 'a@example.com', filters={'status': 'active'})
+        assert paginate.call_count == 2
+
+        repo.save('user2', {'name': 'Other'}, return_model=False)
+        assert repo.find_one_with_index('email-index', 'email', 'a@example.com') == {
+            'id': 'user1',
+            'email': 'a@example.com',
+        }
+        assert paginate.call_count == 3
+
+    def test_find_one_with_index_does_not_cache_result_read_before_write(self, mock_dynamodb_resource, mock_table):
+        """Test an index lookup overlapping a write does not cache its result."""
+        repo = GenericRepository(table_name='test-table', primary_key_name='id', cache_size=10)
+        paginate = mock_table.meta.client.get_paginator.return_value.paginate
+
+        def paginate_overlapping_save(**params):
+            if paginate.call_count == 1:
+                repo.save('user1', {'email': 'b@example.com'}, return_model=False)
+            return [{'Items': [{'id': 'user1', 'email': 'a@example.com'}]}]
+
+        paginate.side_effect = paginate_overlapping_save
+
+        repo.find_one_with_index('email-index', 'email', 'a@example.com')
+        repo.find_one_with_index('email-index', 'email', 'a@example.com')
+        assert paginate.call_count == 2
+
+    def test_save_batch_invalidates_cache(self, mock_dynamodb_resource, mock_table):
+        """Test batch writes drop cached items of the written partitions."""
+        repo = GenericRepository(table_name='test-table', primary_key_name='id', cache_size=10)
+        mock_table.get_item.return_value = {'Item': {'id': 'item1'}}
+        repo.load('item1')
+
+        repo.save_batch([{'id': 'item1', 'name': 'New'}])
+        repo.load('item1')
+
+        assert mock_table.get_item.call_count == 2
+
     def test_count(self, sync_repo, mock_table):
         """Test counting items in table."""
         mock_table.meta.client.describe_table.return_value = {'Table': {'ItemCount': 5}}
@@ -263,6 +543,66 @@ class TestGenericRepository:
         mock_table.meta.client.describe_table.assert_called_once_with(TableName='test-table')
         assert result == 5
 
+    def test_count_reuses_table_description(self, sync_repo, mock_table):
+        """Test count only calls DescribeTable again once the cached description is stale."""
+        with patch('generic_repo.sync_repo.time.monotonic', side_effect=[1000.0, 1100.0, 1400.0]):
+            assert sync_repo.count() == 5
+            assert sync_repo.count() == 5
+            mock_table.meta.client.describe_table.assert_called_once()
+
+            mock_table.meta.client.describe_table.return_value = {'Table': {'ItemCount': 7}}
+            assert sync_repo.count() == 7
+
+        assert mock_table.meta.client.describe_table.call_count == 2
+
+    def test_count_exact(self, sync_repo, mock_table):
+        """Test exact counting sums COUNT scan pages without fetching items."""
+        mock_paginator = Mock()
+        mock_table.meta.client.get_paginator.return_value = mock_paginator
+        mock_paginator.paginate.return_value = [{'Count': 3}, {'Count': 2}]
+
+        result = sync_repo.count(exact=True)
+
+        mock_table.meta.client.get_paginator.assert_called_once_with('scan')
+        mock_paginator.paginate.assert_called_once_with(TableName='test-table', Select='COUNT')
+        mock_table.meta.client.describe_table.assert_not_called()
+        assert result == 5
+
+    def test_count_by_primary_key(self, sync_repo, mock_table):
+        """Test counting items for a partition key with a COUNT query."""
+        mock_paginator = Mock()
+        mock_table.meta.client.get_paginator.return_value = mock_paginator
+        mock_paginator.paginate.return_value = [{'Count': 4}]
+
+        result = sync_repo.count_by_primary_key('user-1', filters={'status': 'active'})
+
+        mock_table.meta.client.get_paginator.assert_called_once_with('query')
+        call_kwargs = mock_paginator.paginate.call_args.kwargs
+        assert call_kwargs['Select'] == 'COUNT'
+        assert 'FilterExpression' in call_kwargs
+        assert result == 4
+
+    def test_build_condition_expression_passes_conditions_through(self, sync_repo):
+        """Test boto3 conditions are returned unchanged and dicts are converted."""
+        from boto3.dynamodb.conditions import Attr, ConditionBase
+
+        condition = Attr('status').eq('active') & Attr('version').lt(3)
+
+        assert sync_repo._build_condition_expression(condition) is condition
+        assert isinstance(sync_repo._build_condition_expression({'status': 'active'}), ConditionBase)
+        assert sync_repo._build_condition_expression(None) is None
+
+    def test_build_update_expression_reuses_template(self, sync_repo):
+        """Test update expressions for the same fields share a template but not mutable dicts."""
+        first = sync_repo._build_update_expression({'status': 'active', 'age': 30})
+        second = sync_repo._build_update_expression({'status': 'inactive', 'age': 31})
+
+        assert first[0] == second[0] == 'SET #status = :status, #age = :age'
+        assert first[1] == {'#status': 'status', '#age': 'age'}
+        assert first[1] is not second[1]
+        assert first[2] == {':status': 'active', ':age': 30}
+        assert second[2] == {':status': 'inactive', ':age': 31}
+
     def test_load_client_error(self, sync_repo, mock_table):
         """Test load method with ClientError."""
         mock_table.get_item.side_effect = ClientError(
@@ -272,6 +612,19 @@ class TestGenericRepository:
         with pytest.raises(ClientError):
             sync_repo.load('test-key')
 
+    def test_load_with_projection(self, sync_repo, mock_table):
+        """Test loading only selected attributes uses placeholder names."""
+        mock_table.get_item.return_value = {'Item': {'name': 'Test'}}
+
+        result = sync_repo.load('test', projection=['name', 'status'])
+
+        mock_table.get_item.assert_called_once_with(
+            Key={'id': 'test'},
+            ProjectionExpression='#p0, #p1',
+            ExpressionAttributeNames={'#p0': 'name', '#p1': 'status'},
+        )
+        assert result == {'name': 'Test'}
+
     def test_load_by_composite_key(self, sync_repo, mock_table):
         """Test loading by composite key."""
         key_dict = {'pk': 'partition1', 'sk': 'sort1'}
@@ -324,26 +677,64 @@ class TestGenericRepository:
 
         mock_table.delete_item.assert_not_called()
 
+    @patch('src.sync_repo.time.sleep')
+    def test_delete_all_by_primary_key(self, mock_sleep, sync_repo, mock_table):
+        """Test items are queried by key and deleted in 25-statement batches, retrying throttled statements."""
+        client = mock_table.meta.client
+        client.describe_table.return_value = {
+            'Table': {'KeySchema': [{'AttributeName': 'sk', 'KeyType': 'RANGE'}, {'AttributeName': 'id', 'KeyType': 'HASH'}]}
+        }
+        client.get_paginator.return_value.paginate.return_value = [
+            {'Items': [{'id': 'p1', 'sk': f's{i}'} for i in range(20)]},
+            {'Items': [{'id': 'p1', 'sk': f's{i}'} for i in range(20, 30)]},
+        ]
+        throttled = {'Error': {'Code': 'ThrottlingError', 'Message': 'Slow down'}}
+        client.batch_execute_statement.side_effect = [
+            {'Responses': [throttled] + [{}] * 24},
+            {'Responses': [{}]},
+            {'Responses': [{}] * 5},
+        ]
+
+        sync_repo.delete_all_by_primary_key('p1')
+
+        query_kwargs = client.get_paginator.return_value.paginate.call_args.kwargs
+        assert query_kwargs['KeyConditionExpression'] == '#k0 = :k0'
+        assert query_kwargs['ProjectionExpression'] == '#p0, #p1'
+        assert query_kwargs['ExpressionAttributeNames'] == {'#k0': 'id', '#p0': 'id', '#p1': 'sk'}
+        calls = client.batch_execute_statement.call_args_list
+        assert [len(call.kwargs['Statements']) for call in calls] == [25, 1, 5]
+        first_statement = calls[0].kwargs['Statements'][0]
+        assert first_statement == {'Statement': 'DELETE FROM "test-table" WHERE "id" = ? AND "sk" = ?', 'Parameters': ['p1', 's0']}
+        assert calls[1].kwargs['Statements'] == [first_statement]
+        mock_sleep.assert_called_once()
+
+    def test_delete_all_by_primary_key_statement_error(self, sync_repo, mock_table):
+        """Test a non-retryable statement error is raised as ClientError."""
+        client = mock_table.meta.client
+        client.describe_table.return_value = {'Table': {'KeySchema': [{'AttributeName': 'id', 'KeyType': 'HASH'}]}}
+        client.get_paginator.return_value.paginate.return_value = [{'Items': [{'id': 'p1'}]}]
+        client.batch_execute_statement.return_value = {
+            'Responses': [{'Error': {'Code': 'ValidationError', 'Message': 'Bad statement'}}]
+        }
+
+        with pytest.raises(ClientError):
+            sync_repo.delete_all_by_primary_key('p1')
+
     def test_delete_batch_by_keys(self, sync_repo, mock_table):
         """Test batch deleting by keys."""
         key_dicts = [{'id': 'item1'}, {'id': 'item2'}, {'id': 'item3'}]
 
-        mock_batch_writer = Mock()
-        mock_context_manager = Mock()
-        mock_context_manager.__enter__ = Mock(return_value=mock_batch_writer)
-        mock_context_manager.__exit__ = Mock(return_value=None)
-        mock_table.batch_writer.return_value = mock_context_manager
-
         sync_repo.delete_batch_by_keys(key_dicts)
 
-        mock_table.batch_writer.assert_called_once()
-        assert mock_batch_writer.delete_item.call_count == 3
+        mock_table.meta.client.batch_write_item.assert_called_once_with(
+            RequestItems={'test-table': [{'DeleteRequest': {'Key': key_dict}} for key_dict in key_dicts]}
+        )
 
     def test_delete_batch_by_keys_empty_list(self, sync_repo, mock_table):
         """Test batch deleting with empty key list."""
         sync_repo.delete_batch_by_keys([])
 
-        mock_table.batch_writer.assert_not_called()
+        mock_table.meta.client.batch_write_item.assert_not_called()
 
     def test_delete_batch_by_keys_debug_mode(self, mock_dynamodb_resource, mock_table):
         """Test batch deleting in debug mode."""
@@ -352,7 +743,7 @@ class TestGenericRepository:
 
         debug_repo.delete_batch_by_keys(key_dicts)
 
-        mock_table.batch_writer.assert_not_called()
+        mock_table.meta.client.batch_write_item.assert_not_called()
 
     def test_find_all(self, sync_repo, mock_table):
         """Test finding all items with primary key."""
@@ -370,6 +761,22 @@ class TestGenericRepository:
         mock_table.meta.client.get_paginator.assert_called_once_with('query')
         assert result == expected_items
 
+    def test_find_all_sends_rendered_key_condition_and_filters(self, sync_repo, mock_table):
+        """Test find_all sends the key condition and filters as one pre-rendered set of placeholders."""
+        mock_paginator = Mock()
+        mock_table.meta.client.get_paginator.return_value = mock_paginator
+        mock_paginator.paginate.return_value = []
+
+        sync_repo.find_all('test', filters={'status': 'active'})
+
+        mock_paginator.paginate.assert_called_once_with(
+            TableName='test-table',
+            KeyConditionExpression='#k0 = :k0',
+            FilterExpression='#n0 = :v0',
+            ExpressionAttributeNames={'#n0': 'status', '#k0': 'id'},
+            ExpressionAttributeValues={':v0': 'active', ':k0': 'test'},
+        )
+
     def test_find_all_empty_key(self, sync_repo, mock_table):
         """Test finding all with empty primary key value."""
         result = sync_repo.find_all('')
@@ -390,6 +797,143 @@ class TestGenericRepository:
 
         assert result == page1_items + page2_items
 
+    def test_item_codec_matches_boto3_types(self):
+        """Test ItemCodec produces the same wire and Python values as boto3's type converters."""
+        from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+
+        from generic_repo.item_codec import ItemCodec
+
+        item = {
+            'id': 'test',
+            'count': 3,
+            'price': Decimal('19.99'),
+            'active': False,
+            'note': None,
+            'nested': {'tags': ['a', Decimal('1')], 'set': {'x', 'y'}},
+            'blob': b'data',
+        }
+        wire_item = {key: TypeSerializer().serialize(value) for key, value in item.items()}
+
+        assert ItemCodec.serialize_item(item) == wire_item
+        assert ItemCodec.deserialize_item(wire_item) == {
+            key: TypeDeserializer().deserialize(value) for key, value in wire_item.items()
+        }
+        with pytest.raises(TypeError):
+            ItemCodec.serialize_item({'ratio': 0.5})
+
+    def test_fast_serde_uses_plain_client(self, mock_dynamodb_resource, mock_table):
+        """Test fast_serde sends loads, saves and queries through a plain client in wire format."""
+        with patch('src.sync_repo.boto3.client') as mock_client_factory:
+            repo = GenericRepository(table_name='test-table', primary_key_name='id', fast_serde=True)
+        client = mock_client_factory.return_value
+        client.get_item.return_value = {'Item': {'id': {'S': 'test'}, 'count': {'N': '2'}}}
+        client.get_paginator.return_value.paginate.return_value = [{'Items': [{'id': {'S': 'test'}}]}]
+
+        assert repo.load('test') == {'id': 'test', 'count': Decimal('2')}
+        client.get_item.assert_called_once_with(TableName='test-table', Key={'id': {'S': 'test'}})
+
+        repo.save('test', {'count': 2}, return_model=False)
+        client.put_item.assert_called_once_with(TableName='test-table', Item={'count': {'N': '2'}, 'id': {'S': 'test'}})
+
+        assert repo.find_all('test') == [{'id': 'test'}]
+        client.get_paginator.return_value.paginate.assert_called_once_with(
+            TableName='test-table',
+            KeyConditionExpression='#k0 = :k0',
+            ExpressionAttributeNames={'#k0': 'id'},
+            ExpressionAttributeValues={':k0': {'S': 'test'}},
+        )
+        mock_table.get_item.assert_not_called()
+        mock_table.put_item.assert_not_called()
+        mock_table.meta.client.get_paginator.assert_not_called()
+
+    def test_dax_endpoint_routes_item_operations_and_queries(self, mock_dynamodb_resource, mock_table):
+        """Test dax_endpoint sends item reads and paginated queries to DAX and keeps scans on DynamoDB."""
+        amazondax = Mock()
+        dax_table = amazondax.AmazonDaxClient.resource.return_value.Table.return_value
+        dax_table.get_item.return_value = {'Item': {'id': 'test'}}
+        dax_table.meta.client.query.side_effect = [
+            {'Items': [{'id': 'test', 'sk': 'a'}], 'LastEvaluatedKey': {'id': 'test', 'sk': 'a'}},
+            {'Items': [{'id': 'test', 'sk': 'b'}]},
+        ]
+        with patch.dict('sys.modules', {'amazondax': amazondax}):
+            repo = GenericRepository(table_name='test-table', primary_key_name='id', dax_endpoint='daxs://cluster')
+
+        amazondax.AmazonDaxClient.resource.assert_called_once_with(
+            session=None, region_name=None, endpoint_url='daxs://cluster'
+        )
+        assert repo.load('test') == {'id': 'test'}
+        dax_table.get_item.assert_called_once_with(Key={'id': 'test'})
+
+        assert repo.find_all('test') == [{'id': 'test', 'sk': 'a'}, {'id': 'test', 'sk': 'b'}]
+        assert dax_table.meta.client.query.call_args.kwargs['ExclusiveStartKey'] == {'id': 'test', 'sk': 'a'}
+
+        list(repo.load_all())
+        mock_table.meta.client.get_paginator.assert_called_once_with('scan')
+        mock_table.get_item.assert_not_called()
+
+        with pytest.raises(ValueError):
+            GenericRepository(table_name='test-table', primary_key_name='id', fast_serde=True, dax_endpoint='daxs://x')
+
+    def test_connect_and_close(self, sync_repo, mock_table):
+        """Test connect returns the repository and close releases the client's connections."""
+        assert sync_repo.connect() is sync_repo
+
+        sync_repo.close()
+
+        mock_table.meta.client.close.assert_called_once()
+
+    def test_find_all_iter_yields_before_next_page(self, sync_repo, mock_table):
+        """Test find_all_iter yields each page's items before the next page is fetched."""
+        fetched = []
+
+        def pages():
+            for page_number in (1, 2):
+                fetched.append(page_number)
+                yield {'Items': [{'id': 'test', 'sk': f'item{page_number}'}]}
+
+        mock_paginator = Mock()
+        mock_table.meta.client.get_paginator.return_value = mock_paginator
+        mock_paginator.paginate.return_value = pages()
+
+        items = sync_repo.find_all_iter('test')
+
+        assert next(items) == {'id': 'test', 'sk': 'item1'}
+        assert fetched == [1]
+        assert list(items) == [{'id': 'test', 'sk': 'item2'}]
+        assert fetched == [1, 2]
+
+    def test_find_all_parallel_merges_both_directions(self, sync_repo, mock_table):
+        """Test find_all(parallel=True) queries from both ends and merges the halves in order."""
+        items = [{'id': 'test', 'sk': sort_key} for sort_key in 'abcdef']
+        mock_table.meta.client.describe_table.return_value = {
+            'Table': {
+                'KeySchema': [{'AttributeName': 'id', 'KeyType': 'HASH'}, {'AttributeName': 'sk', 'KeyType': 'RANGE'}]
+            }
+        }
+
+        def paginate(ScanIndexForward, **params):
+            ordered = items if ScanIndexForward else items[::-1]
+            for start in range(0, len(ordered), 2):
+                page = {'Items': ordered[start : start + 2]}
+                if start + 2 < len(ordered):
+                    page['LastEvaluatedKey'] = dict(ordered[start + 1])
+                yield page
+
+        mock_paginate = mock_table.meta.client.get_paginator.return_value.paginate
+        mock_paginate.side_effect = paginate
+
+        assert sync_repo.find_all('test', parallel=True) == items
+        assert {call.kwargs['ScanIndexForward'] for call in mock_paginate.call_args_list} == {True, False}
+
+    def test_paginators_are_created_once(self, sync_repo, mock_table):
+        """Test query and scan paginators are created on first use and reused afterwards."""
+        sync_repo.find_all('test')
+        sync_repo.find_all('other')
+        list(sync_repo.load_all())
+        sync_repo.count(exact=True)
+
+        assert [call.args for call in mock_table.meta.client.get_paginator.call_args_list] == [('query',), ('scan',)]
+
     def test_load_all(self, sync_repo, mock_table):
         """Test loading all items from table."""
         expected_items = [{'id': 'item1', 'name': 'Item 1'}, {'id': 'item2', 'name': 'Item 2'}]
@@ -403,6 +947,220 @@ class TestGenericRepository:
         mock_table.meta.client.get_paginator.assert_called_once_with('scan')
         assert result == expected_items
 
+    def test_load_batch(self, sync_repo, mock_table):
+        """Test batch loading chunks keys and retries unprocessed keys."""
+        keys = [{'id': f'item{i}'} for i in range(150)]
+        mock_table.meta.client.batch_get_item.side_effect = [
+            {'Responses': {'test-table': [{'id': 'item0'}]}, 'UnprocessedKeys': {'test-table': {'Keys': [{'id': 'item1'}]}}},
+            {'Responses': {'test-table': [{'id': 'item1'}]}, 'UnprocessedKeys': {}},
+            {'Responses': {'test-table': [{'id': 'item100'}]}},
+        ]
+
+        with patch('src.sync_repo.time.sleep') as mock_sleep:
+            result = sync_repo.load_batch(keys, max_workers=1)
+
+        assert result == [{'id': 'item0'}, {'id': 'item1'}, {'id': 'item100'}]
+        calls = mock_table.meta.client.batch_get_item.call_args_list
+        assert len(calls) == 3
+        assert len(calls[0].kwargs['RequestItems']['test-table']['Keys']) == 100
+        assert calls[1].kwargs['RequestItems'] == {'test-table': {'Keys': [{'id': 'item1'}]}}
+        assert len(calls[2].kwargs['RequestItems']['test-table']['Keys']) == 50
+        mock_sleep.assert_called_once()
+
+    def test_load_batch_uses_item_cache(self, mock_dynamodb_resource, mock_table):
+        """Test batch loading skips cached and duplicate keys and caches the items it reads."""
+        repo = GenericRepository(table_name='test-table', primary_key_name='id', cache_size=10)
+        mock_table.get_item.return_value = {'Item': {'id': 'item1', 'name': 'cached'}}
+        repo.load('item1')
+        mock_table.meta.client.batch_get_item.return_value = {'Responses': {'test-table': [{'id': 'item2'}]}}
+
+        result = repo.load_batch_by_primary_keys(['item1', 'item2', 'item2', 'missing'])
+
+        assert result == [{'id': 'item1', 'name': 'cached'}, {'id': 'item2'}]
+        mock_table.meta.client.batch_get_item.assert_called_once_with(
+            RequestItems={'test-table': {'Keys': [{'id': 'item2'}, {'id': 'missing'}]}}
+        )
+        assert repo.load('item2') == {'id': 'item2'}
+        mock_table.get_item.assert_called_once()
+
+    def test_load_batch_does_not_cache_items_read_before_write(self, mock_dynamodb_resource, mock_table):
+        """Test batch loading skips caching items of partitions written while the batch was read."""
+        repo = GenericRepository(table_name='test-table', primary_key_name='id', cache_size=10)
+
+        def batch_get_overlapping_save(RequestItems):
+            repo.save('item1', {'name': 'New'}, return_model=False)
+            return {'Responses': {'test-table': [{'id': 'item1', 'name': 'Old'}, {'id': 'item2'}]}}
+
+        mock_table.meta.client.batch_get_item.side_effect = batch_get_overlapping_save
+        mock_table.get_item.return_value = {'Item': {'id': 'item1', 'name': 'New'}}
+
+        repo.load_batch_by_primary_keys(['item1', 'item2'])
+
+        assert repo.load('item1') == {'id': 'item1', 'name': 'New'}
+        assert repo.load('item2') == {'id': 'item2'}
+        mock_table.get_item.assert_called_once()
+
+    def test_load_batch_concurrent_chunks(self, sync_repo, mock_table):
+        """Test batch loading sends chunks concurrently and returns items in chunk order."""
+        keys = [{'id': f'item{i}'} for i in range(250)]
+        mock_table.meta.client.batch_get_item.side_effect = lambda RequestItems: {
+            'Responses': {'test-table': list(RequestItems['test-table']['Keys'])}
+        }
+
+        result = sync_repo.load_batch(keys, max_workers=3)
+
+        assert result == keys
+        calls = mock_table.meta.client.batch_get_item.call_args_list
+        assert sorted(len(call.kwargs['RequestItems']['test-table']['Keys']) for call in calls) == [50, 100, 100]
+
+    def test_load_batch_with_projection(self, sync_repo, mock_table):
+        """Test batch loading passes the projection with every key chunk."""
+        mock_table.meta.client.batch_get_item.return_value = {'Responses': {'test-table': [{'id': 'item1'}]}}
+
+        sync_repo.load_batch([{'id': 'item1'}], projection=['id'])
+
+        mock_table.meta.client.batch_get_item.assert_called_once_with(
+            RequestItems={
+                'test-table': {
+                    'Keys': [{'id': 'item1'}],
+                    'ProjectionExpression': '#p0',
+                    'ExpressionAttributeNames': {'#p0': 'id'},
+                }
+            }
+        )
+
+    def test_load_batch_empty(self, sync_repo, mock_table):
+        """Test batch loading with no keys makes no requests."""
+        assert sync_repo.load_batch([]) == []
+        mock_table.meta.client.batch_get_item.assert_not_called()
+
+    def test_load_all_streams_pages_lazily(self, sync_repo, mock_table):
+        """Test load_all only fetches the next page once the current one is consumed."""
+        fetched_pages = []
+
+        def pages():
+            for page_number in range(3):
+                fetched_pages.append(page_number)
+                yield {'Items': [{'id': f'item{page_number}'}]}
+
+        mock_table.meta.client.get_paginator.return_value.paginate.return_value = pages()
+
+        items = sync_repo.load_all()
+        assert next(items) == {'id': 'item0'}
+        assert fetched_pages == [0]
+
+        assert list(items) == [{'id': 'item1'}, {'id': 'item2'}]
+        assert fetched_pages == [0, 1, 2]
+
+    def test_load_all_rate_limited(self, sync_repo, mock_table):
+        """Test rate-limited scan requests consumed capacity and pauses between pages."""
+        pages = [
+            {'Items': [{'id': 'item1'}], 'ConsumedCapacity': {'CapacityUnits': 30.0}},
+            {'Items': [{'id': 'item2'}], 'ConsumedCapacity': {'CapacityUnits': 30.0}},
+        ]
+        mock_paginator = Mock()
+        mock_table.meta.client.get_paginator.return_value = mock_paginator
+        mock_paginator.paginate.return_value = pages
+
+        with patch('src.sync_repo.time.sleep') as mock_sleep:
+            result = list(sync_repo.load_all(rate_limit_rcu=10))
+
+        assert result == [{'id': 'item1'}, {'id': 'item2'}]
+        call_kwargs = mock_paginator.paginate.call_args.kwargs
+        assert call_kwargs['ReturnConsumedCapacity'] == 'TOTAL'
+        assert call_kwargs['PaginationConfig'] == {'PageSize': 100}
+        assert mock_sleep.call_count == 2
+        assert mock_sleep.call_args_list[0].args[0] == pytest.approx(2.0, abs=0.1)
+
+    def test_load_all_renders_filter_expression_once(self, sync_repo, mock_table):
+        """Test load_all sends a pre-rendered filter, reusing it for identical filters while True and 1 stay distinct."""
+        mock_paginator = Mock()
+        mock_table.meta.client.get_paginator.return_value = mock_paginator
+        mock_paginator.paginate.return_value = []
+
+        list(sync_repo.load_all(filters={'status': 'active', 'age': {'between': [18, 30]}}))
+        first = mock_paginator.paginate.call_args.kwargs
+        assert isinstance(first['FilterExpression'], str)
+        list(sync_repo.load_all(filters={'status': 'active', 'age': {'between': [18, 30]}}))
+        second = mock_paginator.paginate.call_args.kwargs
+        assert second['FilterExpression'] is first['FilterExpression']
+        assert second['ExpressionAttributeNames'] == first['ExpressionAttributeNames']
+        assert second['ExpressionAttributeNames'] is not first['ExpressionAttributeNames']
+
+        list(sync_repo.load_all(filters={'flag': True}))
+        assert list(mock_paginator.paginate.call_args.kwargs['ExpressionAttributeValues'].values()) == [True]
+        list(sync_repo.load_all(filters={'flag': 1}))
+        assert list(mock_paginator.paginate.call_args.kwargs['ExpressionAttributeValues'].values()) == [Decimal('1')]
+
+    def test_load_all_with_filters_and_projection(self, sync_repo, mock_table):
+        """Test filter and projection placeholders are merged into one ExpressionAttributeNames."""
+        mock_paginator = Mock()
+        mock_table.meta.client.get_paginator.return_value = mock_paginator
+        mock_paginator.paginate.return_value = []
+
+        list(sync_repo.load_all(filters={'status': 'active'}, projection=['id', 'name']))
+
+        call_kwargs = mock_paginator.paginate.call_args.kwargs
+        assert call_kwargs['FilterExpression'] == '#n0 = :v0'
+        assert call_kwargs['ProjectionExpression'] == '#p0, #p1'
+        assert call_kwargs['ExpressionAttributeNames'] == {'#n0': 'status', '#p0': 'id', '#p1': 'name'}
+        assert call_kwargs['ExpressionAttributeValues'] == {':v0': 'active'}
+
+    def test_load_all_with_limit(self, sync_repo, mock_table):
+        """Test load_all caps total items, and page size only when there are no filters."""
+        mock_paginator = Mock()
+        mock_table.meta.client.get_paginator.return_value = mock_paginator
+        mock_paginator.paginate.return_value = []
+
+        list(sync_repo.load_all(limit=10))
+        assert mock_paginator.paginate.call_args.kwargs['PaginationConfig'] == {'MaxItems': 10, 'PageSize': 10}
+
+        list(sync_repo.load_all(filters={'status': 'active'}, limit=10))
+        assert mock_paginator.paginate.call_args.kwargs['PaginationConfig'] == {'MaxItems': 10}
+
+        with pytest.raises(ValueError, match='limit must be at least 1'):
+            list(sync_repo.load_all(limit=0))
+
+    def test_load_all_parallel(self, sync_repo, mock_table):
+        """Test parallel scan reads every segment and yields all items."""
+        segment_items = {0: [{'id': 'item1'}], 1: [{'id': 'item2'}, {'id': 'item3'}]}
+
+        mock_paginator = Mock()
+        mock_table.meta.client.get_paginator.return_value = mock_paginator
+        mock_paginator.paginate.side_effect = lambda Segment, **kwargs: [{'Items': segment_items[Segment]}]
+
+        result = list(sync_repo.load_all_parallel(total_segments=2, filters={'status': 'active'}))
+
+        assert sorted(item['id'] for item in result) == ['item1', 'item2', 'item3']
+        assert mock_paginator.paginate.call_count == 2
+        call_kwargs = mock_paginator.paginate.call_args.kwargs
+        assert call_kwargs['TotalSegments'] == 2
+        assert isinstance(call_kwargs['FilterExpression'], str)
+        assert list(call_kwargs['ExpressionAttributeValues'].values()) == ['active']
+
+    def test_load_all_total_segments(self, sync_repo, mock_table):
+        """Test load_all with total_segments scans the segments concurrently and applies the overall limit."""
+        segment_items = {0: [{'id': 'item1'}, {'id': 'item2'}], 1: [{'id': 'item3'}], 2: [{'id': 'item4'}]}
+
+        mock_paginator = Mock()
+        mock_table.meta.client.get_paginator.return_value = mock_paginator
+        mock_paginator.paginate.side_effect = lambda Segment, **kwargs: [{'Items': segment_items[Segment]}]
+
+        result = list(sync_repo.load_all(total_segments=3, projection=['id']))
+
+        assert sorted(item['id'] for item in result) == ['item1', 'item2', 'item3', 'item4']
+        call_kwargs = mock_paginator.paginate.call_args.kwargs
+        assert call_kwargs['TotalSegments'] == 3
+        assert call_kwargs['ProjectionExpression'] == '#p0'
+        assert len(list(sync_repo.load_all(total_segments=3, limit=2))) == 2
+        with pytest.raises(ValueError, match='total_segments must be at least 1'):
+            list(sync_repo.load_all(total_segments=0))
+
+    def test_load_all_parallel_invalid_segments(self, sync_repo):
+        """Test parallel scan rejects a non-positive segment count."""
+        with pytest.raises(ValueError, match='total_segments must be at least 1'):
+            list(sync_repo.load_all_parallel(total_segments=0))
+
     def test_find_one_with_index(self, sync_repo, mock_table):
         """Test finding one item with index."""
         expected_item = {'id': 'test', 'email': 'test@example.com', 'name': 'Test User'}
@@ -414,6 +1172,8 @@ class TestGenericRepository:
         result = sync_repo.find_one_with_index('email-index', 'email', 'test@example.com')
 
         mock_table.meta.client.get_paginator.assert_called_once_with('query')
+        # Only the first match is requested from DynamoDB
+        assert mock_paginator.paginate.call_args.kwargs['PaginationConfig'] == {'MaxItems': 1, 'PageSize': 1}
         assert result == expected_item
 
     def test_find_one_with_index_not_found(self, sync_repo, mock_table):
@@ -459,43 +1219,44 @@ class TestGenericRepository:
         """Test batch saving with empty model list."""
         sync_repo.save_batch([])
 
-        mock_table.batch_writer.assert_not_called()
+        mock_table.meta.client.batch_write_item.assert_not_called()
 
     def test_save_batch_large_batch(self, sync_repo, mock_table):
         """Test batch saving with large batch (more than 25 items)."""
         # Create 30 items to test batch splitting
         models = [{'id': f'item{i}', 'name': f'Item {i}'} for i in range(30)]
 
-        mock_batch_writer = Mock()
-        mock_context_manager = Mock()
-        mock_context_manager.__enter__ = Mock(return_value=mock_batch_writer)
-        mock_context_manager.__exit__ = Mock(return_value=None)
-        mock_table.batch_writer.return_value = mock_context_manager
-
         sync_repo.save_batch(models)
 
         # Should be called twice (25 + 5 items)
-        assert mock_table.batch_writer.call_count == 2
-        # Total put_item calls should equal number of models
-        assert mock_batch_writer.put_item.call_count == 30
+        calls = mock_table.meta.client.batch_write_item.call_args_list
+        assert len(calls) == 2
+        # Total put requests should equal number of models
+        assert sorted(len(call.kwargs['RequestItems']['test-table']) for call in calls) == [5, 25]
+
+    def test_save_batch_keeps_last_model_per_key(self, sync_repo, mock_table):
+        """Test a key repeated across concurrently written chunks is written once, with its last model."""
+        models = [{'id': 'dup', 'name': 'First'}]
+        models += [{'id': f'item{i}'} for i in range(30)]
+        models += [{'id': 'dup', 'name': 'Last'}]
+
+        sync_repo.save_batch(models)
+
+        calls = mock_table.meta.client.batch_write_item.call_args_list
+        items = [request['PutRequest']['Item'] for call in calls for request in call.kwargs['RequestItems']['test-table']]
+        assert len(items) == 31
+        assert [item for item in items if item['id'] == 'dup'] == [{'id': 'dup', 'name': 'Last'}]
 
     def test_delete_batch_by_keys_large_batch(self, sync_repo, mock_table):
         """Test batch deleting with large batch (more than 25 items)."""
         # Create 30 keys to test batch splitting
         key_dicts = [{'id': f'item{i}'} for i in range(30)]
 
-        mock_batch_writer = Mock()
-        mock_context_manager = Mock()
-        mock_context_manager.__enter__ = Mock(return_value=mock_batch_writer)
-        mock_context_manager.__exit__ = Mock(return_value=None)
-        mock_table.batch_writer.return_value = mock_context_manager
-
-        sync_repo.delete_batch_by_keys(key_dicts)
+        sync_repo.delete_batch_by_keys(key_dicts, max_workers=1)
 
-        # Should be called twice (25 + 5 items)
-        assert mock_table.batch_writer.call_count == 2
-        # Total delete_item calls should equal number of keys
-        assert mock_batch_writer.delete_item.call_count == 30
+        # Should be called twice (25 + 5 items), in order when dispatched serially
+        calls = mock_table.meta.client.batch_write_item.call_args_list
+        assert [len(call.kwargs['RequestItems']['test-table']) for call in calls] == [25, 5]
 
     def test_save_client_error(self, sync_repo, mock_table):
         """Test save method with ClientError."""
@@ -510,12 +1271,7 @@ class TestGenericRepository:
         """Test save_batch method with ClientError."""
         models = [{'id': 'item1', 'name': 'Item 1'}]
 
-        mock_batch_writer = Mock()
-        mock_context_manager = Mock()
-        mock_context_manager.__enter__ = Mock(return_value=mock_batch_writer)
-        mock_context_manager.__exit__ = Mock(return_value=None)
-        mock_table.batch_writer.return_value = mock_context_manager
-        mock_batch_writer.put_item.side_effect = ClientError(
+        mock_table.meta.client.batch_write_item.side_effect = ClientError(
             error_response={'Error': {'Code': 'ValidationException', 'Message': 'Test error'}},
             operation_name='BatchWriteItem',
         )
@@ -556,9 +1312,23 @@ class TestGenericRepository:
             repo = GenericRepository(table_name='test-table', primary_key_name='id', region_name='us-west-2', session=custom_session)
 
             # Verify custom session was used
-            custom_session.resource.assert_called_once_with('dynamodb', region_name='us-west-2')
+            custom_session.resource.assert_called_once_with('dynamodb', region_name='us-west-2', config=repo.boto_config)
+            assert repo.boto_config.retries == {'mode': 'adaptive', 'max_attempts': 10}
             assert repo.table_name == 'test-table'
 
+    def test_init_with_custom_boto_config(self, mock_table):
+        """Test a caller-provided botocore Config replaces the default client config."""
+        from botocore.config import Config
+
+        config = Config(max_pool_connections=8)
+        with patch('src.sync_repo.boto3.resource') as mock_resource:
+            mock_resource.return_value.Table.return_value = mock_table
+
+            repo = GenericRepository(table_name='test-table', primary_key_name='id', boto_config=config)
+
+        mock_resource.assert_called_once_with('dynamodb', region_name=None, config=config)
+        assert repo.boto_config is config
+
     def test_save_return_model_false(self, sync_repo, mock_table):
         """Test saving with return_model=False."""
         model_data = {'name': 'Test Item', 'value': 42}
@@ -610,14 +1380,9 @@ class TestGenericRepository:
 
     def test_delete_batch_by_keys_client_error(self, sync_repo, mock_table):
         """Test delete_batch_by_keys with ClientError."""
-        key_dicts = [{'id': 'item1'}]
+        key_dicts = [{'id': f'item{i}'} for i in range(30)]
 
-        mock_batch_writer = Mock()
-        mock_context_manager = Mock()
-        mock_context_manager.__enter__ = Mock(return_value=mock_batch_writer)
-        mock_context_manager.__exit__ = Mock(return_value=None)
-        mock_table.batch_writer.return_value = mock_context_manager
-        mock_batch_writer.delete_item.side_effect = ClientError(
+        mock_table.meta.client.batch_write_item.side_effect = ClientError(
             error_response={'Error': {'Code': 'ValidationException', 'Message': 'Test error'}},
             operation_name='BatchWriteItem',
         )
@@ -658,6 +1423,22 @@ class TestAsyncGenericRepository:
         assert async_repo.primary_key_name == 'id'
         assert async_repo.debug_mode is False
 
+    def test_serialize_for_dynamodb_nested_values(self, async_repo):
+        """Test async serialization converts nested values without a JSON round-trip."""
+        import datetime
+
+        data = {
+            'price': Decimal('19.99'),
+            'nested': {'ratio': 0.5, 'values': (1, 2.25)},
+            'created': datetime.datetime(2024, 1, 1),
+        }
+
+        result = async_repo._serialize_for_dynamodb(data)
+
+        assert result['price'] == Decimal('19.99')
+        assert result['nested'] == {'ratio': Decimal('0.5'), 'values': [1, Decimal('2.25')]}
+        assert result['created'] == '2024-01-01 00:00:00'
+
     @pytest.mark.asyncio
     async def test_async_context_manager(self, mock_aioboto3_session):
         """Test async context manager functionality."""
@@ -685,6 +1466,15 @@ class TestAsyncGenericRepository:
         # Verify put_item was called
         async_mock_table.put_item.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_save_returns_written_item(self, async_repo_context, async_mock_table):
+        """Test async save returns the item it wrote without reading it back."""
+        result = await async_repo_context.save('test', {'name': 'Test Item', 'price': 1.5})
+
+        assert result == {'id': 'test', 'name': 'Test Item', 'price': Decimal('1.5')}
+        assert result == async_mock_table.put_item.call_args[1]['Item']
+        async_mock_table.get_item.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_save_debug_mode(self, mock_aioboto3_session, async_mock_table):
         """Test async saving in debug mode."""
@@ -696,6 +1486,26 @@ class TestAsyncGenericRepository:
         async_mock_table.put_item.assert_not_called()
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_debug_mode_writes_skip_all_processing(self, mock_aioboto3_session, async_mock_table):
+        """Test async debug mode returns from every write before serialization or expiration work."""
+        repo = AsyncGenericRepository(
+            table_name='test-table', primary_key_name='id', region_name='us-east-1', data_expiration_days=30, debug_mode=True
+        )
+
+        with patch.object(repo, '_serialize_for_dynamodb') as mock_serialize, patch.object(repo, '_get_expire_at_epoch') as mock_expire:
+            assert await repo.save('test', {'name': 'Test'}) is None
+            assert await repo.save_with_composite_key({'id': 'test', 'sk': 'a'}) is None
+            assert await repo.update('test', {'name': 'Test'}, set_expiration=True) is None
+            await repo.save_batch([{'id': 'test'}])
+            await repo.save_batch_uniform([{'id': 'test'}], {'id': 'X'})
+            await repo.delete_by_composite_key({'id': 'test', 'sk': 'a'})
+            await repo.delete_batch_by_keys([{'id': 'test'}])
+
+        mock_serialize.assert_not_called()
+        mock_expire.assert_not_called()
+        mock_aioboto3_session.resource.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_load_or_throw_success(self, async_repo_context, async_mock_table):
         """Test async load_or_throw with existing item."""
@@ -713,6 +1523,49 @@ class TestAsyncGenericRepository:
         with pytest.raises(ValueError, match='Key not found'):
             await async_repo_context.load_or_throw('nonexistent')
 
+        async_mock_table.get_item.assert_awaited_once_with(Key={'id': 'nonexistent'})
+
+    @pytest.mark.asyncio
+    async def test_load_with_cache(self, mock_aioboto3_session, async_mock_table):
+        """Test async repeated loads are served from the item cache until a write."""
+        async_mock_table.get_item.return_value = {'Item': {'id': 'test'}}
+
+        async with AsyncGenericRepository(table_name='test-table', primary_key_name='id', cache_size=10) as repo:
+            await repo.load('test')
+            await repo.load('test')
+            assert async_mock_table.get_item.await_count == 1
+
+            await repo.delete_by_composite_key({'id': 'test'})
+            await repo.load('test')
+            assert async_mock_table.get_item.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_load_overlapping_save_is_not_cached(self, mock_aioboto3_session, async_mock_table):
+        """Test an async load overlapping a save does not cache the pre-write item."""
+        read_started = asyncio.Event()
+        save_done = asyncio.Event()
+
+        async def slow_get_item(**kwargs):
+            read_started.set()
+            await save_done.wait()
+            return {'Item': {'id': 'test', 'name': 'Old'}}
+
+        async_mock_table.get_item.side_effect = slow_get_item
+
+        async with AsyncGenericRepository(table_name='test-table', primary_key_name='id', cache_size=10) as repo:
+
+            async def save_during_read():
+                await read_started.wait()
+                await repo.save('test', {'name': 'New'}, return_model=False)
+                save_done.set()
+
+            await asyncio.gather(repo.load('test'), save_during_read())
+
+            async_mock_table.get_item.side_effect = None
+            async_mock_table.get_item.return_value = {'Item': {'id': 'test', 'name': 'New'}}
+            assert await repo.load('test') == {'id': 'test', 'name': 'New'}
+            assert async_mock_table.get_item.await_count == 2
+
     @pytest.mark.asyncio
     async def test_count(self, async_repo_context, async_mock_table):
         """Test async counting items."""
@@ -721,6 +1574,30 @@ class TestAsyncGenericRepository:
         async_mock_table.meta.client.describe_table.assert_called_once_with(TableName='test-table')
         assert result == 5
 
+    @pytest.mark.asyncio
+    async def test_count_exact(self, async_repo_context, async_mock_table):
+        """Test async exact counting sums COUNT scan pages."""
+        mock_paginator = async_mock_table.meta.client.get_paginator.return_value
+        mock_paginator.paginate.return_value = create_async_page_iterator([{'Count': 3}, {'Count': 2}])
+
+        result = await async_repo_context.count(exact=True)
+
+        mock_paginator.paginate.assert_called_once_with(TableName='test-table', Select='COUNT')
+        async_mock_table.meta.client.describe_table.assert_not_called()
+        assert result == 5
+
+    @pytest.mark.asyncio
+    async def test_count_by_primary_key(self, async_repo_context, async_mock_table):
+        """Test async counting items for a partition key."""
+        mock_paginator = async_mock_table.meta.client.get_paginator.return_value
+        mock_paginator.paginate.return_value = create_async_page_iterator([{'Count': 1}, {'Count': 1}])
+
+        result = await async_repo_context.count_by_primary_key('user-1')
+
+        async_mock_table.meta.client.get_paginator.assert_called_once_with('query')
+        assert mock_paginator.paginate.call_args.kwargs['Select'] == 'COUNT'
+        assert result == 2
+
     @pytest.mark.asyncio
     async def test_save_with_composite_key(self, async_repo_context, async_mock_table):
         """Test async saving with composite key."""
@@ -769,6 +1646,27 @@ class TestAsyncGenericRepository:
 
         async_mock_table.delete_item.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_delete_all_by_primary_key(self, async_repo_context, async_mock_table):
+        """Test async items are queried by key and deleted with parameterized PartiQL statements."""
+        client = async_mock_table.meta.client
+        client.describe_table = AsyncMock(
+            return_value={'Table': {'KeySchema': [{'AttributeName': 'id', 'KeyType': 'HASH'}, {'AttributeName': 'sk', 'KeyType': 'RANGE'}]}}
+        )
+        client.get_paginator.return_value.paginate.return_value = create_async_page_iterator(
+            [{'Items': [{'id': 'p1', 'sk': f's{i}'} for i in range(30)]}]
+        )
+        client.batch_execute_statement = AsyncMock(side_effect=[{'Responses': [{}] * 25}, {'Responses': [{}] * 5}])
+
+        await async_repo_context.delete_all_by_primary_key('p1')
+
+        calls = client.batch_execute_statement.call_args_list
+        assert [len(call.kwargs['Statements']) for call in calls] == [25, 5]
+        assert calls[1].kwargs['Statements'][-1] == {
+            'Statement': 'DELETE FROM "test-table" WHERE "id" = ? AND "sk" = ?',
+            'Parameters': ['p1', 's29'],
+        }
+
     @pytest.mark.asyncio
     async def test_save_batch(self, async_repo_context, async_mock_table):
         """Test async batch saving."""
@@ -776,15 +1674,47 @@ class TestAsyncGenericRepository:
 
         await async_repo_context.save_batch(models)
 
-        # Verify batch_writer was called
-        async_mock_table.batch_writer.assert_called_once()
+        # Verify a single BatchWriteItem request carried both items
+        write_requests = async_repo_context._client.batch_write_item.call_args.kwargs['RequestItems']['test-table']
+        async_repo_context._client.batch_write_item.assert_awaited_once()
+        assert [request['PutRequest']['Item']['id'] for request in write_requests] == ['item1', 'item2']
+
+    @pytest.mark.asyncio
+    async def test_save_batch_uniform(self, async_repo_context):
+        """Test async uniform batch saving."""
+        models = [{'id': 'item1', 'amount': 1.5, 'tags': ['a']}]
+
+        await async_repo_context.save_batch_uniform(
+            models, {'id': 'S', 'amount': 'N', 'tags': 'L'}, set_expiration=False
+        )
+
+        write_requests = async_repo_context._client.batch_write_item.call_args.kwargs['RequestItems']['test-table']
+        assert write_requests == [{'PutRequest': {'Item': {'id': 'item1', 'amount': Decimal('1.5'), 'tags': ['a']}}}]
+
+    @pytest.mark.asyncio
+    async def test_save_batch_uniform_rejects_mismatches(self, async_repo_context):
+        """Test async uniform batch saving raises on a wrongly typed value."""
+        with pytest.raises(TypeError, match="'tags' must be of type L, got NoneType"):
+            await async_repo_context.save_batch_uniform([{'id': 'item1', 'tags': None}], {'id': 'S', 'tags': 'L'})
+
+        async_repo_context._client.batch_write_item.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_save_batch_large_batch(self, async_repo_context):
+        """Test async batch saving splits into concurrent 25-item chunks."""
+        models = [{'id': f'item{i}'} for i in range(60)]
+
+        await async_repo_context.save_batch(models)
+
+        calls = async_repo_context._client.batch_write_item.call_args_list
+        assert sorted(len(call.kwargs['RequestItems']['test-table']) for call in calls) == [10, 25, 25]
 
     @pytest.mark.asyncio
     async def test_save_batch_empty_list(self, async_repo_context, async_mock_table):
         """Test async batch saving with empty model list."""
         await async_repo_context.save_batch([])
 
-        async_mock_table.batch_writer.assert_not_called()
+        async_repo_context._client.batch_write_item.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_save_batch_debug_mode(self, mock_aioboto3_session, async_mock_table):
@@ -794,7 +1724,7 @@ class TestAsyncGenericRepository:
 
         await repo.save_batch(models)
 
-        async_mock_table.batch_writer.assert_not_called()
+        mock_aioboto3_session.resource.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_delete_batch_by_keys(self, async_repo_context, async_mock_table):
@@ -803,15 +1733,17 @@ class TestAsyncGenericRepository:
 
         await async_repo_context.delete_batch_by_keys(key_dicts)
 
-        # Verify batch_writer was called
-        async_mock_table.batch_writer.assert_called_once()
+        # Verify a single BatchWriteItem request carried all delete requests
+        async_repo_context._client.batch_write_item.assert_awaited_once_with(
+            RequestItems={'test-table': [{'DeleteRequest': {'Key': key_dict}} for key_dict in key_dicts]}
+        )
 
     @pytest.mark.asyncio
     async def test_delete_batch_by_keys_empty_list(self, async_repo_context, async_mock_table):
         """Test async batch deleting with empty key list."""
         await async_repo_context.delete_batch_by_keys([])
 
-        async_mock_table.batch_writer.assert_not_called()
+        async_repo_context._client.batch_write_item.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_delete_batch_by_keys_debug_logging(self, mock_aioboto3_session, caplog):
@@ -849,6 +1781,58 @@ class TestAsyncGenericRepository:
         assert result == []
         async_mock_table.meta.client.get_paginator.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_find_all_iter_yields_before_next_page(self, async_repo_context, async_mock_table):
+        """Test async find_all_iter yields each page's items before the next page is fetched."""
+        fetched = []
+
+        async def pages():
+            for page_number in (1, 2):
+                fetched.append(page_number)
+                yield {'Items': [{'id': 'test', 'sk': f'item{page_number}'}]}
+
+        async_mock_table.meta.client.get_paginator.return_value.paginate.return_value = pages()
+
+        items = async_repo_context.find_all_iter('test')
+
+        assert await items.__anext__() == {'id': 'test', 'sk': 'item1'}
+        assert fetched == [1]
+        assert [item async for item in items] == [{'id': 'test', 'sk': 'item2'}]
+        assert fetched == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_find_all_with_index_parallel_merges_both_directions(self, async_repo_context, async_mock_table):
+        """Test async find_all_with_index(parallel=True) merges both directions, keeping items with equal sort keys."""
+        items = [{'id': f'item{i}', 'status': 'active', 'rank': rank} for i, rank in enumerate([1, 2, 2, 2, 3, 4])]
+        async_mock_table.meta.client.describe_table.return_value = {
+            'Table': {
+                'KeySchema': [{'AttributeName': 'id', 'KeyType': 'HASH'}],
+                'GlobalSecondaryIndexes': [
+                    {
+                        'IndexName': 'status-index',
+                        'KeySchema': [
+                            {'AttributeName': 'status', 'KeyType': 'HASH'},
+                            {'AttributeName': 'rank', 'KeyType': 'RANGE'},
+                        ],
+                    }
+                ],
+            }
+        }
+
+        async def paginate(ScanIndexForward, **params):
+            ordered = items if ScanIndexForward else items[::-1]
+            for start in range(0, len(ordered), 2):
+                page = {'Items': ordered[start : start + 2]}
+                if start + 2 < len(ordered):
+                    page['LastEvaluatedKey'] = dict(ordered[start + 1])
+                yield page
+
+        async_mock_table.meta.client.get_paginator.return_value.paginate = Mock(side_effect=paginate)
+
+        result = await async_repo_context.find_all_with_index('status-index', 'status', 'active', parallel=True)
+
+        assert result == items
+
     @pytest.mark.asyncio
     async def test_load_all(self, async_repo_context, async_mock_table):
         """Test async loading all items from table."""
@@ -864,6 +1848,114 @@ class TestAsyncGenericRepository:
         async_mock_table.meta.client.get_paginator.assert_called_once_with('scan')
         assert result == expected_items
 
+    @pytest.mark.asyncio
+    async def test_load_batch(self, async_repo_context):
+        """Test async batch loading returns items from every response."""
+        async_repo_context._client.batch_get_item = AsyncMock(
+            return_value={'Responses': {'test-table': [{'id': 'item1'}, {'id': 'item2'}]}, 'UnprocessedKeys': {}}
+        )
+
+        result = await async_repo_context.load_batch([{'id': 'item1'}, {'id': 'item2'}])
+
+        assert result == [{'id': 'item1'}, {'id': 'item2'}]
+        async_repo_context._client.batch_get_item.assert_awaited_once_with(
+            RequestItems={'test-table': {'Keys': [{'id': 'item1'}, {'id': 'item2'}]}}
+        )
+
+    @pytest.mark.asyncio
+    async def test_load_batch_by_primary_keys(self, async_repo_context):
+        """Test async batch loading by primary key values reads each distinct key once."""
+        async_repo_context._client.batch_get_item = AsyncMock(
+            return_value={'Responses': {'test-table': [{'id': 'item1'}]}, 'UnprocessedKeys': {}}
+        )
+
+        result = await async_repo_context.load_batch_by_primary_keys(['item1', 'item1'])
+
+        assert result == [{'id': 'item1'}]
+        async_repo_context._client.batch_get_item.assert_awaited_once_with(
+            RequestItems={'test-table': {'Keys': [{'id': 'item1'}]}}
+        )
+
+    @pytest.mark.asyncio
+    async def test_load_all_with_projection(self, async_repo_context, async_mock_table):
+        """Test async scan requests only the projected attributes."""
+        mock_paginator = async_mock_table.meta.client.get_paginator.return_value
+        mock_paginator.paginate.return_value = create_async_page_iterator([{'Items': [{'id': 'item1'}]}])
+
+        result = [item async for item in async_repo_context.load_all(projection=['id'])]
+
+        call_kwargs = mock_paginator.paginate.call_args.kwargs
+        assert call_kwargs['ProjectionExpression'] == '#p0'
+        assert call_kwargs['ExpressionAttributeNames'] == {'#p0': 'id'}
+        assert result == [{'id': 'item1'}]
+
+    @pytest.mark.asyncio
+    async def test_load_all_rate_limited(self, async_repo_context, async_mock_table):
+        """Test async rate-limited scan pauses once consumed capacity exceeds the limit."""
+        pages = [{'Items': [{'id': 'item1'}], 'ConsumedCapacity': {'CapacityUnits': 30.0}}]
+        mock_paginator = async_mock_table.meta.client.get_paginator.return_value
+        mock_paginator.paginate.return_value = create_async_page_iterator(pages)
+
+        with patch('src.async_repo.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+            result = [item async for item in async_repo_context.load_all(rate_limit_rcu=10, page_size=25)]
+
+        assert result == [{'id': 'item1'}]
+        assert mock_paginator.paginate.call_args.kwargs['PaginationConfig'] == {'PageSize': 25}
+        mock_sleep.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_load_all_parallel(self, async_repo_context, async_mock_table):
+        """Test async parallel scan reads every segment and yields all items."""
+        segment_items = {0: [{'id': 'item1'}], 1: [{'id': 'item2'}, {'id': 'item3'}]}
+
+        mock_paginator = async_mock_table.meta.client.get_paginator.return_value
+        mock_paginator.paginate = Mock(
+            side_effect=lambda Segment, **kwargs: create_async_page_iterator([{'Items': segment_items[Segment]}])
+        )
+
+        result = []
+        async for item in async_repo_context.load_all_parallel(total_segments=2):
+            result.append(item)
+
+        assert sorted(item['id'] for item in result) == ['item1', 'item2', 'item3']
+        assert mock_paginator.paginate.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_load_all_total_segments(self, async_repo_context, async_mock_table):
+        """Test async load_all with total_segments scans every segment and applies the overall limit."""
+        segment_items = {0: [{'id': 'item1'}, {'id': 'item2'}], 1: [{'id': 'item3'}]}
+
+        mock_paginator = async_mock_table.meta.client.get_paginator.return_value
+        mock_paginator.paginate = Mock(
+            side_effect=lambda Segment, **kwargs: create_async_page_iterator([{'Items': segment_items[Segment]}])
+        )
+
+        result = [item async for item in async_repo_context.load_all(total_segments=2)]
+        limited = [item async for item in async_repo_context.load_all(total_segments=2, limit=1)]
+
+        assert sorted(item['id'] for item in result) == ['item1', 'item2', 'item3']
+        assert mock_paginator.paginate.call_args.kwargs['TotalSegments'] == 2
+        assert len(limited) == 1
+
+    @pytest.mark.asyncio
+    async def test_load_all_total_segments_stopped_early(self, async_repo_context, async_mock_table):
+        """Test breaking out of an async parallel load_all with a full page queue leaves no tasks behind."""
+        mock_paginator = async_mock_table.meta.client.get_paginator.return_value
+        mock_paginator.paginate = Mock(
+            side_effect=lambda Segment, **kwargs: create_async_page_iterator(
+                [{'Items': [{'id': f'item{Segment}-{page}'}]} for page in range(20)]
+            )
+        )
+
+        items = async_repo_context.load_all(total_segments=4)
+        async for _ in items:
+            # Let every segment fill the page queue before stopping
+            await asyncio.sleep(0.01)
+            break
+        await items.aclose()
+
+        assert [task for task in asyncio.all_tasks() if task is not asyncio.current_task()] == []
+
     @pytest.mark.asyncio
     async def test_find_one_with_index(self, async_repo_context, async_mock_table):
         """Test async finding one item with index."""
@@ -875,6 +1967,8 @@ class TestAsyncGenericRepository:
         result = await async_repo_context.find_one_with_index('email-index', 'email', 'test@example.com')
 
         async_mock_table.meta.client.get_paginator.assert_called_once_with('query')
+        paginate_kwargs = async_mock_table.meta.client.get_paginator.return_value.paginate.call_args.kwargs
+        assert paginate_kwargs['PaginationConfig'] == {'MaxItems': 1, 'PageSize': 1}
         assert result == expected_item
 
     @pytest.mark.asyncio
@@ -963,9 +2057,140 @@ class TestAsyncGenericRepository:
 
             async with repo:
                 # Verify custom session was used
-                mock_session.resource.assert_called_once_with('dynamodb', region_name='us-west-2')
+                mock_session.resource.assert_called_once_with('dynamodb', region_name='us-west-2', config=repo.boto_config)
+                assert repo.boto_config.connector_args == {'keepalive_timeout': 30}
                 assert repo.table_name == 'test-table'
 
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(not hasattr(asyncio, 'eager_task_factory'), reason='requires Python 3.12+')
+    async def test_eager_tasks(self, mock_aioboto3_session):
+        """Test eager_tasks installs the eager task factory only while the repository is open."""
+        loop = asyncio.get_running_loop()
+        repo = AsyncGenericRepository(table_name='test-table', primary_key_name='id', eager_tasks=True)
+
+        async with repo:
+            assert loop.get_task_factory() is asyncio.eager_task_factory
+
+        assert loop.get_task_factory() is None
+
+    @pytest.mark.asyncio
+    async def test_fast_serde_uses_plain_client(self, mock_aioboto3_session, async_mock_table):
+        """Test async fast_serde sends loads and queries through a plain client opened with the repository."""
+        client = Mock()
+        client.get_item = AsyncMock(return_value={'Item': {'id': {'S': 'test'}, 'count': {'N': '2'}}})
+        client.get_paginator.return_value.paginate.return_value = create_async_page_iterator(
+            [{'Items': [{'id': {'S': 'test'}}]}]
+        )
+        client_context = AsyncMock()
+        client_context.__aenter__.return_value = client
+        mock_aioboto3_session.client.return_value = client_context
+
+        async with AsyncGenericRepository(table_name='test-table', primary_key_name='id', fast_serde=True) as repo:
+            assert await repo.load('test') == {'id': 'test', 'count': Decimal('2')}
+            assert await repo.find_all('test') == [{'id': 'test'}]
+
+        client.get_item.assert_called_once_with(TableName='test-table', Key={'id': {'S': 'test'}})
+        assert client.get_paginator.return_value.paginate.call_args.kwargs['ExpressionAttributeValues'] == {
+            ':k0': {'S': 'test'}
+        }
+        async_mock_table.get_item.assert_not_called()
+        client_context.__aexit__.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_nested_context_reuses_open_resource(self, mock_aioboto3_session, async_mock_table):
+        """Test re-entering an open repository reuses its resource until the outermost exit."""
+        repo = AsyncGenericRepository(table_name='test-table', primary_key_name='id')
+        mock_resource = mock_aioboto3_session.resource.return_value
+
+        async with repo:
+            async with repo as inner:
+                assert inner is repo
+                assert repo.table is async_mock_table
+            mock_resource.__aexit__.assert_not_called()
+
+        mock_aioboto3_session.resource.assert_called_once()
+        mock_resource.__aenter__.assert_called_once()
+        mock_resource.__aexit__.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_connect_keeps_repository_open_across_contexts(self, mock_aioboto3_session, async_mock_table):
+        """Test a repository opened with connect() stays open until close()."""
+        repo = AsyncGenericRepository(table_name='test-table', primary_key_name='id')
+        mock_resource = mock_aioboto3_session.resource.return_value
+
+        assert await repo.connect() is repo
+        await repo.connect()
+        async with repo:
+            assert repo.table is async_mock_table
+        async with repo:
+            pass
+        mock_resource.__aexit__.assert_not_called()
+
+        await repo.close()
+        await repo.close()
+
+        mock_aioboto3_session.resource.assert_called_once()
+        mock_resource.__aexit__.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_connects_open_one_resource(self, mock_aioboto3_session, async_mock_table):
+        """Test contexts entered and connect() calls made concurrently share one resource."""
+        mock_resource = mock_aioboto3_session.resource.return_value
+        mock_dynamodb = mock_resource.__aenter__.return_value
+
+        async def slow_aenter():
+            await asyncio.sleep(0)
+            return mock_dynamodb
+
+        mock_resource.__aenter__.side_effect = slow_aenter
+        repo = AsyncGenericRepository(table_name='test-table', primary_key_name='id')
+
+        async def use_repo():
+            async with repo:
+                await asyncio.sleep(0)
+
+        await asyncio.gather(use_repo(), use_repo())
+        mock_aioboto3_session.resource.assert_called_once()
+        mock_resource.__aexit__.assert_called_once()
+
+        await asyncio.gather(repo.connect(), repo.connect())
+        await repo.close()
+        assert mock_aioboto3_session.resource.call_count == 2
+        assert mock_resource.__aexit__.call_count == 2
+
+    def test_get_async_repository_returns_shared_instance(self, mock_aioboto3_session):
+        """Test get_async_repository returns one unconnected repository per table, however it is called."""
+        with patch.dict('src.async_repo._shared_repositories', clear=True):
+            repo = get_async_repository('test-table', 'id')
+
+            assert get_async_repository('test-table', 'id') is repo
+            assert get_async_repository('test-table', 'id', region_name=None) is repo
+            assert get_async_repository(table_name='test-table', primary_key_name='id') is repo
+            assert get_async_repository('other-table', 'id') is not repo
+            assert get_async_repository('test-table', 'id', region_name='eu-west-1') is not repo
+
+    @pytest.mark.asyncio
+    async def test_unconnected_repository_raises(self, mock_aioboto3_session, async_mock_table):
+        """Test operations on a repository that is not connected (or was closed) say so."""
+        repo = AsyncGenericRepository(table_name='test-table', primary_key_name='id')
+
+        with pytest.raises(RuntimeError, match=r'call connect\(\) first'):
+            await repo.load('test')
+
+        async with repo:
+            pass
+        with pytest.raises(RuntimeError, match=r'call connect\(\) first'):
+            await repo.save_batch([{'id': 'test'}])
+
+    def test_repositories_share_default_session(self, mock_aioboto3_session):
+        """Test repositories created without a session share one aioboto3 session."""
+        first = AsyncGenericRepository(table_name='test-table', primary_key_name='id')
+        second = AsyncGenericRepository(table_name='other-table', primary_key_name='id')
+        custom = AsyncGenericRepository(table_name='test-table', primary_key_name='id', session=Mock())
+
+        assert first._session is second._session is mock_aioboto3_session
+        assert custom._session is not first._session
+
     @pytest.mark.asyncio
     async def test_save_return_model_false(self, async_repo_context, async_mock_table):
         """Test async saving with return_model=False."""
@@ -994,14 +2219,7 @@ class TestAsyncGenericRepository:
         """Test async save_batch method with ClientError."""
         models = [{'id': 'item1', 'name': 'Item 1'}]
 
-        # Mock the batch writer to raise an exception
-        mock_batch_writer = AsyncMock()
-        mock_batch_context_manager = AsyncMock()
-        mock_batch_context_manager.__aenter__ = AsyncMock(return_value=mock_batch_writer)
-        mock_batch_context_manager.__aexit__ = AsyncMock(return_value=None)
-        async_mock_table.batch_writer.return_value = mock_batch_context_manager
-
-        mock_batch_writer.put_item.side_effect = ClientError(
+        async_repo_context._client.batch_write_item.side_effect = ClientError(
             error_response={'Error': {'Code': 'ValidationException', 'Message': 'Test error'}},
             operation_name='BatchWriteItem',
         )
@@ -1014,14 +2232,7 @@ class TestAsyncGenericRepository:
         """Test async delete_batch_by_keys with ClientError."""
         key_dicts = [{'id': 'item1'}]
 
-        # Mock the batch writer to raise an exception
-        mock_batch_writer = AsyncMock()
-        mock_batch_context_manager = AsyncMock()
-        mock_batch_context_manager.__aenter__ = AsyncMock(return_value=mock_batch_writer)
-        mock_batch_context_manager.__aexit__ = AsyncMock(return_value=None)
-        async_mock_table.batch_writer.return_value = mock_batch_context_manager
-
-        mock_batch_writer.delete_item.side_effect = ClientError(
+        async_repo_context._client.batch_write_item.side_effect = ClientError(
             error_response={'Error': {'Code': 'ValidationException', 'Message': 'Test error'}},
             operation_name='BatchWriteItem',
         )
@@ -1147,7 +2358,7 @@ class TestSyncRepositoryAdditionalCoverage:
 
         # Verify debug log was written
         assert 'Debug mode: skipping batch save to test-table (2 items)' in caplog.text
-        mock_table.batch_writer.assert_not_called()
+        mock_table.meta.client.batch_write_item.assert_not_called()
 
     def test_delete_batch_by_keys_debug_logging(self, mock_dynamodb_resource, mock_table, caplog):
         """Test delete_batch_by_keys debug mode logging."""
@@ -1159,7 +2370,7 @@ class TestSyncRepositoryAdditionalCoverage:
 
         # Verify debug log was written
         assert 'Debug mode: skipping batch delete from test-table (2 items)' in caplog.text
-        mock_table.batch_writer.assert_not_called()
+        mock_table.meta.client.batch_write_item.assert_not_called()
 
 
 class TestAsyncRepositoryAdditionalCoverage:
@@ -1273,6 +2484,26 @@ class TestImportCoverage:
             repo = AsyncGenericRepository(table_name='test', primary_key_name='id')
             assert repo is not None
 
+    def test_package_import_is_lazy(self):
+        """Test that importing the package does not import boto3 until a class is used."""
+        import subprocess
+        import sys
+
+        code = (
+            'import sys, generic_repo\n'
+            "assert 'boto3' not in sys.modules\n"
+            'generic_repo.GenericRepository\n'
+            "assert 'boto3' in sys.modules and 'aioboto3' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, '-c', code], check=True)
+
+    def test_package_unknown_attribute(self):
+        """Test that unknown package attributes still raise AttributeError."""
+        import generic_repo
+
+        with pytest.raises(AttributeError):
+            generic_repo.NotARepository  # noqa: B018
+
 
 class TestEdgeCasesAndBoundaryConditions:
     """Test edge cases and boundary conditions for better coverage."""
@@ -1281,17 +2512,12 @@ class TestEdgeCasesAndBoundaryConditions:
         """Test save_batch with expiration explicitly disabled."""
         models = [{'id': 'item1', 'name': 'Item 1'}]
 
-        mock_batch_writer = Mock()
-        mock_context_manager = Mock()
-        mock_context_manager.__enter__ = Mock(return_value=mock_batch_writer)
-        mock_context_manager.__exit__ = Mock(return_value=None)
-        mock_table.batch_writer.return_value = mock_context_manager
-
         sync_repo.save_batch(models, set_expiration=False)
 
-        # Verify batch_writer was used
-        mock_table.batch_writer.assert_called_once()
-        mock_batch_writer.put_item.assert_called_once()
+        # Verify batch_write_item was used without an expiration attribute
+        mock_table.meta.client.batch_write_item.assert_called_once()
+        write_requests = mock_table.meta.client.batch_write_item.call_args.kwargs['RequestItems']['test-table']
+        assert '_expireAt' not in write_requests[0]['PutRequest']['Item']
 
     @pytest.mark.asyncio
     async def test_async_save_batch_with_expiration_disabled(self, async_repo_context, async_mock_table):
@@ -1300,8 +2526,9 @@ class TestEdgeCasesAndBoundaryConditions:
 
         await async_repo_context.save_batch(models, set_expiration=False)
 
-        # Verify batch_writer was called
-        async_mock_table.batch_writer.assert_called_once()
+        # Verify batch_write_item was called without an expiration attribute
+        write_requests = async_repo_context._client.batch_write_item.call_args.kwargs['RequestItems']['test-table']
+        assert '_expireAt' not in write_requests[0]['PutRequest']['Item']
 
     def test_sync_save_with_expiration_disabled(self, sync_repo, mock_table):
         """Test save with expiration explicitly disabled."""
@@ -1412,15 +2639,15 @@ class TestCompleteLineCoverage:
 
     @pytest.mark.asyncio
     async def test_async_save_return_model_true_with_load(self, async_repo_context, async_mock_table):
-        """Test async save method with return_model=True to cover line 225."""
+        """Test async save method with return_model=True and reload=True to cover the reload path."""
         model_data = {'name': 'Test Item', 'value': 42}
 
         # Mock the load method to return a specific item
         expected_saved_item = {'id': 'test', **model_data}
         async_mock_table.get_item.return_value = {'Item': expected_saved_item}
 
-        # Call save with return_model=True (default)
-        result = await async_repo_context.save('test', model_data, return_model=True)
+        # Call save with return_model=True (default) and an explicit reload
+        result = await async_repo_context.save('test', model_data, return_model=True, reload=True)
 
         # Verify put_item was called
         async_mock_table.put_item.assert_called_once()
@@ -1430,25 +2657,19 @@ class TestCompleteLineCoverage:
         assert result == expected_saved_item
 
     def test_sync_save_batch_with_items_and_expiration(self, mock_dynamodb_resource, mock_table):
-        """Test sync save_batch to specifically cover line 315 (batch_writer.put_item)."""
+        """Test sync save_batch adds expiration to the put requests."""
         # Create repo with expiration enabled
         repo_with_expiration = GenericRepository(table_name='test-table', primary_key_name='id', region_name='us-east-1', data_expiration_days=30)
 
         models = [{'id': 'item1', 'name': 'Item 1'}]
 
-        # Set up batch writer mock
-        mock_batch_writer = Mock()
-        mock_context_manager = Mock()
-        mock_context_manager.__enter__ = Mock(return_value=mock_batch_writer)
-        mock_context_manager.__exit__ = Mock(return_value=None)
-        mock_table.batch_writer.return_value = mock_context_manager
-
         # Call save_batch with expiration enabled
         repo_with_expiration.save_batch(models, set_expiration=True)
 
-        # Verify batch_writer.put_item was called (this exercises line 315)
-        mock_batch_writer.put_item.assert_called_once()
-        call_args = mock_batch_writer.put_item.call_args[1]['Item']
+        # Verify the put request carried the item
+        mock_table.meta.client.batch_write_item.assert_called_once()
+        write_requests = mock_table.meta.client.batch_write_item.call_args.kwargs['RequestItems']['test-table']
+        call_args = write_requests[0]['PutRequest']['Item']
         assert call_args['id'] == 'item1'
         assert call_args['name'] == 'Item 1'
         assert '_expireAt' in call_args  # Expiration should be added
@@ -1463,27 +2684,15 @@ class TestCompleteLineCoverage:
 
         models = [{'id': 'item1', 'name': 'Item 1'}]
 
-        # Set up async mock table
-        async_mock_table = Mock()
-        mock_batch_writer = AsyncMock()
-        mock_batch_context_manager = AsyncMock()
-        mock_batch_context_manager.__aenter__ = AsyncMock(return_value=mock_batch_writer)
-        mock_batch_context_manager.__aexit__ = AsyncMock(return_value=None)
-        async_mock_table.batch_writer.return_value = mock_batch_context_manager
-
-        # Mock the table setup
-        async_mock_table.table_name = 'test-table'
-
-        # Start the repo context and set the table
+        # Start the repo context
         async with repo_with_expiration as repo:
-            repo.table = async_mock_table
-
-            # Call save_batch with expiration enabled (this exercises line 339)
+            # Call save_batch with expiration enabled
             await repo.save_batch(models, set_expiration=True)
 
-            # Verify batch_writer was used
-            async_mock_table.batch_writer.assert_called_once()
-            mock_batch_writer.put_item.assert_called_once()
+            # Verify the put request carried the expiration attribute
+            repo._client.batch_write_item.assert_awaited_once()
+            write_requests = repo._client.batch_write_item.call_args.kwargs['RequestItems']['test-table']
+            assert '_expireAt' in write_requests[0]['PutRequest']['Item']
 
     @pytest.mark.asyncio
     async def test_async_save_with_expiration_enabled_line_222(self, mock_aioboto3_session):